@@ -1,3 +1,9 @@
 from DataStructures.Graph.algorithms import depth_first_search, breadth_first_search, reconstruct_path, \
-    topological_sort, is_cyclic, a_star, shortest_path, shortest_path_length, weighted_shortest_paths
+    topological_sort, is_cyclic, a_star, shortest_path, shortest_path_length, weighted_shortest_paths, \
+    multi_source_breadth_first_search, multi_source_eccentricity, bidirectional_breadth_first_search, \
+    bidirectional_dijkstra
 from DataStructures.Graph.graph import Graph
+from DataStructures.Graph.digraph import DiGraph
+from DataStructures.Graph.frozengraph import FrozenGraph
+from DataStructures.Graph.graphviews import GraphView, subgraph_view
+from DataStructures.Graph.implicitgraph import ImplicitGraph
@@ -1,10 +1,10 @@
+from array import array
 from collections import namedtuple
+from itertools import repeat
 from math import inf
 
 from DataStructures import PriorityQueue
-
-
-# todo: make sure these all work with graph and digraph objects
+from DataStructures.Graph.interning import NodeMap, PathMap, _trace
 
 
 def reconstruct_path(destination, parent_dict):
@@ -23,13 +23,285 @@ def reconstruct_path(destination, parent_dict):
     return path
 
 
+def _is_csr(graph):
+    # FrozenGraph can't be imported here without a cycle, so look for its buffers instead
+    return hasattr(graph, "_indptr")
+
+
+def _is_interned(graph):
+    # whether the graph numbers its nodes with `node_index`.  implicit graphs don't know all of their nodes, so they
+    # can't, and neither can views of them, though views inherit the method.
+    if not hasattr(graph, "node_index"):
+        return False
+    parent = getattr(graph, "_graph", None)
+    return parent is None or _is_interned(parent)
+
+
+def _parents(n):
+    # parent buffer of n integer ids, where -1 means no parent
+    return array("q", [-1]) * n
+
+
+def _bfs_result(nodes, level, parent):
+    # wrap the level and parent buffers of a search in mappings keyed by node
+    return namedtuple("BFS", ["level", "parent"])(NodeMap(nodes, level), NodeMap(nodes, parent, ids=True))
+
+
+def _csr_neighbors(indptr, indices):
+    # function giving the neighbor ids of an id, from CSR buffers
+    return lambda u: indices[indptr[u]:indptr[u + 1]]
+
+
+def _csr_weighted_neighbors(indptr, indices, weights):
+    # function giving (neighbor id, weight) pairs for an id, from CSR buffers
+    def neighbors(u):
+        start, end = indptr[u], indptr[u + 1]
+        return zip(indices[start:end], repeat(1) if weights is None else weights[start:end])
+    return neighbors
+
+
+def _id_neighbors(graph, nodes):
+    # function giving the neighbor ids of an id of `nodes`
+    if _is_csr(graph):
+        return _csr_neighbors(graph._indptr, graph._indices)
+    labels, index, adj = nodes.labels, nodes.index, graph.adj
+    return lambda u: [index[neighbor] for neighbor in adj(labels[u])]
+
+
+def _id_weighted_neighbors(graph, nodes):
+    # function giving (neighbor id, weight) pairs for an id of `nodes`
+    if _is_csr(graph):
+        return _csr_weighted_neighbors(graph._indptr, graph._indices, graph._weights)
+    labels, index, adj_weights = nodes.labels, nodes.index, graph.adj_weights
+    return lambda u: [(index[neighbor], weight) for neighbor, weight in adj_weights(labels[u])]
+
+
+def _remaining(source, targets):
+    # the ids of `targets` that a search from `source` still has to settle, or None to search everything
+    if targets is None:
+        return None
+    remaining = set(targets)
+    remaining.discard(source)
+    return remaining
+
+
+def _bfs_tree(neighbors, n, source, targets=None):
+    # level and parent buffers of a breadth first search over the ids 0..n-1, which stops as soon as every id of
+    # `targets` has been reached.  levels of ids it didn't get to are inf.
+    level = [inf] * n
+    parent = _parents(n)
+    level[source] = 0
+    remaining = _remaining(source, targets)
+    if remaining is not None and not remaining:
+        return level, parent
+
+    i = 1
+    frontier = [source]
+    while frontier:
+        nextfrontier = []
+        for u in frontier:
+            for v in neighbors(u):
+                if level[v] == inf:
+                    level[v] = i
+                    parent[v] = u
+                    nextfrontier.append(v)
+                    if remaining is not None and v in remaining:
+                        remaining.remove(v)
+                        if not remaining:
+                            return level, parent
+        frontier = nextfrontier
+        i += 1
+    return level, parent
+
+
+def _dijkstra_tree(neighbors, n, source, targets=None):
+    # distance and parent buffers of Dijkstra's algorithm over the ids 0..n-1, which stops as soon as every id of
+    # `targets` is settled, i.e. taken off the queue.  distances of other ids may not be final.
+    dist = [inf] * n
+    parent = _parents(n)
+    dist[source] = 0
+    remaining = _remaining(source, targets)
+
+    # nodes are only queued once they are reached, which keeps the queue small
+    pq = PriorityQueue()
+    pq.insert(source, 0)
+    while pq and (remaining is None or remaining):
+        u = pq.extract()
+        if remaining is not None:
+            remaining.discard(u)
+        for v, weight in neighbors(u):
+            length = dist[u] + weight
+            # update
+            if length < dist[v]:
+                if v in pq:
+                    pq.update_priority(v, length)
+                elif dist[v] == inf:
+                    pq.insert(v, length)
+                dist[v] = length
+                parent[v] = u
+    return dist, parent
+
+
+def _csr_levels(indptr, indices, source):
+    # level of every integer id in a breadth first search from `source`, without building any dicts
+    level = [inf] * (len(indptr) - 1)
+    level[source] = 0
+    i = 1
+    frontier = [source]
+    while frontier:
+        nextfrontier = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if level[v] == inf:
+                    level[v] = i
+                    nextfrontier.append(v)
+        frontier = nextfrontier
+        i += 1
+    return level
+
+
+# thresholds from Beamer, Asanovic and Patterson, "Direction-Optimizing Breadth-First Search".  go bottom up once the
+# frontier has more than 1/ALPHA of the edges left to check, and back to top down once it has fewer than 1/BETA of
+# the nodes.
+ALPHA = 14
+BETA = 24
+
+
+def _in_neighbors(graph):
+    # function giving the nodes with edges into a node, or None if the graph can't say without scanning every edge
+    if not graph.directed:
+        return graph.adj
+    return getattr(graph, "predecessors", None)
+
+
+def _direction_optimizing_search(graph, node, destination, predecessors):
+    # over the integer ids of `node_index`, with the frontier kept as a bitmap as well as a list
+    nodes = graph.node_index()
+    labels, index = nodes
+    n = len(labels)
+    level = [inf] * n
+    parent = _parents(n)
+    source = index[node]
+    target = index.get(destination, -1) if destination is not None else -1
+    level[source] = 0
+    unvisited = [v for v in range(n) if v != source]
+    unexplored = sum(len(graph.adj(label)) for label in labels)
+    bottom_up = False
+    i = 1
+    frontier = [source]
+    while frontier and (target < 0 or level[target] == inf):
+        explored = sum(len(graph.adj(labels[u])) for u in frontier)
+        unexplored -= explored
+        if not bottom_up and explored > unexplored / ALPHA:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / BETA:
+            bottom_up = False
+
+        nextfrontier = []
+        if bottom_up:
+            # every unvisited node looks for any parent in the frontier, and stops at the first one
+            infrontier = bytearray(n)
+            for u in frontier:
+                infrontier[u] = 1
+            for v in unvisited:
+                for candidate in predecessors(labels[v]):
+                    u = index[candidate]
+                    if infrontier[u]:
+                        level[v] = i
+                        parent[v] = u
+                        nextfrontier.append(v)
+                        break
+        else:
+            for u in frontier:
+                for neighbor in graph.adj(labels[u]):
+                    v = index[neighbor]
+                    if level[v] == inf:
+                        level[v] = i
+                        parent[v] = u
+                        nextfrontier.append(v)
+        unvisited = [v for v in unvisited if level[v] == inf]
+        frontier = nextfrontier
+        i += 1
+
+    return _bfs_result(nodes, level, parent)
+
+
+def _csr_direction_optimizing_search(graph, node, destination):
+    # as _direction_optimizing_search, over the integer ids of an undirected FrozenGraph, with the frontier kept as a
+    # bitmap as well as a list
+    indptr, indices, labels = graph._indptr, graph._indices, graph._labels
+    n = len(labels)
+    level = [inf] * n
+    parent = _parents(n)
+    source = graph.index(node)
+    target = graph._index.get(destination, -1) if destination is not None else -1
+    level[source] = 0
+    unvisited = [v for v in range(n) if v != source]
+    unexplored = indptr[n]
+    bottom_up = False
+    i = 1
+    frontier = [source]
+    while frontier and (target < 0 or level[target] == inf):
+        explored = sum(indptr[u + 1] - indptr[u] for u in frontier)
+        unexplored -= explored
+        if not bottom_up and explored > unexplored / ALPHA:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / BETA:
+            bottom_up = False
+
+        nextfrontier = []
+        if bottom_up:
+            infrontier = bytearray(n)
+            for u in frontier:
+                infrontier[u] = 1
+            for v in unvisited:
+                for u in indices[indptr[v]:indptr[v + 1]]:
+                    if infrontier[u]:
+                        level[v] = i
+                        parent[v] = u
+                        nextfrontier.append(v)
+                        break
+        else:
+            for u in frontier:
+                for v in indices[indptr[u]:indptr[u + 1]]:
+                    if level[v] == inf:
+                        level[v] = i
+                        parent[v] = u
+                        nextfrontier.append(v)
+        unvisited = [v for v in unvisited if level[v] == inf]
+        frontier = nextfrontier
+        i += 1
+
+    nodes = graph.node_index()
+    return _bfs_result(nodes, level, parent)
+
+
 # runtime O(V + E) and E \in O(V^2) so O(V^2)
-def breadth_first_search(graph, node, destination=None):
+def breadth_first_search(graph, node, destination=None, direction_optimizing=False):
     # todo: merge this into shortest_path and shortest_path_length
     # todo: rewrite this so it doesn't use namedtuple
+    # with direction_optimizing, large frontiers are expanded bottom up: every unvisited node scans its in-neighbors
+    # for one in the frontier, instead of the frontier scanning all of its edges.  levels are the same either way, but
+    # parents may differ.  directed graphs without predecessors are always searched top down.
+    if direction_optimizing:
+        if _is_csr(graph) and not graph.directed:
+            return _csr_direction_optimizing_search(graph, node, destination)
+        predecessors = _in_neighbors(graph)
+        if predecessors is not None and not _is_csr(graph):
+            return _direction_optimizing_search(graph, node, destination, predecessors)
+
+    if _is_interned(graph):
+        nodes = graph.node_index()
+        index = nodes.index
+        targets = [index[destination]] if destination is not None and destination in index else None
+        level, parent = _bfs_tree(_id_neighbors(graph, nodes), len(nodes.labels), index[node], targets)
+        return _bfs_result(nodes, level, parent)
+
+    # implicit graphs only have the nodes seen so far, so levels and parents are dicts that grow as nodes are found
     level = dict.fromkeys(graph.vertices, inf)
     level[node] = 0
     parent = dict.fromkeys(graph.vertices, None)
+    parent[node] = None
     visited = {node, }
     i = 1
     frontier = [node]
@@ -50,6 +322,136 @@ def breadth_first_search(graph, node, destination=None):
     return namedtuple("BFS", ["level", "parent"])(level, parent)
 
 
+def _integer_adjacency(graph):
+    # (nodes, rows) where nodes is the graph's NodeIndex and rows[i] holds the integer ids of the neighbors of node i
+    nodes = graph.node_index()
+    if _is_csr(graph):
+        indptr, indices = graph._indptr, graph._indices
+        return nodes, [indices[indptr[i]:indptr[i + 1]] for i in range(len(nodes.labels))]
+    labels, index = nodes
+    return nodes, [[index[neighbor] for neighbor in graph.adj(label)] for label in labels]
+
+
+def _bit_parallel_search(rows, sources, visit):
+    # advance one breadth first search per entry of `sources` at once.  seen[v] has bit i set once search i has
+    # reached v, and every round pushes each frontier node's bits to all of its neighbors with a single OR, so a
+    # round costs O(V + E) word operations no matter how many searches it advances.
+    # visit(level, new) is called for every level with {node: bits of the searches that reached node at level}.
+    seen = [0] * len(rows)
+    frontier = {}
+    for i, source in enumerate(sources):
+        seen[source] |= 1 << i
+        frontier[source] = frontier.get(source, 0) | 1 << i
+    visit(0, frontier)
+
+    level = 1
+    while frontier:
+        reached = {}
+        for u, bits in frontier.items():
+            for v in rows[u]:
+                reached[v] = reached.get(v, 0) | bits
+
+        frontier = {}
+        for v, bits in reached.items():
+            new = bits & ~seen[v]
+            if new:
+                seen[v] |= new
+                frontier[v] = new
+        if frontier:
+            visit(level, frontier)
+        level += 1
+    return seen
+
+
+def multi_source_breadth_first_search(graph, sources, width=1024):
+    """
+    Breadth first search from every node of `sources`, running `width` searches at a time as the bits of one integer
+    per node.
+    Runtime O((V + E) * |sources| / width) word operations, plus the size of the output
+
+    Parameters
+    ----------
+    graph : Graph
+    sources : iterable
+        The nodes to search from.
+    width : int, optional
+        Number of searches advanced together.  Python integers have no fixed size, so this isn't limited to the
+        machine word, and wider batches amortize the interpreter overhead of every round further.  Defaults to 1024.
+
+    Returns
+    -------
+    dict
+        {source: {node: level}} for every source, where unreachable nodes have level inf.  The levels of every source
+        are a read only NodeMap.
+    """
+    nodes, rows = _integer_adjacency(graph)
+    labels, index = nodes
+    levels = {}
+    sources = list(sources)
+    for start in range(0, len(sources), width):
+        batch = sources[start:start + width]
+        found = [[inf] * len(labels) for _ in batch]
+
+        def visit(level, new):
+            for v, bits in new.items():
+                while bits:
+                    low = bits & -bits
+                    found[low.bit_length() - 1][v] = level
+                    bits ^= low
+
+        _bit_parallel_search(rows, [index[source] for source in batch], visit)
+        for source, level in zip(batch, found):
+            levels[source] = NodeMap(nodes, level)
+    return levels
+
+
+def multi_source_eccentricity(graph, sources=None, width=1024):
+    """
+    Eccentricity of every node of `sources`, computed by bit-parallel breadth first searches.  Only the last level
+    each search reaches is tracked, so no per-source levels are stored.
+    Runtime O((V + E) * |sources| / width) word operations
+
+    Parameters
+    ----------
+    graph : Graph
+    sources : iterable, optional
+        Defaults to None, meaning every node.
+    width : int, optional
+        As in `multi_source_breadth_first_search`.
+
+    Returns
+    -------
+    dict
+        {source: eccentricity}, which is inf if the source doesn't reach every node.
+    """
+    nodes, rows = _integer_adjacency(graph)
+    labels, index = nodes
+    ecc = {}
+    sources = list(labels if sources is None else sources)
+    for start in range(0, len(sources), width):
+        batch = sources[start:start + width]
+        last = [0] * len(batch)
+
+        def visit(level, new):
+            active = 0
+            for bits in new.values():
+                active |= bits
+            while active:
+                low = active & -active
+                last[low.bit_length() - 1] = level
+                active ^= low
+
+        seen = _bit_parallel_search(rows, [index[source] for source in batch], visit)
+
+        # searches that missed some node have infinite eccentricity
+        everywhere = (1 << len(batch)) - 1
+        for bits in seen:
+            everywhere &= bits
+        for i, source in enumerate(batch):
+            ecc[source] = last[i] if everywhere >> i & 1 else inf
+    return ecc
+
+
 # runtime: O(V + E) and E \in O(V^2) so O(V^2)
 def depth_first_search(graph):
     return _dfs(graph).parent
@@ -115,27 +517,21 @@ def a_star(graph, source, destination, heuristic=None):
     # default heuristic is h=0, which makes A* behave like Dijkstra's
     if heuristic is None:
         heuristic = _return_zero
+    if _is_interned(graph):
+        return _interned_a_star(graph, source, destination, heuristic)
 
-    closed = []
+    closed = set()
     pq = PriorityQueue()
 
     # for reconstructing paths
-    parent = {}
+    parent = {source: None}
 
     # cost of going from source to node
     dist = {source: 0}
 
-    # total cost of getting from source to destination by passing through node
-    estimate = {}
-
-    # todo: rewrite to make more efficient---dict.fromkeys?
-    for node in graph.vertices:
-        if node == source:
-            dist[node] = 0
-            estimate[node] = heuristic(node, destination)
-        else:
-            dist[node] = inf
-            estimate[node] = inf
+    # total cost of getting from source to destination by passing through node.
+    # nodes are only added once they are reached, so implicit graphs are expanded no further than the search goes.
+    estimate = {source: heuristic(source, destination)}
 
     pq.insert(source, estimate[source])
 
@@ -146,84 +542,387 @@ def a_star(graph, source, destination, heuristic=None):
         if node == destination:
             return reconstruct_path(destination, parent)
 
-        closed.append(node)
+        closed.add(node)
 
-        for neighbor in graph.adj(node):
+        # neighbors come with their edge weights, so there's no separate weight lookup per edge
+        for neighbor, weight in graph.adj_weights(node):
             if neighbor in closed:
                 continue
-            if neighbor not in pq:
-                pq.insert(neighbor, estimate[neighbor])
 
             # check the distance from source to neighbor
-            # todo: make sure that weight is what I actually want here
-            length = dist[node] + graph.weight(node, neighbor)
+            length = dist[node] + weight
 
             # update!
-            if length < dist[neighbor]:
+            if length < dist.get(neighbor, inf):
                 parent[neighbor] = node
                 dist[neighbor] = length
                 estimate[neighbor] = length + heuristic(neighbor, destination)
-                pq.update_priority(neighbor, estimate[neighbor])
+                if neighbor in pq:
+                    pq.update_priority(neighbor, estimate[neighbor])
+                else:
+                    pq.insert(neighbor, estimate[neighbor])
 
     # didn't find a path
     return None
 
 
-def shortest_path(graph, sources=None, destinations=None):
-    # todo: write this.
-    # sources and destinations should be iterables of nodes
-    # if neither source nor destination are specified, compute shortest path from every node to every other node
-    #     return a dict with keys of sources and values of dicts with keys of destinations with values of lists
-    #     containing the nodes in the path
-    # if only source is specified, compute shortest path from source to every other node
-    #     return a dict with keys of destinations and values of lists containing the nodes in the path
-    # if only destination is specified, compute the shortest path from every node to destination
-    #     return a dict with keys of sources and values of lists containing the nodes in the path
-
-    # if we're finding every shortest path between every node, we can be smart about what computation we actually do
-    # i.e. if we do shortest path from a node in the periphery of graph, we should get a fair amount of shortest
-    # paths.  this might take a lot of extra work to implement
-    # easy/inefficient way would be to write the function to just loop over every combination of source and
-    # destination, but if i.e. we have a shortest path (a, b, c, d), we know that all of (a, b), (a, b, c), (b, c),
-    # (b, c, d), (c, d) are ALSO shortest paths, so it's useless to compute paths from i.e. b to c and b to d
-    # so we really just need to compute all shortest paths between elements of the periphery? (must be at least 2 in
-    # an undirected graph)
-
-    # for now, just code everything without helper functions, then refactor once this actually works
-
-    paths = {}
-
-    if sources is None:
-        # iterate over all possible sources
-        sources = graph.vertices
+def _interned_a_star(graph, source, destination, heuristic):
+    # as a_star, with the closed set, distances and parents in buffers indexed by integer id
+    nodes = graph.node_index()
+    labels, index = nodes
+    neighbors = _id_weighted_neighbors(graph, nodes)
+    n = len(labels)
+    closed = bytearray(n)
+    parent = _parents(n)
+    dist = [inf] * n
+    start = index[source]
+    target = index.get(destination, -1)
+    dist[start] = 0
+
+    pq = PriorityQueue()
+    pq.insert(start, heuristic(source, destination))
+    while pq:
+        u = pq.extract()
+        if u == target:
+            return _trace(parent, target, labels)
+        closed[u] = 1
+
+        for v, weight in neighbors(u):
+            if closed[v]:
+                continue
+            length = dist[u] + weight
+            if length < dist[v]:
+                parent[v] = u
+                dist[v] = length
+                estimate = length + heuristic(labels[v], destination)
+                if v in pq:
+                    pq.update_priority(v, estimate)
+                else:
+                    pq.insert(v, estimate)
+
+    return None
+
+
+def _id_in_neighbors(graph, nodes, weighted=False):
+    # as _id_neighbors (or _id_weighted_neighbors if `weighted`) for the edges into an id, or None if the graph can't
+    # give them without scanning every edge
+    if not graph.directed:
+        return _id_weighted_neighbors(graph, nodes) if weighted else _id_neighbors(graph, nodes)
+    if not hasattr(graph, "predecessors"):
+        return None
+    labels, index = nodes
+    if weighted:
+        pred_weights = graph.pred_weights
+        return lambda u: [(index[predecessor], weight) for predecessor, weight in pred_weights(labels[u])]
+    predecessors = graph.predecessors
+    return lambda u: [index[predecessor] for predecessor in predecessors(labels[u])]
+
+
+def _join(links, meet):
+    # ids on the path through `meet`, from the root of the parent buffer links[0] to the root of links[1]
+    path = [meet]
+    while links[0][path[-1]] >= 0:
+        path.append(links[0][path[-1]])
+    path.reverse()
+    while links[1][path[-1]] >= 0:
+        path.append(links[1][path[-1]])
+    return path
+
+
+def _bidirectional_bfs(forward, backward, n, source, target):
+    # (length, ids on the path) of breadth first searches from both ends, each step expanding a whole level of the
+    # smaller frontier.  the first node reached from both sides is on a shortest path: the searches hadn't met before
+    # this level, so every path is longer than their depths together, and the new node adds one to the depth of this
+    # side.
+    if source == target:
+        return 0, [source]
+    links = (_parents(n), _parents(n))
+    seen = (bytearray(n), bytearray(n))
+    seen[0][source] = seen[1][target] = 1
+    frontiers = [[source], [target]]
+    neighbors = (forward, backward)
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other, link = seen[side], seen[1 - side], links[side]
+        nextfrontier = []
+        for u in frontiers[side]:
+            for v in neighbors[side](u):
+                if not mine[v]:
+                    mine[v] = 1
+                    link[v] = u
+                    if other[v]:
+                        path = _join(links, v)
+                        return len(path) - 1, path
+                    nextfrontier.append(v)
+        frontiers[side] = nextfrontier
+    return inf, None
+
+
+def _bidirectional_dijkstra(forward, backward, n, source, target):
+    # (length, ids on the path) of Dijkstra's algorithm from both ends, each step settling one node on the side with
+    # the smaller queue.  `best` is the shortest path seen so far through a node reached from both sides.  once the
+    # closest unsettled nodes of the two sides are together at least `best` apart, no path through an unsettled node
+    # can be shorter, so `best` is a shortest path.  the searches have to go on after they first meet, since the first
+    # node settled by both sides needn't be on a shortest path.
+    dist = ([inf] * n, [inf] * n)
+    links = (_parents(n), _parents(n))
+    queues = (PriorityQueue(), PriorityQueue())
+    neighbors = (forward, backward)
+    dist[0][source] = dist[1][target] = 0
+    queues[0].insert(source, 0)
+    queues[1].insert(target, 0)
+    best, meet = (0, source) if source == target else (inf, -1)
+    while queues[0] and queues[1]:
+        if dist[0][queues[0].peek()] + dist[1][queues[1].peek()] >= best:
+            break
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        mine, other, link, pq = dist[side], dist[1 - side], links[side], queues[side]
+        u = pq.extract()
+        for v, weight in neighbors[side](u):
+            length = mine[u] + weight
+            if length < mine[v]:
+                if v in pq:
+                    pq.update_priority(v, length)
+                elif mine[v] == inf:
+                    pq.insert(v, length)
+                mine[v] = length
+                link[v] = u
+                if length + other[v] < best:
+                    best, meet = length + other[v], v
+
+    if meet < 0:
+        return inf, None
+    return best, _join(links, meet)
+
+
+def _point_to_point(graph, source, destination, weighted):
+    # (length, path) of a shortest path between two nodes of a graph with a node index, searching from both ends if
+    # the graph can give the edges into a node, and from the source alone otherwise.  path is None if there isn't one.
+    nodes = graph.node_index()
+    labels, index = nodes
+    start, target = _node_id(index, source), _node_id(index, destination)
+    if weighted:
+        forward, backward = _id_weighted_neighbors(graph, nodes), _id_in_neighbors(graph, nodes, weighted=True)
+        bidirectional, tree = _bidirectional_dijkstra, _dijkstra_tree
+    else:
+        forward, backward = _id_neighbors(graph, nodes), _id_in_neighbors(graph, nodes)
+        bidirectional, tree = _bidirectional_bfs, _bfs_tree
+
+    if backward is None:
+        dist, parent = tree(forward, len(labels), start, [target])
+        return dist[target], _trace(parent, target, labels) if dist[target] < inf else None
+    length, path = bidirectional(forward, backward, len(labels), start, target)
+    return length, None if path is None else [labels[v] for v in path]
+
+
+def bidirectional_breadth_first_search(graph, source, destination):
+    """
+    Shortest path between two nodes of an unweighted graph, by breadth first searches from both of them that stop
+    where they meet.  Each search only goes about half of the distance, so it explores far fewer nodes than a search
+    from the source alone.  Edge weights are ignored.  Directed graphs without predecessors, like an ImplicitGraph or
+    a directed FrozenGraph, are searched from the source alone.
+    Runtime O(V + E)
+
+    Returns
+    -------
+    list
+        The nodes on the path, or None if there's no path.
+
+    Raises
+    ------
+    KeyError
+        If `source` or `destination` is not present.
+    """
+    if not _is_interned(graph):
+        bfs = breadth_first_search(graph, source, destination)
+        return reconstruct_path(destination, bfs.parent) if bfs.level.get(destination, inf) < inf else None
+    return _point_to_point(graph, source, destination, weighted=False)[1]
+
+
+def bidirectional_dijkstra(graph, source, destination):
+    """
+    Shortest path between two nodes of a weighted graph, by Dijkstra's algorithm from both of them.  The searches
+    stop once the closest unsettled nodes of the two sides are together at least as far apart as the best path
+    found so far.  Directed graphs without predecessors, like an ImplicitGraph or a directed FrozenGraph, are
+    searched from the source alone.
+    Runtime O(E + V log V)
+
+    Returns
+    -------
+    list
+        The nodes on the path, or None if there's no path.
+
+    Raises
+    ------
+    KeyError
+        If `source` or `destination` is not present.
+    """
+    if not _is_interned(graph):
+        return a_star(graph, source, destination)
+    return _point_to_point(graph, source, destination, weighted=True)[1]
+
+
+def _single_pair(graph, source, destination):
+    # (length, path) for one source and destination.  graphs without a node index fall back to the same one-sided
+    # searches as the bidirectional functions.
+    if _is_interned(graph):
+        return _point_to_point(graph, source, destination, graph.weighted)
+    if graph.weighted:
+        path = a_star(graph, source, destination)
+        return (inf, None) if path is None else (sum(graph.weight(u, v) for u, v in zip(path, path[1:])), path)
+    path = bidirectional_breadth_first_search(graph, source, destination)
+    return (inf, None) if path is None else (len(path) - 1, path)
+
+
+def _as_nodes(graph, nodes):
+    # (single, nodes), where single is whether `nodes` is one node rather than an iterable of nodes, and nodes is
+    # iterable or None.  strings and other things that aren't iterables of nodes are taken as one (missing) node.
+    if nodes is None:
+        return False, None
+    try:
+        # graphs without a node index are only searched one pair at a time, so anything hashable is one node
+        if nodes in graph or not _is_interned(graph):
+            return True, [nodes]
+    except TypeError:
+        # unhashable, so not a node
+        return False, nodes
+    if isinstance(nodes, str) or not hasattr(nodes, "__iter__"):
+        return True, [nodes]
+    return False, nodes
+
+
+def _node_id(index, node):
+    if node not in index:
+        raise KeyError("Node {0} not present in graph".format(repr(node)))
+    return index[node]
+
+
+def _csr_buffers(graph, nodes):
+    # (indptr, indices, weights) over the ids of `nodes`.  a FrozenGraph already has them.  other graphs build them
+    # once per version, so a stream of queries against the same graph doesn't look up neighbor ids again.
+    if _is_csr(graph):
+        return graph._indptr, graph._indices, graph._weights
+
+    def build():
+        labels, index = nodes
+        indptr, indices = array("q", [0]), array("q")
+        # weights are kept as given, not converted to floats
+        weights = [] if graph.weighted else None
+        for label in labels:
+            for neighbor, weight in graph.adj_weights(label):
+                indices.append(index[neighbor])
+                if weights is not None:
+                    weights.append(weight)
+            indptr.append(len(indices))
+        return indptr, indices, weights
+    return graph._cached("csr", build)
+
+
+def _batched_search(graph, sources, destinations):
+    # one search per distinct source, each stopping once every destination is settled.  returns (nodes, destinations,
+    # trees), where destinations maps every distinct destination to its id (nodes.index if it was None), and trees
+    # maps every distinct source to the (distance, parent) buffers of its search.
+    if not _is_interned(graph):
+        raise TypeError("{0} has no node index to search in batches".format(type(graph).__name__))
+
+    nodes = graph.node_index()
+    labels, index = nodes
+    sources = {node: _node_id(index, node) for node in (labels if sources is None else sources)}
     if destinations is None:
-        # iterate over all possible destinations
-        destinations = graph.vertices
+        destinations, targets = index, None
+    else:
+        destinations = {node: _node_id(index, node) for node in destinations}
+        targets = destinations.values()
 
+    indptr, indices, weights = _csr_buffers(graph, nodes)
     if graph.weighted:
-        # dijkstra's
-        pass
+        search, neighbors = _dijkstra_tree, _csr_weighted_neighbors(indptr, indices, weights)
     else:
-        # BFS
-        pass
+        search, neighbors = _bfs_tree, _csr_neighbors(indptr, indices)
+    trees = {source: search(neighbors, len(labels), i, targets) for source, i in sources.items()}
+    return nodes, destinations, trees
 
 
-def shortest_path_length(graph, source=None, destination=None):
-    # todo: write this
-    # same as shortest_path
-    if source is None:
-        # iterate over all possible sources
-        pass
-    if destination is None:
-        # iterate over all possible destinations
-        pass
+def _select(results, sources, destinations, one_source, one_destination):
+    # the part of {source: {destination: result}} for a single source or destination
+    if one_source and one_destination:
+        return results[sources][destinations]
+    if one_source:
+        return results[sources]
+    if one_destination:
+        return {source: result[destinations] for source, result in results.items()}
+    return results
 
-    if graph.weighted:
-        # dijkstra's
-        pass
+
+def shortest_path(graph, sources=None, destinations=None):
+    """
+    Shortest paths from `sources` to `destinations`, by breadth first search if the graph is unweighted, and by
+    Dijkstra's algorithm if it's weighted.  One search runs per distinct source, and stops as soon as every
+    destination is settled.  The paths from a source all come from its search tree: each path is traced back through
+    the tree when it's looked up, rather than stored.  A single source and destination are searched from both ends,
+    as in `bidirectional_breadth_first_search` and `bidirectional_dijkstra`.
+    Runtime O(V + E) unweighted and O(E + V log V) weighted, per distinct source
+
+    Parameters
+    ----------
+    graph : Graph
+    sources : node or iterable, optional
+        A single node, or an iterable of nodes.  Defaults to None, meaning every node.
+    destinations : node or iterable, optional
+        A single node, or an iterable of nodes.  Defaults to None, meaning every node.
+
+    Returns
+    -------
+    list, Mapping or dict
+        With a single source and destination, the nodes on the path between them.  With a single source, a read only
+        mapping of {destination: path}.  With a single destination, a dict of {source: path}.  Otherwise a dict of
+        {source: {destination: path}}.  Paths to unreachable destinations are None.
+
+    Raises
+    ------
+    KeyError
+        If a source or destination is not present.
+    TypeError
+        If the graph has no `node_index`, i.e. is an ImplicitGraph, and there's more than one source or destination.
+        A single source and destination are searched from the source alone.
+    """
+    one_source, source_nodes = _as_nodes(graph, sources)
+    one_destination, destination_nodes = _as_nodes(graph, destinations)
+    if one_source and one_destination:
+        return _single_pair(graph, source_nodes[0], destination_nodes[0])[1]
+    nodes, keys, trees = _batched_search(graph, source_nodes, destination_nodes)
+    paths = {source: PathMap(nodes.labels, keys, parent, nodes.index[source]) for source, (_, parent) in trees.items()}
+    return _select(paths, sources, destinations, one_source, one_destination)
+
+
+def shortest_path_length(graph, sources=None, destinations=None):
+    """
+    Lengths of the shortest paths from `sources` to `destinations`, searched for as in `shortest_path`.
+    Runtime O(V + E) unweighted and O(E + V log V) weighted, per distinct source
+
+    Parameters
+    ----------
+    graph : Graph
+    sources, destinations : node or iterable, optional
+        As in `shortest_path`.
+
+    Returns
+    -------
+    number, Mapping or dict
+        Shaped as in `shortest_path`, with the length of every path instead of its nodes.  The lengths of paths to
+        unreachable destinations are inf.
+    """
+    one_source, source_nodes = _as_nodes(graph, sources)
+    one_destination, destination_nodes = _as_nodes(graph, destinations)
+    if one_source and one_destination:
+        return _single_pair(graph, source_nodes[0], destination_nodes[0])[0]
+    nodes, keys, trees = _batched_search(graph, source_nodes, destination_nodes)
+    if keys is nodes.index:
+        # every search ran to the end, so every distance is final
+        lengths = {source: NodeMap(nodes, dist) for source, (dist, _) in trees.items()}
     else:
-        # BFS
-        pass
+        lengths = {source: {node: dist[i] for node, i in keys.items()} for source, (dist, _) in trees.items()}
+    return _select(lengths, sources, destinations, one_source, one_destination)
 
 
 # shortest path on a weighted graph. Dijkstra's Alg
@@ -232,30 +931,32 @@ def shortest_path_length(graph, source=None, destination=None):
 # Dijkstra's algorithm
 def weighted_shortest_paths(graph, source):
     # todo: merge this into shortest_path and shortest_path_length
-    pq = PriorityQueue()
+    if _is_interned(graph):
+        nodes = graph.node_index()
+        dist, parent = _dijkstra_tree(_id_weighted_neighbors(graph, nodes), len(nodes.labels), nodes.index[source])
+        return namedtuple("Shortest_Path", ["length", "parent"])(NodeMap(nodes, dist), NodeMap(nodes, parent, ids=True))
 
-    dist = {}
-    parent = {}
-
-    for v in graph.vertices:
-        if v == source:
-            dist[v] = 0
-        else:
-            dist[v] = inf
-
-        parent[v] = None
+    # implicit graphs only have the nodes seen so far, so distances and parents are dicts that grow as nodes are found
+    pq = PriorityQueue()
 
-        pq.insert(v, dist[v])
+    dist = dict.fromkeys(graph.vertices, inf)
+    parent = dict.fromkeys(graph.vertices, None)
+    dist[source] = 0
 
+    # nodes are only queued once they are reached, which keeps the queue small
+    pq.insert(source, 0)
     while pq:
         node = pq.extract()
 
-        for neighbor in graph.adj(node):
-            length = dist[node] + graph.weight(node, neighbor)
-            # update
-            if length < dist[neighbor]:
+        for neighbor, weight in graph.adj_weights(node):
+            length = dist[node] + weight
+            # update.  neighbors missing from dist belong to an implicit graph, and haven't been reached yet
+            if length < dist.get(neighbor, inf):
+                if neighbor in pq:
+                    pq.update_priority(neighbor, length)
+                elif dist.get(neighbor, inf) == inf:
+                    pq.insert(neighbor, length)
                 dist[neighbor] = length
                 parent[neighbor] = node
-                pq.update_priority(neighbor, length)
 
     return namedtuple("Shortest_Path", ["length", "parent"])(dist, parent)
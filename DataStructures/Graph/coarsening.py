@@ -0,0 +1,107 @@
+from collections import namedtuple
+from random import Random
+
+from DataStructures.Graph.digraph import DiGraph
+from DataStructures.Graph.graph import Graph
+
+# one level of a coarsening hierarchy: the coarse graph, the supernode of every node of the previous level, and the
+# number of original nodes merged into every supernode
+Level = namedtuple("Level", ["graph", "mapping", "sizes"])
+
+
+def heavy_edge_matching(graph, rng=None):
+    """
+    Match every node with at most one neighbor, preferring heavy edges, as in Karypis and Kumar's multilevel
+    partitioning.  Nodes are visited in random order, and each unmatched node is matched with the unmatched neighbor
+    it shares the heaviest edge with.
+    Runtime O(V + E)
+
+    Returns
+    -------
+    dict
+        The supernode of every node: the first node of its pair to be visited, or itself if it wasn't matched.
+    """
+    if rng is None:
+        rng = Random()
+    order = graph.vertices
+    rng.shuffle(order)
+
+    mapping = {}
+    for node in order:
+        if node in mapping:
+            continue
+        mapping[node] = node
+        best, heaviest = None, None
+        for neighbor, weight in graph.adj_weights(node):
+            if neighbor not in mapping and (heaviest is None or weight > heaviest):
+                best, heaviest = neighbor, weight
+        if best is not None:
+            mapping[best] = node
+    return mapping
+
+
+def contract(graph, mapping, sizes=None):
+    """
+    Build the graph with every group of nodes in `mapping` merged into its supernode.  Edges between merged groups
+    become one edge, weighted with the sum of their weights, and edges within a group disappear.
+    Runtime O(V + E)
+
+    Returns
+    -------
+    Level
+    """
+    # sum the weights of the edges out of every supernode.  an undirected edge is visited from both of its ends, so
+    # both directions of the coarse edge are summed.
+    rows = {}
+    for node in graph:
+        supernode = mapping[node]
+        row = rows.get(supernode)
+        if row is None:
+            row = rows[supernode] = {}
+        for neighbor, weight in graph.adj_weights(node):
+            superneighbor = mapping[neighbor]
+            if superneighbor != supernode:
+                row[superneighbor] = row.get(superneighbor, 0) + weight
+
+    if graph.directed:
+        coarse = DiGraph()
+        coarse.add_nodes(rows)
+        coarse.add_weighted_edges((node1, node2, weight) for node1, row in rows.items() for node2, weight in row.items())
+    else:
+        # the rows are already symmetric, so they are the adjacency of the coarse graph
+        coarse = Graph()
+        coarse._adj = rows
+        coarse._weighted = True
+
+    merged = {}
+    for node in graph:
+        supernode = mapping[node]
+        merged[supernode] = merged.get(supernode, 0) + (1 if sizes is None else sizes[node])
+    return Level(coarse, mapping, merged)
+
+
+def coarsen(graph, levels=None, min_order=1, seed=None):
+    """
+    Repeatedly contract a heavy edge matching of `graph`.  See `Graph.coarsen`.
+    """
+    rng = Random(seed)
+    hierarchy = []
+    sizes = None
+    while (levels is None or len(hierarchy) < levels) and graph.order > min_order:
+        level = contract(graph, heavy_edge_matching(graph, rng), sizes)
+        # nothing could be matched, so no later level would be any smaller
+        if level.graph.order == graph.order:
+            break
+        hierarchy.append(level)
+        graph, sizes = level.graph, level.sizes
+    return hierarchy
+
+
+def project(values, hierarchy):
+    """
+    Carry values of the nodes of the coarsest graph of `hierarchy` back to the nodes of the original graph: every node
+    takes the value of its supernode.  See `Graph.project`.
+    """
+    for level in reversed(hierarchy):
+        values = {node: values[supernode] for node, supernode in level.mapping.items()}
+    return values
@@ -0,0 +1,95 @@
+class DegreeIndex(object):
+    """
+    Nodes bucketed by degree, for O(1) maximum degree queries and iteration in degree order.
+
+    Every bucket is a dict used as an insertion ordered set.  The index doesn't look at the graph itself: the graph
+    calls `update` with the new degree of every node an edit touches.  Degrees change by small steps, so the maximum
+    degree is kept up to date with an amortized O(1) scan.
+    """
+
+    def __init__(self, degrees=None):
+        """
+        Parameters
+        ----------
+        degrees : iterable, optional
+            (node, degree) pairs to start with.
+        """
+        self._buckets = {}
+        self._degree = {}
+        self._max = 0
+
+        if degrees is not None:
+            for node, degree in degrees:
+                self.update(node, degree)
+
+    def __len__(self):
+        return len(self._degree)
+
+    def __contains__(self, item):
+        return item in self._degree
+
+    def degree(self, node):
+        return self._degree[node]
+
+    # amortized runtime O(1)
+    def update(self, node, degree):
+        # move `node` to the bucket for `degree`, adding it if needed
+        old = self._degree.get(node)
+        if old == degree:
+            return
+        if old is not None:
+            self._discard(node, old)
+        self._degree[node] = degree
+        self._buckets.setdefault(degree, {})[node] = None
+        if degree > self._max:
+            self._max = degree
+        self._shrink()
+
+    # amortized runtime O(1)
+    def remove(self, node):
+        self._discard(node, self._degree.pop(node))
+        self._shrink()
+
+    def _discard(self, node, degree):
+        bucket = self._buckets[degree]
+        del bucket[node]
+        if not bucket:
+            del self._buckets[degree]
+
+    def _shrink(self):
+        # lower the maximum past empty buckets
+        while self._max > 0 and self._max not in self._buckets:
+            self._max -= 1
+
+    @property
+    def max_degree(self):
+        return self._max if self._degree else None
+
+    def max_degree_node(self):
+        # a node of maximum degree, the earliest one to reach that degree, or None if there are no nodes
+        if not self._degree:
+            return None
+        return next(iter(self._buckets[self._max]))
+
+    def histogram(self):
+        """
+        Runtime O(max degree)
+
+        Returns
+        -------
+        list
+            The number of nodes of every degree, from 0 to the maximum degree.
+        """
+        if not self._degree:
+            return []
+        return [len(self._buckets.get(degree, ())) for degree in range(self._max + 1)]
+
+    def nodes(self, reverse=False):
+        """
+        Iterate over the nodes in order of degree, lowest first unless `reverse`.
+        Runtime O(V + max degree)
+        """
+        degrees = range(self._max, -1, -1) if reverse else range(self._max + 1)
+        for degree in degrees:
+            # the bucket may change while the caller iterates
+            yield from list(self._buckets.get(degree, ()))
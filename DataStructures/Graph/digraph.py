@@ -1,3 +1,248 @@
-class digraph(object):
-    """Directed Graph, weighted or unweighted."""
-    pass
+from DataStructures.Graph.degreeindex import DegreeIndex
+from DataStructures.Graph.graph import Graph
+
+
+class DiGraph(Graph):
+    """
+    Directed graph, weighted or unweighted.
+
+    Every node maps to a dict of its successors and a dict of its predecessors, both of {neighbor: edge weight}, so
+    in and out degrees are O(1) and the edges into a node are found without scanning the rest of the graph.  `adj`
+    and `adj_weights` follow edges forwards, so every function in `algorithms` runs on a DiGraph unchanged, and
+    runs backwards on `reverse()`.
+    """
+
+    def __init__(self, graph_data=None):
+        # graph_data maps every node to a list of its successors, or to a dict of {successor: weight}
+        self._pred = {}
+        super().__init__(graph_data)
+
+    def __repr__(self):
+        return "DiGraph({0})".format(super().__repr__())
+
+    @property
+    def directed(self):
+        return True
+
+    def reverse(self):
+        """
+        View of the graph with every edge reversed, which shares the adjacency dicts of this graph instead of
+        copying them, so it always reflects the current edges.  The view is read only.
+        Runtime O(1)
+
+        Returns
+        -------
+        DiGraph
+        """
+        return ReverseView(self)
+
+    # runtime O(1)
+    def in_degree(self, node):
+        return len(self._pred[node])
+
+    # runtime O(1)
+    def out_degree(self, node):
+        return len(self._adj[node])
+
+    def degree(self, node):
+        return len(self._adj[node]) + len(self._pred[node])
+
+    def successors(self, node):
+        return self._adj[node].keys()
+
+    def predecessors(self, node):
+        return self._pred[node].keys()
+
+    def pred_weights(self, node):
+        # (predecessor, weight) pairs, in the same order as predecessors(node)
+        return self._pred[node].items()
+
+    def add_node(self, node):
+        # if the node is already present, don't do anything
+        if node not in self:
+            self._adj[node] = {}
+            self._pred[node] = {}
+            self._version += 1
+            if self._uf is not None:
+                self._uf.add(node)
+            if self._degrees is not None:
+                self._degrees.update(node, 0)
+
+    # runtime O(1)
+    def add_edge(self, node1, node2, weight=None):
+        # add the edge node1 -> node2, making sure both nodes are present
+        for node in node1, node2:
+            if node not in self:
+                self.add_node(node)
+
+        # if the edge is already present, only update its weight (if given)
+        if weight is not None:
+            self._weighted = True
+        elif node2 in self._adj[node1]:
+            return
+        else:
+            weight = 1
+
+        self._adj[node1][node2] = weight
+        self._pred[node2][node1] = weight
+        if self._uf is not None:
+            self._uf.union(node1, node2)
+        if self._degrees is not None:
+            self._reindex(node1, node2)
+        self._version += 1
+
+    def add_edges(self, edges):
+        # same as calling add_edge for every edge, without the per-edge method calls
+        if self._uf is not None:
+            edges = self._union_edges(edges)
+        adj, pred = self._adj, self._pred
+        for node1, node2 in edges:
+            successors = adj.get(node1)
+            if successors is None:
+                successors = adj[node1] = {}
+                pred[node1] = {}
+            if node2 in successors:
+                continue
+            successors[node2] = 1
+            predecessors = pred.get(node2)
+            if predecessors is None:
+                predecessors = pred[node2] = {}
+                adj[node2] = {}
+            predecessors[node1] = 1
+        # cheaper to rebuild the degree index the next time it's needed than to update it edge by edge
+        self._degrees = None
+        self._version += 1
+
+    def add_weighted_edges(self, edges):
+        # bulk version of add_edge(node1, node2, weight) for every (node1, node2, weight) in edges
+        if self._uf is not None:
+            edges = self._union_edges(edges)
+        adj, pred = self._adj, self._pred
+        for node1, node2, weight in edges:
+            successors = adj.get(node1)
+            if successors is None:
+                successors = adj[node1] = {}
+                pred[node1] = {}
+            successors[node2] = weight
+            predecessors = pred.get(node2)
+            if predecessors is None:
+                predecessors = pred[node2] = {}
+                adj[node2] = {}
+            predecessors[node1] = weight
+        self._weighted = True
+        # cheaper to rebuild the degree index the next time it's needed than to update it edge by edge
+        self._degrees = None
+        self._version += 1
+
+    # runtime O(in_degree(node) + out_degree(node))
+    def remove_node(self, node):
+        if node not in self:
+            raise KeyError("Node {0} not present in graph".format(repr(node)))
+
+        for successor in self._adj[node]:
+            del self._pred[successor][node]
+        for predecessor in self._pred[node]:
+            # a self loop was already removed above
+            del self._adj[predecessor][node]
+        successors, predecessors = self._adj.pop(node), self._pred.pop(node)
+        if self._degrees is not None:
+            self._degrees.remove(node)
+            self._reindex(*(neighbor for neighbor in {**successors, **predecessors} if neighbor != node))
+        self._version += 1
+        # union-find can't split components, so rebuild it the next time it's needed
+        self._uf = None
+
+    # runtime O(1)
+    def remove_edge(self, node1, node2):
+        if node1 not in self or node2 not in self._adj[node1]:
+            raise KeyError("Edge {0} not present in graph".format(repr((node1, node2))))
+
+        del self._adj[node1][node2]
+        del self._pred[node2][node1]
+        if self._degrees is not None:
+            self._reindex(node1, node2)
+        self._version += 1
+        # union-find can't split components, so rebuild it the next time it's needed
+        self._uf = None
+
+    # runtime O(in_degree(node2) + out_degree(node2))
+    def contract_edge(self, node1, node2):
+        # merge node2 into node1, as in Graph.contract_edge, keeping the direction of every edge
+        if node1 not in self or node2 not in self._adj[node1]:
+            raise KeyError("Edge {0} not present in graph".format(repr((node1, node2))))
+        if node1 == node2:
+            self.remove_edge(node1, node2)
+            return
+
+        adj, pred = self._adj, self._pred
+        del adj[node1][node2]
+        del pred[node2][node1]
+        for successor, weight in adj.pop(node2).items():
+            del pred[successor][node2]
+            if successor == node1 or successor == node2:
+                continue
+            if successor in adj[node1]:
+                weight += adj[node1][successor]
+                self._weighted = True
+            adj[node1][successor] = weight
+            pred[successor][node1] = weight
+        for predecessor, weight in pred.pop(node2).items():
+            # a self loop went with the successors above
+            del adj[predecessor][node2]
+            if predecessor in pred[node1]:
+                weight += pred[node1][predecessor]
+                self._weighted = True
+            pred[node1][predecessor] = weight
+            adj[predecessor][node1] = weight
+        # the degree index is rebuilt the next time it's needed
+        self._degrees = None
+        self._version += 1
+        self._uf = None
+
+
+class ReverseView(DiGraph):
+    """
+    Read only view of a DiGraph with every edge reversed.  Successors of the view are predecessors of the graph and
+    vice versa, using the same dicts.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+        self._adj = graph._pred
+        self._pred = graph._adj
+        self._processes = graph.processes
+        self._tracking = False
+        self._uf = None
+        self._degrees = None
+        self._cache = {}
+        self._cache_version = None
+
+    def __repr__(self):
+        return "ReverseView({0})".format(Graph.__repr__(self))
+
+    @property
+    def weighted(self):
+        return self._graph.weighted
+
+    def reverse(self):
+        return self._graph
+
+    @property
+    def version(self):
+        return self._graph.version
+
+    def node_index(self):
+        # same nodes as the graph, so the same ids
+        return self._graph.node_index()
+
+    def _degree_index(self):
+        # the view can't see the edits that keep the graph's index up to date, so it's rebuilt when the graph changes
+        return self._cached("degree_index", lambda: DegreeIndex((node, self.degree(node)) for node in self))
+
+    # mutation is not supported
+
+    def _read_only(self, *_):
+        raise TypeError("Reversed graph views are read only")
+
+    add_node = add_nodes = add_edge = add_edges = add_weighted_edges = _read_only
+    remove_node = remove_nodes = remove_edge = remove_edges = contract_edge = _read_only
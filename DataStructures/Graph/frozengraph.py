@@ -0,0 +1,194 @@
+from array import array
+from bisect import bisect_left
+
+from DataStructures.Graph.digraph import DiGraph
+from DataStructures.Graph.graph import Graph
+from DataStructures.Graph.interning import NodeIndex
+
+
+class FrozenGraph(Graph):
+    """
+    Immutable graph in compressed sparse row (CSR) form.
+
+    Node labels are interned to dense integers 0..n-1.  The neighbors of node i are
+    ``indices[indptr[i]:indptr[i + 1]]``, sorted, with optional edge weights in the same positions of `weights`.
+    The buffers can be any sequences of numbers, i.e. `array`, `memoryview` or NumPy arrays, and are never copied.
+
+    The read API is the same as Graph, so every function in `algorithms` accepts a FrozenGraph.  Breadth first search
+    and Dijkstra's algorithm detect the CSR buffers and run on the integer ids directly.
+    """
+
+    def __init__(self, labels, indptr, indices, weights=None, directed=False):
+        """
+        Parameters
+        ----------
+        labels : list
+            The node label of every integer id.
+        indptr : sequence of int
+            Row offsets into `indices`, of length ``len(labels) + 1``.
+        indices : sequence of int
+            Neighbor ids, sorted within every row.
+        weights : sequence of float, optional
+            The weight of every entry in `indices`.  Defaults to None, meaning every edge has weight 1.
+        directed : bool, optional
+            If True, row i holds the successors of node i.  Otherwise every edge must appear in both of its rows.
+            Defaults to False.
+        """
+        if len(indptr) != len(labels) + 1:
+            raise ValueError("indptr must have one more entry than labels")
+        if weights is not None and len(weights) != len(indices):
+            raise ValueError("weights must have one entry per entry of indices")
+
+        self._labels = labels
+        self._index = {label: i for i, label in enumerate(labels)}
+        self._node_index = NodeIndex(labels, self._index)
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+        self._directed = directed
+        # never changes, so anything cached stays valid
+        self._version = 0
+        self._cache = {}
+        self._cache_version = 0
+        self._degrees = None
+        self._processes = None
+        self._tracking = False
+        self._uf = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Build the CSR form of `graph`.
+        Runtime O(V + E log(max degree)), for sorting every neighbor list.
+        """
+        labels = list(graph.vertices)
+        index = {label: i for i, label in enumerate(labels)}
+        weighted = graph.weighted
+
+        indptr = array("q", [0])
+        indices = array("q")
+        weights = array("d") if weighted else None
+        for label in labels:
+            row = sorted((index[neighbor], weight) for neighbor, weight in graph.adj_weights(label))
+            indices.extend(i for i, _ in row)
+            if weighted:
+                weights.extend(weight for _, weight in row)
+            indptr.append(len(indices))
+
+        return cls(labels, indptr, indices, weights, directed=graph.directed)
+
+    def __contains__(self, item):
+        return item in self._index
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __repr__(self):
+        return "FrozenGraph(order={0}, size={1})".format(self.order, len(self._indices))
+
+    @property
+    def directed(self):
+        return self._directed
+
+    @property
+    def weighted(self):
+        return self._weights is not None
+
+    @property
+    def vertices(self):
+        return list(self._labels)
+
+    @property
+    def edges(self):
+        labels, indptr, indices = self._labels, self._indptr, self._indices
+        return [(labels[i], labels[indices[j]]) for i in range(len(labels)) for j in range(indptr[i], indptr[i + 1])]
+
+    @property
+    def order(self):
+        return len(self._labels)
+
+    # integer id API
+
+    def node_index(self):
+        # the ids are the rows of the CSR buffers
+        return self._node_index
+
+    def index(self, node):
+        # integer id of the node labelled `node`
+        return self._index[node]
+
+    def label(self, i):
+        # label of the node with integer id `i`
+        return self._labels[i]
+
+    def adj_index(self, i):
+        # integer ids of the neighbors of the node with integer id `i`
+        return self._indices[self._indptr[i]:self._indptr[i + 1]]
+
+    # label API
+
+    def degree(self, node):
+        i = self._index[node]
+        return self._indptr[i + 1] - self._indptr[i]
+
+    def adj(self, node):
+        labels = self._labels
+        return [labels[j] for j in self.adj_index(self._index[node])]
+
+    def adj_weights(self, node):
+        i = self._index[node]
+        start, end = self._indptr[i], self._indptr[i + 1]
+        labels = self._labels
+        if self._weights is None:
+            return [(labels[j], 1) for j in self._indices[start:end]]
+        return list(zip([labels[j] for j in self._indices[start:end]], self._weights[start:end]))
+
+    def _position(self, node1, node2):
+        # position of the edge (node1, node2) in `indices`, or -1 if it isn't present
+        i = self._index[node1]
+        j = self._index.get(node2)
+        if j is None:
+            return -1
+        start, end = self._indptr[i], self._indptr[i + 1]
+        position = bisect_left(self._indices, j, start, end)
+        return position if position < end and self._indices[position] == j else -1
+
+    def is_adj(self, node1, node2):
+        return self._position(node1, node2) >= 0
+
+    def weight(self, node1, node2):
+        position = self._position(node1, node2)
+        if position < 0:
+            raise KeyError((node1, node2))
+        return 1 if self._weights is None else self._weights[position]
+
+    def freeze(self):
+        return self
+
+    def thaw(self):
+        """
+        Build a mutable copy of the graph.
+        Runtime O(V + E)
+
+        Returns
+        -------
+        Graph or DiGraph
+        """
+        graph = DiGraph() if self.directed else Graph()
+        graph.add_nodes(self._labels)
+        labels, indptr, indices = self._labels, self._indptr, self._indices
+        edges = ((labels[i], labels[indices[j]], j) for i in range(len(labels)) for j in range(indptr[i], indptr[i + 1]))
+        if self.weighted:
+            weights = self._weights
+            graph.add_weighted_edges((node1, node2, weights[j]) for node1, node2, j in edges)
+        else:
+            graph.add_edges((node1, node2) for node1, node2, _ in edges)
+        return graph
+
+    # mutation is not supported
+
+    def _immutable(self, *_):
+        raise TypeError("FrozenGraph is immutable")
+
+    add_node = add_nodes = add_edge = add_edges = add_weighted_edges = _immutable
+    remove_node = remove_nodes = remove_edge = remove_edges = contract_edge = _immutable
@@ -1,22 +1,43 @@
+from collections import OrderedDict, namedtuple
 from math import inf
 
-from DataStructures.Graph.algorithms import breadth_first_search
+from DataStructures.Graph.algorithms import breadth_first_search, multi_source_eccentricity
+from DataStructures.Graph.degreeindex import DegreeIndex
+from DataStructures.Graph.interning import intern_nodes
+from DataStructures.Graph.parallel import parallel_eccentricity
+from DataStructures.Graph.readwrite import is_weighted_edgelist, read_adjacency, read_edgelist, read_graph, \
+    write_binary_edgelist, write_graph
+from DataStructures.UnionFind import UnionFind
+
+DegreeStatistics = namedtuple("DegreeStatistics", ["min", "max", "mean"])
 
 
 class Graph(object):
-    # todo: write code to be able to generate a graph from a function (implicitly generated graph)
-    # todo: rewrite so it works with kwargs and weight
-    # todo: would it be easier to generate the graph from a list of edges?
-    #    i.e. define what a node looks like and define a function that generates an edge
+    # number of sources whose breadth first searches `bfs` keeps
+    BFS_CACHE_SIZE = 64
+
+    # todo: rewrite so it works with kwargs
     def __init__(self, graph_data=None):
+        # graph_data maps every node to a list of its neighbors, or to a dict of {neighbor: weight}
 
         if graph_data is None:
             graph_data = {}
 
+        # every node maps to a dict of {neighbor: edge weight}, so a neighbor and its weight are found together.
+        # unweighted edges have weight 1.
         self._adj = {}
         self._node = {}
-        self._edge = {}
-        self._ecc = None
+        self._weighted = False
+        # every mutation increments _version, which invalidates everything in _cache
+        self._version = 0
+        self._cache = {}
+        self._cache_version = 0
+        self._processes = None
+        # with component tracking on, a union-find of the components, or None if it needs rebuilding
+        self._tracking = False
+        self._uf = None
+        # nodes bucketed by degree, built on first use and then kept up to date, or None
+        self._degrees = None
 
         # add nodes and edges
         for node in graph_data.keys():
@@ -24,65 +45,281 @@ class Graph(object):
             if node not in self:
                 self.add_node(node)
 
-            for adj in graph_data[node]:
-                # add adj, if not already present
-                if adj not in self:
-                    self.add_node(adj)
-                self.add_edge(node, adj)
+            if isinstance(graph_data[node], dict):
+                self.add_weighted_edges((node, adj, weight) for adj, weight in graph_data[node].items())
+            else:
+                self.add_edges((node, adj) for adj in graph_data[node])
 
     def _maximally_connected(self):
         # return the maximally connected subset of self.vertices
-        # could compute the multiplicity of 0 as an eigenvalue of the Laplacean matrix of the graph
-        # probably easier to just do DFS or BFS and see if everything is reached
-
-        # do a BFS from the node with the max degree
-        connected_to_node = []
-        disconnected_from_node = []
-        node = max(self.vertices, key=self.degree)
-        discarded = []
-
-        # todo: figure out a better conditional for this
-        while len(connected_to_node) <= len(disconnected_from_node):
-            # get the levels of each node
-            bfs = breadth_first_search(self, node).level
-            # filter out the nodes that we've already checked
-            nodes = {vertex: bfs[vertex] for vertex in bfs if vertex not in discarded}
-            # partition set of nodes into connected and unconnected
-            connected_to_node = [node for node in nodes if nodes[node] < inf]
-            disconnected_from_node = [node for node in nodes if nodes[node] == inf]
-            # throw away the nodes that are connected, for the next pass through the loop
-            discarded.extend(connected_to_node)
-            # find the next node to search from
-            if len(disconnected_from_node) <= 0:
-                break
-            else:
-                node = max(disconnected_from_node, key=self.degree)
-
-        return connected_to_node
+        return self.largest_component()
+
+    def _components(self):
+        # union-find over every edge.  edge direction is ignored, so directed graphs give weakly connected components.
+        components = UnionFind(self.vertices)
+        for node in self.vertices:
+            for neighbor in self.adj(node):
+                components.union(node, neighbor)
+        return components
+
+    def track_components(self, enabled=True):
+        """
+        Turn incremental component tracking on or off.  While it's on, adding nodes and edges also updates a
+        union-find of the components, so `connected`, `num_components`, `component_size` and the other component
+        queries don't traverse the graph.  Removing a node or edge drops the union-find, and the next query rebuilds it.
+        Runtime O((V + E) α(V)) to turn it on, then O(α(V)) per added edge
+        """
+        self._tracking = enabled
+        self._uf = self._components() if enabled else None
+
+    def _union_edges(self, edges):
+        # pass `edges` through, merging the components of every edge on the way
+        uf = self._uf
+        for edge in edges:
+            uf.union(edge[0], edge[1])
+            yield edge
+
+    def _connectivity(self):
+        # the tracked union-find, rebuilt if needed, or a new one if tracking is off
+        if not self._tracking:
+            return self._components()
+        if self._uf is None:
+            self._uf = self._components()
+        return self._uf
+
+    # runtime O(α(V)) while tracking components, O((V + E) α(V)) otherwise
+    def connected(self, node1, node2):
+        components = self._connectivity()
+        return components.find(node1) == components.find(node2)
+
+    # runtime O(1) while tracking components, O((V + E) α(V)) otherwise
+    @property
+    def num_components(self):
+        return self._connectivity().count
+
+    # runtime O(α(V)) while tracking components, O((V + E) α(V)) otherwise
+    def component_size(self, node):
+        return self._connectivity().size(node)
+
+    def connected_components(self):
+        """
+        Every connected component of the graph, in the order their first nodes were added.  The components of a
+        directed graph are weakly connected.
+        Runtime O(1) if cached since the last change to the graph, otherwise O((V + E) α(V)), or O(V α(V)) while
+        tracking components
+
+        Returns
+        -------
+        list
+            A list of the nodes of every component.  It is shared, so don't modify it.
+        """
+        return self._cached("components", lambda: self._connectivity().groups())
+
+    def largest_component(self):
+        """
+        The nodes of the component with the most nodes.  Ties go to the component whose first node was added first.
+        Runtime as for `connected_components`
+
+        Returns
+        -------
+        list
+        """
+        return self._cached("largest_component", lambda: max(self.connected_components(), key=len, default=[]))
+
+    def component_of(self, node):
+        """
+        The nodes of the component containing `node`.
+        Runtime O((V + E) α(V))
+
+        Returns
+        -------
+        list
+        """
+        if node not in self:
+            raise KeyError("Node {0} not present in graph".format(repr(node)))
+        components = self._connectivity()
+        root = components.find(node)
+        return [vertex for vertex in components if components.find(vertex) == root]
 
     @classmethod
     def subgraph(cls, graph, filter_nodes=None, filter_edges=None):
-        if filter_nodes is None:
-            pass
-        if filter_edges is None:
-            pass
+        """
+        Read only view of the nodes and edges of `graph` that pass the filters, which copies nothing.  Call
+        `materialize()` on it for a mutable copy.
+        Runtime O(1)
+
+        Parameters
+        ----------
+        graph : Graph
+        filter_nodes : function, optional
+            Maps a node to True if it belongs to the subgraph.  Defaults to None, meaning every node.
+        filter_edges : function, optional
+            Maps (node1, node2) to True if the edge belongs to the subgraph.  Defaults to None, meaning every edge
+            between nodes of the subgraph.
+
+        Returns
+        -------
+        GraphView
+        """
+        # imported here, since GraphView subclasses Graph
+        from DataStructures.Graph.graphviews import subgraph_view
+        return subgraph_view(graph, filter_nodes, filter_edges)
 
     @classmethod
     def induced_subgraph(cls, graph, filter_nodes=None):
-        # construct a new subgraph from `graph`, based on nodes that satisfy `filter`
+        """
+        Read only view of the subgraph of `graph` induced by some of its nodes, which copies nothing.  Call
+        `materialize()` on it for a mutable copy.
+        Runtime O(V) to run `filter_nodes`
+
+        Parameters
+        ----------
+        graph : Graph
+        filter_nodes : function, optional
+            Maps `graph` to the nodes to keep.  Defaults to `largest_component`.
+
+        Returns
+        -------
+        GraphView
+        """
         if filter_nodes is None:
-            filter_nodes = Graph._maximally_connected
+            filter_nodes = Graph.largest_component
 
         # get the vertices that we want still in the graph
-        vertices = filter_nodes(graph)
+        vertices = set(filter_nodes(graph))
+        return cls.subgraph(graph, vertices.__contains__)
+
+    def freeze(self):
+        """
+        Build an immutable compressed sparse row copy of the graph, which uses far less memory, and which `algorithms`
+        traverses without hashing node labels.
+        Runtime O(V + E log(max degree))
+
+        Returns
+        -------
+        FrozenGraph
+        """
+        # imported here, since FrozenGraph subclasses Graph
+        from DataStructures.Graph.frozengraph import FrozenGraph
+        return FrozenGraph.from_graph(self)
+
+    def save(self, path):
+        """
+        Save the graph in a compact binary format: a pickled table of node labels followed by the compressed sparse
+        row arrays of `freeze()`.  Labels must be picklable.
+        Runtime O(V + E log(max degree))
+        """
+        write_graph(self.freeze(), path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load a graph written by `save`.
+        Runtime O(V) with `mmap`, otherwise O(V + E)
+
+        Parameters
+        ----------
+        path : str or path-like
+        mmap : bool, optional
+            If True, the edges stay in a read only memory map of the file instead of being copied into memory, so
+            processes that load the same file share one copy of it.  Defaults to True.
+
+        Returns
+        -------
+        FrozenGraph
+            Call `thaw()` on it for a mutable copy.
+        """
+        from DataStructures.Graph.frozengraph import FrozenGraph
+        labels, indptr, indices, weights, directed = read_graph(path, use_mmap=mmap)
+        return FrozenGraph(labels, indptr, indices, weights, directed=directed)
 
-        # get the edges that we want still in the graph
-        # could also just construct a duplicate graph and the remove every node not in vertices, but that would be slow
-        data = dict.fromkeys(vertices)
-        for node in data:
-            data[node] = [vertex for vertex in graph.adj(node) if vertex in vertices]
+    @classmethod
+    def from_edgelist(cls, source, nodetype=str, delimiter=None, comments="#", weighted=False):
+        """
+        Build a graph from an edge list, in a single streaming pass.  Duplicate edges are dropped, keeping the last
+        weight.
+        Runtime O(V + E)
+
+        Parameters
+        ----------
+        source : str, path-like, or iterable
+            The path of a text edge list (one "node1 node2" pair per line) or of a binary edge list written by
+            `write_edgelist(path, binary=True)`, or an iterable of lines or of (node1, node2) pairs.  Binary edge lists
+            are memory mapped and loaded without parsing.
+        nodetype : function, optional
+            Converts every field of a text edge list into a node.  Defaults to str.
+        delimiter : str, optional
+            Separates the fields of a text edge list.  Defaults to None, meaning any whitespace.
+        comments : str, optional
+            Everything after this in a line of text is ignored.  Defaults to "#".
+        weighted : bool, optional
+            If True, every edge has a third field holding its weight.  Binary edge lists record whether they are
+            weighted, so this only applies to text and iterables.  Defaults to False.
+
+        Returns
+        -------
+        Graph
+        """
+        graph = cls()
+        edges = read_edgelist(source, nodetype, delimiter, comments, weighted=weighted)
+        if weighted or is_weighted_edgelist(source):
+            graph.add_weighted_edges(edges)
+        else:
+            graph.add_edges(edges)
+        return graph
 
-        return Graph(data)
+    @classmethod
+    def from_adjacency_file(cls, source, nodetype=str, delimiter=None, comments="#"):
+        """
+        Build a graph from an adjacency list, in which every line is a node followed by its neighbors.  Nodes without
+        neighbors are kept, and duplicate edges are dropped.
+        Runtime O(V + E)
+
+        Parameters
+        ----------
+        source : str, path-like, or iterable
+            The path of a text file, or an iterable of lines.
+        nodetype, delimiter, comments
+            As in `from_edgelist`.
+
+        Returns
+        -------
+        Graph
+        """
+        graph = cls()
+        for node, *neighbors in read_adjacency(source, nodetype, delimiter, comments):
+            graph.add_node(node)
+            graph.add_edges((node, neighbor) for neighbor in neighbors)
+        return graph
+
+    def write_edgelist(self, path, binary=False, delimiter=" "):
+        """
+        Write every edge of the graph to `path`, once.  The binary format needs integer nodes, but loads without
+        parsing.  Nodes without any edges are not written.
+        Runtime O(V + E)
+        """
+        if binary:
+            write_binary_edgelist(self._unique_edges(), path, weighted=self.weighted)
+            return
+
+        with open(path, "w") as f:
+            for node1, node2, weight in self._unique_edges():
+                if self.weighted:
+                    f.write("{0}{1}{2}{1}{3}\n".format(node1, delimiter, node2, repr(weight)))
+                else:
+                    f.write("{0}{1}{2}\n".format(node1, delimiter, node2))
+
+    def _unique_edges(self):
+        # every edge once, as (node1, node2, weight).  undirected edges are yielded from the node visited first.
+        # only the read API is used, so this works for frozen graphs and views too.
+        directed = self.directed
+        done = set()
+        for node in self:
+            for neighbor, weight in self.adj_weights(node):
+                if directed or neighbor not in done:
+                    yield node, neighbor, weight
+            if not directed:
+                done.add(node)
 
     def __contains__(self, item):
         return item in self._adj
@@ -94,7 +331,7 @@ class Graph(object):
         return self.order
 
     def __repr__(self):
-        return repr(self._adj)
+        return repr({node: list(neighbors) for node, neighbors in self._adj.items()})
 
     @property
     def vertices(self):
@@ -106,17 +343,36 @@ class Graph(object):
 
     @property
     def order(self):
-        return len(self.vertices)
+        return len(self._adj)
+
+    @property
+    def directed(self):
+        return False
+
+    @property
+    def weighted(self):
+        # True iff any edge was added with an explicit weight
+        return self._weighted
 
     def degree(self, node):
-        return len(self.adj(node))
+        return len(self._adj[node])
 
     def adj(self, node):
-        return self._adj[node]
+        # neighbors are stored as dict keys, which keeps insertion order and gives O(1) membership tests
+        return self._adj[node].keys()
+
+    def adj_weights(self, node):
+        # (neighbor, weight) pairs, in the same order as adj(node)
+        return self._adj[node].items()
 
+    # runtime O(1)
     def is_adj(self, node1, node2):
         return node2 in self._adj[node1]
 
+    # runtime O(1)
+    def weight(self, node1, node2):
+        return self._adj[node1][node2]
+
     def add_nodes(self, nodes):
         for node in nodes:
             self.add_node(node)
@@ -125,133 +381,492 @@ class Graph(object):
         # add an unconnected vertex to the graph
         # if the node is already present, don't do anything
         if node not in self:
-            self._adj[node] = []
-            # eccentricity dict is no longer valid, so reset it to None
-            self._ecc = None
-
-    def add_edge(self, node1, node2):
+            self._adj[node] = {}
+            self._version += 1
+            if self._uf is not None:
+                self._uf.add(node)
+            if self._degrees is not None:
+                self._degrees.update(node, 0)
+
+    # runtime O(1)
+    def add_edge(self, node1, node2, weight=None):
         # make sure both nodes are present
         for node in node1, node2:
             if node not in self:
                 self.add_node(node)
 
-        # if the edge is already present, don't do anything
-        # todo: investigate as to whether this can cause duplicate edges to appear
-        if node2 not in self.adj(node1) and node1 not in self.adj(node2):
-            self._adj[node1].append(node2)
-            self._adj[node2].append(node1)
+        # if the edge is already present, only update its weight (if given)
+        if weight is not None:
+            self._weighted = True
+        elif node2 in self._adj[node1]:
+            return
+        else:
+            weight = 1
+
+        self._adj[node1][node2] = weight
+        self._adj[node2][node1] = weight
+        if self._uf is not None:
+            self._uf.union(node1, node2)
+        if self._degrees is not None:
+            self._reindex(node1, node2)
+        self._version += 1
 
     def add_edges(self, edges):
+        # same as calling add_edge for every edge, without the per-edge method calls.
+        # writing the dict entries dedupes duplicate edges for free.
+        if self._uf is not None:
+            edges = self._union_edges(edges)
+        adj = self._adj
         for node1, node2 in edges:
-            self.add_edge(node1, node2)
-
+            neighbors = adj.get(node1)
+            if neighbors is None:
+                neighbors = adj[node1] = {}
+            if node2 in neighbors:
+                continue
+            neighbors[node2] = 1
+            neighbors = adj.get(node2)
+            if neighbors is None:
+                neighbors = adj[node2] = {}
+            neighbors[node1] = 1
+        # cheaper to rebuild the degree index the next time it's needed than to update it edge by edge
+        self._degrees = None
+        self._version += 1
+
+    def add_weighted_edges(self, edges):
+        # bulk version of add_edge(node1, node2, weight) for every (node1, node2, weight) in edges
+        if self._uf is not None:
+            edges = self._union_edges(edges)
+        adj = self._adj
+        for node1, node2, weight in edges:
+            neighbors = adj.get(node1)
+            if neighbors is None:
+                neighbors = adj[node1] = {}
+            neighbors[node2] = weight
+            neighbors = adj.get(node2)
+            if neighbors is None:
+                neighbors = adj[node2] = {}
+            neighbors[node1] = weight
+        self._weighted = True
+        # cheaper to rebuild the degree index the next time it's needed than to update it edge by edge
+        self._degrees = None
+        self._version += 1
+
+    # runtime O(deg(node))
     def remove_node(self, node):
-        pass
+        if node not in self:
+            raise KeyError("Node {0} not present in graph".format(repr(node)))
+
+        for neighbor in self._adj[node]:
+            if neighbor != node:
+                del self._adj[neighbor][node]
+        neighbors = self._adj.pop(node)
+        if self._degrees is not None:
+            self._degrees.remove(node)
+            self._reindex(*(neighbor for neighbor in neighbors if neighbor != node))
+        self._version += 1
+        # union-find can't split components, so rebuild it the next time it's needed
+        self._uf = None
 
     def remove_nodes(self, nodes):
-        pass
+        for node in nodes:
+            self.remove_node(node)
 
+    # runtime O(1)
     def remove_edge(self, node1, node2):
-        pass
+        if node1 not in self or node2 not in self._adj[node1]:
+            raise KeyError("Edge {0} not present in graph".format(repr((node1, node2))))
+
+        del self._adj[node1][node2]
+        if node1 != node2:
+            del self._adj[node2][node1]
+        if self._degrees is not None:
+            self._reindex(node1, node2)
+        self._version += 1
+        # union-find can't split components, so rebuild it the next time it's needed
+        self._uf = None
 
     def remove_edges(self, edges):
-        pass
+        for node1, node2 in edges:
+            self.remove_edge(node1, node2)
+
+    def _directed_eccentricity(self):
+        # distances aren't symmetric in a directed graph, so the bounds below don't hold.  do a BFS from every node,
+        # many at a time.
+        return multi_source_eccentricity(self)
+
+    def _bounded_eccentricity(self):
+        # start by selecting the largest lower bound
+        high = False
+
+        possibilities = self.vertices
+
+        # ecc = dict.fromkeys(nodes, 0)
+        # are these initial bounds what they should be? Does it matter?
+        # if we have a connected graph G of order n, the min ecc would be 1 if G is K_n, and the max ecc would be
+        # n-1 if G is P_n (i.e. complete graph on n nodes and path on n nodes respectively)
+        lower = dict.fromkeys(possibilities, -inf)
+        upper = dict.fromkeys(possibilities, inf)
+
+        # choose the first node as the node which has the highest degree
+        minlower = self.max_degree_node()
+        # maxupper won't be used in the first time through the loop, so make it None
+        maxupper = None
+
+        while possibilities:
+            if high:
+                promising = maxupper
+            else:
+                promising = minlower
 
-    # note that if the graph isn't connected, every eccentricity will be infinite
-    def eccentricity(self, nodes=None):
-        # don't recompute eccentricity unless we absolutely need to
-        if self._ecc is None:
-            # start by selecting the largest lower bound
-            high = False
-
-            possibilities = self.vertices
-
-            # ecc = dict.fromkeys(nodes, 0)
-            # are these initial bounds what they should be? Does it matter?
-            # if we have a connected graph G of order n, the min ecc would be 1 if G is K_n, and the max ecc would be
-            # n-1 if G is P_n (i.e. complete graph on n nodes and path on n nodes respectively)
-            lower = dict.fromkeys(possibilities, -inf)
-            upper = dict.fromkeys(possibilities, inf)
-
-            # choose the first node as the node which has the highest degree
-            minlower = max(possibilities, key=lambda x: self.degree(x))
-            # maxupper won't be used in the first time through the loop, so make it None
+            # as per Takes and Kosters, alternate between choosing node with the maximum upper bound and the node
+            # with the minimum lower bound.
+            high = not high
+
+            # is there a way to speed this up, instead of just doing a BFS from promising?
+            # todo: make sure i'm passing args in the right way
+            bfs = breadth_first_search(self, promising)
+            # compute eccentricity of promising node
+            # todo: I'll have to change how this is written once I rewrite shortest_path
+            ecc_promising = max(bfs.level.values())
+
+            for node in possibilities:
+                lower[node] = max(lower[node], ecc_promising - bfs.level[node], bfs.level[node])
+                upper[node] = min(upper[node], ecc_promising + bfs.level[node])
+
+                # is there a good way to put a bound on how many nodes are removed every time through the loop?
+                if lower[node] == upper[node]:
+                    possibilities.remove(node)
+
+            minlower = None
             maxupper = None
 
-            while possibilities:
-                if high:
-                    promising = maxupper
-                else:
-                    promising = minlower
-
-                # as per Takes and Kosters, alternate between choosing node with the maximum upper bound and the node
-                # with the minimum lower bound.
-                high = not high
-
-                # is there a way to speed this up, instead of just doing a BFS from promising?
-                # todo: make sure i'm passing args in the right way
-                bfs = breadth_first_search(self, promising)
-                # compute eccentricity of promising node
-                # todo: I'll have to change how this is written once I rewrite shortest_path
-                ecc_promising = max(bfs.level.values())
-
-                for node in possibilities:
-                    lower[node] = max(lower[node], ecc_promising - bfs.level[node], bfs.level[node])
-                    upper[node] = min(upper[node], ecc_promising + bfs.level[node])
-
-                    # is there a good way to put a bound on how many nodes are removed every time through the loop?
-                    if lower[node] == upper[node]:
-                        possibilities.remove(node)
-
-                minlower = None
-                maxupper = None
-
-                # loop through the nodes remaining in possibilities and update minlower/maxupper.
-                # ties in bound are broken by selecting the node with the highest degree.
-                # can I combine this for loop with the previous for loop?  make it the else clause from the if statement
-                # that checks for removing nodes?
-                for node in possibilities:
-                    if minlower is None \
-                            or (lower[node] == lower[minlower] and self.degree(node) > self.degree(minlower)) \
-                            or (lower[node] < lower[minlower]):
-                        minlower = node
-
-                    if maxupper is None \
-                            or (upper[node] == upper[maxupper] and self.degree(node) > self.degree(maxupper)) \
-                            or (upper[node] > upper[maxupper]):
-                        maxupper = node
-            self._ecc = lower
-
-        if nodes is None:
-            ecc = self._ecc
+            # loop through the nodes remaining in possibilities and update minlower/maxupper.
+            # ties in bound are broken by selecting the node with the highest degree.
+            # can I combine this for loop with the previous for loop?  make it the else clause from the if statement
+            # that checks for removing nodes?
+            for node in possibilities:
+                if minlower is None \
+                        or (lower[node] == lower[minlower] and self.degree(node) > self.degree(minlower)) \
+                        or (lower[node] < lower[minlower]):
+                    minlower = node
+
+                if maxupper is None \
+                        or (upper[node] == upper[maxupper] and self.degree(node) > self.degree(maxupper)) \
+                        or (upper[node] > upper[maxupper]):
+                    maxupper = node
+        return lower
+
+    @property
+    def version(self):
+        # incremented by every change to the graph
+        return self._version
+
+    def _cached(self, key, compute):
+        # value of compute(), memoized until the graph next changes.  cached values are shared with every caller, so
+        # they must not be modified.
+        version = self.version
+        if self._cache_version != version:
+            self._cache = {}
+            self._cache_version = version
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def node_index(self):
+        """
+        Dense integer ids 0..n-1 for the nodes, memoized until the graph next changes.  The functions in `algorithms`
+        keep their per-node state in flat buffers indexed by these ids, and only translate back to nodes at the end.
+        Runtime O(1) if cached, otherwise O(V)
+
+        Returns
+        -------
+        NodeIndex
+            (labels, index), where labels[i] is the node with id i and index[node] == i.  It is shared, so don't
+            modify it.
+        """
+        return self._cached("node_index", lambda: intern_nodes(self))
+
+    def index(self, node):
+        # integer id of `node`, until the graph next changes
+        return self.node_index().index[node]
+
+    def label(self, i):
+        # node with integer id `i`
+        return self.node_index().labels[i]
+
+    def bfs(self, node):
+        """
+        Breadth first search from `node`, memoized until the graph next changes.  Searches from the
+        `BFS_CACHE_SIZE` most recently used sources are kept.
+        Runtime O(1) if cached, otherwise O(V + E)
+
+        Returns
+        -------
+        namedtuple
+            (level, parent), as returned by `breadth_first_search`.  It is shared, so don't modify it.
+        """
+        trees = self._cached("bfs", OrderedDict)
+        tree = trees.get(node)
+        if tree is None:
+            tree = trees[node] = breadth_first_search(self, node)
+            if len(trees) > self.BFS_CACHE_SIZE:
+                trees.popitem(last=False)
         else:
-            ecc = {node: self._ecc[node] for node in nodes}
+            trees.move_to_end(node)
+        return tree
+
+    def degree_statistics(self):
+        """
+        Minimum, maximum and mean degree, memoized until the graph next changes.
+        Runtime O(1) if cached, otherwise O(V)
+
+        Returns
+        -------
+        namedtuple
+            (min, max, mean), all 0 for an empty graph.
+        """
+        def statistics():
+            degrees = [self.degree(node) for node in self]
+            if not degrees:
+                return DegreeStatistics(0, 0, 0)
+            return DegreeStatistics(min(degrees), max(degrees), sum(degrees) / len(degrees))
+        return self._cached("degree_statistics", statistics)
+
+    def _reindex(self, *nodes):
+        for node in nodes:
+            self._degrees.update(node, self.degree(node))
+
+    def _degree_index(self):
+        # the degree index, built if needed.  once built, every edit keeps it up to date.
+        if self._degrees is None:
+            self._degrees = DegreeIndex((node, self.degree(node)) for node in self)
+        return self._degrees
+
+    # runtime O(1) once the degree index is built, and after single node and edge edits
+    def max_degree_node(self):
+        # a node of maximum degree, or None if the graph is empty
+        return self._degree_index().max_degree_node()
+
+    # runtime O(max degree) once the degree index is built
+    def degree_histogram(self):
+        # the number of nodes of every degree, from 0 to the maximum degree
+        return self._degree_index().histogram()
+
+    # runtime O(V + max degree) once the degree index is built
+    def nodes_by_degree(self, reverse=False):
+        # iterate over the nodes in order of degree, lowest first unless `reverse`
+        return self._degree_index().nodes(reverse)
+
+    def core_numbers(self):
+        """
+        The core number of every node: the largest k such that the node is in a subgraph where every node has degree
+        at least k.  Uses the bucket algorithm of Batagelj and Zaversnik.  Self loops are ignored, and the edges of
+        a directed graph count in both directions, as in `degree`.
+        Runtime O(V + E)
+
+        Returns
+        -------
+        dict
+        """
+        def compute():
+            labels, index = self.node_index()
+            rows = [[index[neighbor] for neighbor in self.adj(label)] for label in labels]
+            if self.directed:
+                # add every edge to the row of its head too.  the rows are reversed directly, since not every
+                # directed graph has predecessors, e.g. a directed FrozenGraph.
+                incoming = [[] for _ in labels]
+                for u, row in enumerate(rows):
+                    for v in row:
+                        incoming[v].append(u)
+                rows = [row + extra for row, extra in zip(rows, incoming)]
+            rows = [[v for v in row if v != u] for u, row in enumerate(rows)]
+
+            # sort the nodes by degree with a counting sort.  position[u] is where u is in order, and start[d] is
+            # where the nodes of degree d start.
+            degree = [len(row) for row in rows]
+            start = [0] * (max(degree, default=0) + 2)
+            for d in degree:
+                start[d + 1] += 1
+            for d in range(1, len(start)):
+                start[d] += start[d - 1]
+            order = [0] * len(labels)
+            position = [0] * len(labels)
+            fill = start[:]
+            for u, d in enumerate(degree):
+                position[u] = fill[d]
+                order[fill[d]] = u
+                fill[d] += 1
+
+            # peel the nodes in order of degree.  every neighbor with a higher degree loses one, which moves it to
+            # the front of its bucket and keeps the order sorted.
+            for u in order:
+                for v in rows[u]:
+                    if degree[v] > degree[u]:
+                        d = degree[v]
+                        first = order[start[d]]
+                        if first != v:
+                            order[position[v]], order[start[d]] = first, v
+                            position[first], position[v] = position[v], start[d]
+                        start[d] += 1
+                        degree[v] -= 1
+            return dict(zip(labels, degree))
+        return self._cached("core_numbers", compute)
+
+    def k_core(self, k=None):
+        """
+        View of the k-core: the largest subgraph in which every node has degree at least `k`.
+        Runtime O(V + E)
+
+        Parameters
+        ----------
+        k : int, optional
+            Defaults to None, meaning the largest k with a non-empty core.
+
+        Returns
+        -------
+        GraphView
+        """
+        cores = self.core_numbers()
+        if k is None:
+            k = max(cores.values(), default=0)
+        return self.subgraph(self, lambda node: cores[node] >= k)
+
+    def _compute_eccentricity(self, processes):
+        if processes is not None and processes > 1:
+            return parallel_eccentricity(self.freeze(), processes)
+        if self.directed:
+            return self._directed_eccentricity()
+        return self._bounded_eccentricity()
+
+    @property
+    def processes(self):
+        # number of worker processes used to compute eccentricity, and so radius, diameter, center and periphery.
+        # None or 1 computes them in this process.
+        return self._processes
+
+    @processes.setter
+    def processes(self, processes):
+        if processes is not None and processes < 1:
+            raise ValueError("processes must be positive")
+        self._processes = processes
+
+    # note that if the graph isn't connected, every eccentricity will be infinite
+    def eccentricity(self, nodes=None, processes=None):
+        # don't recompute eccentricity unless we absolutely need to
+        ecc = self._cached("eccentricity",
+                           lambda: self._compute_eccentricity(self.processes if processes is None else processes))
+
+        if nodes is not None:
+            ecc = {node: ecc[node] for node in nodes}
 
         return ecc
 
     @property
     def radius(self):
         # min eccentricity
-        return min(self.eccentricity().values())
+        return self._cached("radius", lambda: min(self.eccentricity().values()))
 
     @property
     def diameter(self):
         # max eccentricity
-        return max(self.eccentricity().values())
+        return self._cached("diameter", lambda: max(self.eccentricity().values()))
 
     @property
     def center(self):
-        # those nodes whose eccentricity == radius
-        return [node for node in self.vertices if self.eccentricity()[node] == self.radius]
+        # those nodes whose eccentricity == radius.  radius is looked up once, not once per node.
+        def center():
+            ecc, radius = self.eccentricity(), self.radius
+            return [node for node in self.vertices if ecc[node] == radius]
+        return self._cached("center", center)
 
     @property
     def periphery(self):
         # those nodes whose eccentricity == diameter
-        return [node for node in self.vertices if self.eccentricity()[node] == self.diameter]
+        def periphery():
+            ecc, diameter = self.eccentricity(), self.diameter
+            return [node for node in self.vertices if ecc[node] == diameter]
+        return self._cached("periphery", periphery)
 
-    # todo: write this
+    # runtime O(deg(node2))
     def contract_edge(self, node1, node2):
-        pass
+        """
+        Merge `node2` into `node1`, removing the edge between them.  Edges of `node2` move to `node1`, and edges that
+        both nodes had to the same neighbor become one edge, weighted with the sum of their weights.
+
+        Raises
+        ------
+        KeyError
+            If the edge is not present.
+        """
+        if node1 not in self or node2 not in self._adj[node1]:
+            raise KeyError("Edge {0} not present in graph".format(repr((node1, node2))))
+        if node1 == node2:
+            self.remove_edge(node1, node2)
+            return
+
+        adj = self._adj
+        merged = adj[node1]
+        del merged[node2]
+        for neighbor, weight in adj.pop(node2).items():
+            if neighbor == node1 or neighbor == node2:
+                continue
+            del adj[neighbor][node2]
+            if neighbor in merged:
+                weight += merged[neighbor]
+                self._weighted = True
+            merged[neighbor] = weight
+            adj[neighbor][node1] = weight
+        # the degree index is rebuilt the next time it's needed
+        self._degrees = None
+        self._version += 1
+        self._uf = None
+
+    def coarsen(self, levels=None, min_order=1, seed=None):
+        """
+        Build successively smaller graphs by contracting heavy edge matchings, for running expensive analyses on a
+        coarse graph and carrying the results back with `project`.  Every level roughly halves the number of nodes,
+        merges each matched pair into one supernode labelled with one of the pair, and sums the weights of merged
+        edges.
+        Runtime O(V + E) per level
+
+        Parameters
+        ----------
+        levels : int, optional
+            Maximum number of levels.  Defaults to None, meaning until the graph stops shrinking.
+        min_order : int, optional
+            Stop once a level has at most this many nodes.  Defaults to 1.
+        seed : optional
+            Seed for the random order in which nodes are matched.
+
+        Returns
+        -------
+        list
+            One (graph, mapping, sizes) named tuple per level, from finest to coarsest, where `mapping` maps every
+            node of the previous level to its supernode, and `sizes` counts the original nodes in every supernode.
+        """
+        from DataStructures.Graph.coarsening import coarsen
+        return coarsen(self, levels, min_order, seed)
+
+    @staticmethod
+    def project(values, hierarchy):
+        """
+        Carry values computed for the nodes of the coarsest graph of `hierarchy` back to the original nodes, where
+        every node takes the value of its supernode.
+        Runtime O(V) per level
+
+        Parameters
+        ----------
+        values : dict
+            A value for every node of the coarsest graph.
+        hierarchy : list
+            As returned by `coarsen`.
+
+        Returns
+        -------
+        dict
+        """
+        from DataStructures.Graph.coarsening import project
+        return project(values, hierarchy)
 
     # todo: write this
     def classify_edges(self):
@@ -0,0 +1,179 @@
+from DataStructures.Graph.degreeindex import DegreeIndex
+from DataStructures.Graph.digraph import DiGraph
+from DataStructures.Graph.graph import Graph
+
+
+def _keep(*_):
+    # default filter, which keeps everything
+    return True
+
+
+def subgraph_view(graph, filter_node=None, filter_edge=None):
+    """
+    Read only view of the nodes and edges of `graph` that pass the filters.  Nothing is copied: the filters are
+    applied to the parent graph on every access, so the view always reflects the current parent.
+    Runtime O(1)
+
+    Parameters
+    ----------
+    graph : Graph
+        The parent graph, which may itself be a view.
+    filter_node : function, optional
+        Maps a node to True if it belongs to the view.  Defaults to None, meaning every node.
+    filter_edge : function, optional
+        Maps (node1, node2) to True if the edge belongs to the view.  Undirected edges are checked in both
+        directions, so this should be symmetric.  Defaults to None, meaning every edge between nodes of the view.
+
+    Returns
+    -------
+    GraphView
+        A DiGraphView if `graph` has predecessors.
+    """
+    cls = DiGraphView if hasattr(graph, "predecessors") else GraphView
+    return cls(graph, filter_node, filter_edge)
+
+
+class GraphView(Graph):
+    """
+    Read only, filtered view of another graph, with the read API of Graph, so it can be passed to every function in
+    `algorithms`.  Build one with `subgraph_view`, `Graph.subgraph` or `Graph.induced_subgraph`, and call
+    `materialize()` for an independent, mutable copy.
+
+    Neighbor queries cost O(deg(node)) calls of the filters.  Derived properties like eccentricity, the node index
+    and the degree index are cached until the parent graph next changes, so the filters must be pure functions of
+    the nodes and edges they're given: a change in what they accept for any other reason isn't seen.
+    """
+
+    def __init__(self, graph, filter_node=None, filter_edge=None):
+        self._graph = graph
+        self._filter_node = _keep if filter_node is None else filter_node
+        self._filter_edge = _keep if filter_edge is None else filter_edge
+        # implicit graphs have no processes setting
+        self._processes = getattr(graph, "processes", None)
+        self._tracking = False
+        self._uf = None
+        self._degrees = None
+        self._cache = {}
+        self._cache_version = None
+
+    def _edge(self, node1, node2):
+        # whether the view keeps the parent's edge node1 -> node2, given that node1 is in the view
+        return self._filter_node(node2) and self._filter_edge(node1, node2)
+
+    def __contains__(self, item):
+        return item in self._graph and self._filter_node(item)
+
+    def __iter__(self):
+        return (node for node in self._graph if self._filter_node(node))
+
+    def __repr__(self):
+        return "{0}({1})".format(type(self).__name__, {node: self.adj(node) for node in self})
+
+    @property
+    def vertices(self):
+        return list(self)
+
+    @property
+    def edges(self):
+        return [(node, neighbor) for node in self for neighbor in self.adj(node)]
+
+    @property
+    def order(self):
+        return sum(1 for _ in self)
+
+    @property
+    def directed(self):
+        return self._graph.directed
+
+    @property
+    def weighted(self):
+        return self._graph.weighted
+
+    def _check(self, node):
+        if node not in self:
+            raise KeyError("Node {0} not present in graph".format(repr(node)))
+
+    def degree(self, node):
+        return len(self.adj(node))
+
+    def adj(self, node):
+        self._check(node)
+        return [neighbor for neighbor in self._graph.adj(node) if self._edge(node, neighbor)]
+
+    def adj_weights(self, node):
+        self._check(node)
+        return [(neighbor, weight) for neighbor, weight in self._graph.adj_weights(node) if self._edge(node, neighbor)]
+
+    def is_adj(self, node1, node2):
+        return node1 in self and self._edge(node1, node2) and self._graph.is_adj(node1, node2)
+
+    def weight(self, node1, node2):
+        if not self.is_adj(node1, node2):
+            raise KeyError((node1, node2))
+        return self._graph.weight(node1, node2)
+
+    @property
+    def version(self):
+        # the parent's version, or None if it has none
+        return getattr(self._graph, "version", None)
+
+    def _cached(self, key, compute):
+        # parents without a version, like an ImplicitGraph, change as they're explored, so nothing is cached for them
+        if self.version is None:
+            return compute()
+        return super()._cached(key, compute)
+
+    def _degree_index(self):
+        # views are read only, so the index is only rebuilt when the parent changes
+        return self._cached("degree_index", lambda: DegreeIndex((node, self.degree(node)) for node in self))
+
+    def materialize(self):
+        """
+        Copy the view into a new, mutable graph.
+        Runtime O(V + E) for the nodes and edges of the parent graph
+
+        Returns
+        -------
+        Graph or DiGraph
+        """
+        graph = DiGraph() if self.directed else Graph()
+        graph.add_nodes(self)
+        if self.weighted:
+            graph.add_weighted_edges((node, neighbor, weight) for node in self
+                                     for neighbor, weight in self.adj_weights(node))
+        else:
+            graph.add_edges((node, neighbor) for node in self for neighbor in self.adj(node))
+        return graph
+
+    # mutation is not supported
+
+    def _read_only(self, *_):
+        raise TypeError("Graph views are read only")
+
+    add_node = add_nodes = add_edge = add_edges = add_weighted_edges = _read_only
+    remove_node = remove_nodes = remove_edge = remove_edges = contract_edge = _read_only
+
+
+class DiGraphView(GraphView):
+    """
+    GraphView of a directed graph with predecessors, i.e. a DiGraph.
+    """
+
+    def predecessors(self, node):
+        self._check(node)
+        return [predecessor for predecessor in self._graph.predecessors(node)
+                if self._filter_node(predecessor) and self._filter_edge(predecessor, node)]
+
+    def pred_weights(self, node):
+        self._check(node)
+        return [(predecessor, weight) for predecessor, weight in self._graph.pred_weights(node)
+                if self._filter_node(predecessor) and self._filter_edge(predecessor, node)]
+
+    def in_degree(self, node):
+        return len(self.predecessors(node))
+
+    def out_degree(self, node):
+        return len(self.adj(node))
+
+    def degree(self, node):
+        return self.in_degree(node) + self.out_degree(node)
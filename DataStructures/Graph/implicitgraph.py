@@ -0,0 +1,134 @@
+from collections import OrderedDict, namedtuple
+
+
+class ImplicitGraph(object):
+    """
+    Graph generated on demand from a neighbor function, for state spaces too large to build up front.
+
+    A node's neighborhood is only computed when `adj`, `adj_weights`, `weight` or `is_adj` asks for it, and is then
+    kept in a least recently used cache, so searches only pay for the region they explore.  The cache holds at most
+    `cache_size` neighbor entries in total; neighborhoods evicted from it are recomputed if they are needed again.
+    `vertices` is every node seen so far.  The read API is the subset of Graph used by breadth first search,
+    Dijkstra's algorithm and A*, so those run on an ImplicitGraph directly.  Searches without a destination visit
+    everything reachable, so only run them on finite state spaces.
+    """
+
+    def __init__(self, neighbors, weight=None, cache_size=1 << 20):
+        """
+        Parameters
+        ----------
+        neighbors : function
+            Maps a node to an iterable of the nodes it has edges to.  Nodes must be hashable.
+        weight : function, optional
+            Maps (node1, node2) to the weight of the edge between them.  Defaults to None, meaning every edge has
+            weight 1.
+        cache_size : int, optional
+            Maximum number of neighbor entries kept across all cached neighborhoods.  Defaults to 2 ** 20.
+        """
+        if cache_size < 1:
+            raise ValueError("cache_size must be positive")
+
+        self._neighbors = neighbors
+        self._weight = weight
+        self._cache_size = cache_size
+        # node -> {neighbor: weight}, least recently used first
+        self._cache = OrderedDict()
+        self._entries = 0
+        self._seen = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, item):
+        return item in self._seen
+
+    def __iter__(self):
+        return iter(self._seen)
+
+    def __len__(self):
+        return self.order
+
+    def __repr__(self):
+        return "ImplicitGraph(seen={0}, cached={1})".format(len(self._seen), len(self._cache))
+
+    @property
+    def vertices(self):
+        # every node seen so far, either expanded or found as a neighbor
+        return list(self._seen)
+
+    @property
+    def order(self):
+        return len(self._seen)
+
+    @property
+    def directed(self):
+        # nothing guarantees that the neighbor function is symmetric
+        return True
+
+    @property
+    def weighted(self):
+        return self._weight is not None
+
+    def _expand(self, node):
+        # the neighborhood of node, from the cache if possible
+        cache = self._cache
+        neighborhood = cache.get(node)
+        if neighborhood is not None:
+            self._hits += 1
+            cache.move_to_end(node)
+            return neighborhood
+
+        self._misses += 1
+        weight = self._weight
+        if weight is None:
+            neighborhood = dict.fromkeys(self._neighbors(node), 1)
+        else:
+            neighborhood = {neighbor: weight(node, neighbor) for neighbor in self._neighbors(node)}
+
+        seen = self._seen
+        seen[node] = None
+        for neighbor in neighborhood:
+            seen[neighbor] = None
+
+        # a neighborhood bigger than the whole cache is returned without being cached, rather than evicting
+        # everything else first.  otherwise evict the least recently used neighborhoods until the new one fits.
+        if len(neighborhood) > self._cache_size:
+            return neighborhood
+        self._entries += len(neighborhood)
+        cache[node] = neighborhood
+        while self._entries > self._cache_size:
+            _, evicted = cache.popitem(last=False)
+            self._entries -= len(evicted)
+        return neighborhood
+
+    def cache_info(self):
+        """
+        Statistics about the neighborhood cache.
+
+        Returns
+        -------
+        namedtuple
+            (hits, misses, neighborhoods, entries): cache hits and misses so far, and the number of neighborhoods and
+            of neighbor entries currently cached.
+        """
+        return namedtuple("CacheInfo", ["hits", "misses", "neighborhoods", "entries"])(
+            self._hits, self._misses, len(self._cache), self._entries)
+
+    def clear_cache(self):
+        self._cache.clear()
+        self._entries = 0
+
+    def degree(self, node):
+        return len(self._expand(node))
+
+    def adj(self, node):
+        return self._expand(node).keys()
+
+    def adj_weights(self, node):
+        # (neighbor, weight) pairs, in the same order as adj(node)
+        return self._expand(node).items()
+
+    def is_adj(self, node1, node2):
+        return node2 in self._expand(node1)
+
+    def weight(self, node1, node2):
+        return self._expand(node1)[node2]
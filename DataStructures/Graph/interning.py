@@ -0,0 +1,127 @@
+from collections import namedtuple
+from collections.abc import Mapping
+
+# dense integer ids for the nodes of a graph: labels[i] is the node with id i, and index[node] == i
+NodeIndex = namedtuple("NodeIndex", ["labels", "index"])
+
+
+def intern_nodes(nodes):
+    """
+    Number `nodes` 0..n-1 in iteration order.
+    Runtime O(V)
+
+    Returns
+    -------
+    NodeIndex
+    """
+    labels = list(nodes)
+    return NodeIndex(labels, {label: i for i, label in enumerate(labels)})
+
+
+def _trace(parent, target, labels):
+    # the nodes on the path from the root of a parent buffer to the id `target`
+    path = [target]
+    while parent[path[-1]] >= 0:
+        path.append(parent[path[-1]])
+    return [labels[v] for v in reversed(path)]
+
+
+class NodeMap(Mapping):
+    """
+    Read only mapping from nodes to the entries of a buffer indexed by integer id.  `algorithms` keeps levels,
+    distances and parents in flat lists and arrays, and returns them wrapped in a NodeMap, so a search doesn't build
+    a dict per result.  A NodeMap compares equal to a dict with the same items.
+    """
+
+    __slots__ = ("_nodes", "_values", "_ids")
+
+    def __init__(self, nodes, values, ids=False):
+        """
+        Parameters
+        ----------
+        nodes : NodeIndex
+        values : sequence
+            The value of every integer id.
+        ids : bool, optional
+            If True, `values` holds integer ids, which are translated to their nodes, and -1 to None.  Defaults to
+            False.
+        """
+        self._nodes = nodes
+        self._values = values
+        self._ids = ids
+
+    def _decode(self, value):
+        if self._ids:
+            return self._nodes.labels[value] if value >= 0 else None
+        return value
+
+    def __getitem__(self, node):
+        return self._decode(self._values[self._nodes.index[node]])
+
+    def __contains__(self, node):
+        return node in self._nodes.index
+
+    def __iter__(self):
+        return iter(self._nodes.labels)
+
+    def __len__(self):
+        return len(self._nodes.labels)
+
+    def __repr__(self):
+        return "NodeMap({0})".format(dict(self.items()))
+
+    # the buffers are read in order, rather than looking every node up again
+
+    def values(self):
+        if self._ids:
+            return [self._decode(value) for value in self._values]
+        return list(self._values)
+
+    def items(self):
+        return list(zip(self._nodes.labels, self.values()))
+
+
+class PathMap(Mapping):
+    """
+    Read only mapping from destinations to their shortest paths from one source, over the parent buffer of the
+    source's search tree.  Paths aren't stored: every lookup traces one back through the tree, so the paths from a
+    source share its O(V) tree instead of copying their common prefixes.  Unreachable destinations map to None.
+    """
+
+    __slots__ = ("_labels", "_keys", "_parent", "_source")
+
+    def __init__(self, labels, keys, parent, source):
+        """
+        Parameters
+        ----------
+        labels : list
+            The node of every integer id.
+        keys : dict
+            The integer id of every destination.
+        parent : sequence of int
+            The parent id of every id in the tree, or -1 if it has none.
+        source : int
+            The id of the root of the tree.
+        """
+        self._labels = labels
+        self._keys = keys
+        self._parent = parent
+        self._source = source
+
+    def __getitem__(self, node):
+        v = self._keys[node]
+        if v != self._source and self._parent[v] < 0:
+            return None
+        return _trace(self._parent, v, self._labels)
+
+    def __contains__(self, node):
+        return node in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return "PathMap({0})".format(dict(self.items()))
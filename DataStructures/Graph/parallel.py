@@ -0,0 +1,85 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+
+from DataStructures.Graph.algorithms import _csr_levels
+
+# the CSR buffers of the graph, set once in every worker process
+_indptr = None
+_indices = None
+
+
+def _init_worker(indptr, indices):
+    global _indptr, _indices
+    _indptr, _indices = indptr, indices
+
+
+def _levels(source):
+    # doubles pickle as raw bytes, which is much cheaper to send back than a list
+    return array("d", _csr_levels(_indptr, _indices, source))
+
+
+def _eccentricity(source):
+    return max(_csr_levels(_indptr, _indices, source))
+
+
+def parallel_eccentricity(frozen, processes):
+    """
+    Compute the eccentricity of every node of a FrozenGraph, running breadth first searches in a pool of `processes`
+    worker processes.
+
+    Every worker receives the CSR buffers once, when it starts.  With the fork start method (the default on Linux)
+    they are inherited copy-on-write rather than copied, so the snapshot is shared by every worker.  Undirected graphs
+    use the bounds of Takes and Kosters, with one batch of pivot searches per round instead of one search, merging
+    the bounds of the whole batch between rounds.  Directed graphs need one search from every node.
+
+    Parameters
+    ----------
+    frozen : FrozenGraph
+    processes : int
+        Number of worker processes.
+
+    Returns
+    -------
+    dict
+        The eccentricity of every node, by label.
+    """
+    indptr, indices = array("q", frozen._indptr), array("q", frozen._indices)
+    n = len(indptr) - 1
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(indptr, indices)) as pool:
+        if frozen.directed:
+            ecc = list(pool.map(_eccentricity, range(n), chunksize=max(1, n // (4 * processes))))
+        else:
+            ecc = _bounded_eccentricity(pool, indptr, processes)
+    return dict(zip(frozen._labels, ecc))
+
+
+def _bounded_eccentricity(pool, indptr, processes):
+    n = len(indptr) - 1
+    degree = [indptr[i + 1] - indptr[i] for i in range(n)]
+    lower = [-inf] * n
+    upper = [inf] * n
+    possibilities = list(range(n))
+
+    while possibilities:
+        # as per Takes and Kosters, take the nodes with the minimum lower bounds and with the maximum upper bounds,
+        # half of the batch each.  ties are broken by selecting the nodes with the highest degree.
+        by_lower = sorted(possibilities, key=lambda u: (lower[u], -degree[u]))
+        by_upper = sorted(possibilities, key=lambda u: (-upper[u], -degree[u]))
+        batch = []
+        for low, high in zip(by_lower, by_upper):
+            for u in low, high:
+                if len(batch) < processes and u not in batch:
+                    batch.append(u)
+            if len(batch) == processes:
+                break
+
+        for u, level in zip(batch, pool.map(_levels, batch)):
+            ecc = max(level)
+            for v in possibilities:
+                lower[v] = max(lower[v], ecc - level[v], level[v])
+                upper[v] = min(upper[v], ecc + level[v])
+
+        possibilities = [v for v in possibilities if lower[v] != upper[v]]
+
+    return lower
@@ -0,0 +1,270 @@
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+
+# binary edge lists are a header (magic, version, flags, edge count) followed by (node1, node2) pairs of
+# little-endian 64-bit integers and, if weighted, one little-endian double per edge.
+# the header is padded to 24 bytes, so everything after it is 8-byte aligned.
+EDGELIST_MAGIC = b"DSEDGES\x00"
+EDGELIST_VERSION = 1
+EDGELIST_WEIGHTED = 1
+_EDGELIST_HEADER = struct.Struct("<8sIIQ")
+
+
+def _is_path(source):
+    return isinstance(source, (str, bytes, os.PathLike))
+
+
+def _is_binary_edgelist(path):
+    with open(path, "rb") as f:
+        return f.read(len(EDGELIST_MAGIC)) == EDGELIST_MAGIC
+
+
+def is_weighted_edgelist(source):
+    # True iff `source` is the path of a binary edge list with weights
+    if not _is_path(source) or not _is_binary_edgelist(source):
+        return False
+    with open(source, "rb") as f:
+        return bool(_EDGELIST_HEADER.unpack(f.read(_EDGELIST_HEADER.size))[2] & EDGELIST_WEIGHTED)
+
+
+def _parse(lines, delimiter, comments):
+    # yield the fields of every non-empty, non-comment line.  lines are stripped first, so that neither the newline
+    # nor surrounding whitespace ends up in a field when there's a delimiter.
+    for line in lines:
+        if comments:
+            line = line.split(comments, 1)[0]
+        line = line.strip()
+        if line:
+            yield line.split(delimiter)
+
+
+def _parse_edges(lines, nodetype, delimiter, comments, weighted):
+    # yield (node1, node2) or, if `weighted`, (node1, node2, weight) for every non-empty, non-comment line
+    for fields in _parse(lines, delimiter, comments):
+        if weighted:
+            yield nodetype(fields[0]), nodetype(fields[1]), float(fields[2])
+        else:
+            yield nodetype(fields[0]), nodetype(fields[1])
+
+
+def _read_lines(path, chunk_size):
+    # read text in chunks of roughly `chunk_size` bytes, so memory use doesn't depend on the size of the file
+    with open(path, "r") as f:
+        while True:
+            lines = f.readlines(chunk_size)
+            if not lines:
+                return
+            yield from lines
+
+
+def read_edgelist(source, nodetype=str, delimiter=None, comments="#", chunk_size=1 << 20, weighted=False):
+    """
+    Lazily read the edges of an edge list.
+    Runtime O(E)
+
+    Parameters
+    ----------
+    source : str, path-like, or iterable
+        Either the path of a text or binary edge list file, or an iterable of lines or of (node1, node2) pairs.
+        Binary files are recognized by their header, see `write_binary_edgelist`.
+    nodetype : function, optional
+        Converts every field of a text edge list into a node.  Defaults to str.
+    delimiter : str, optional
+        Separates the fields of a text edge list.  Defaults to None, meaning any whitespace.
+    comments : str, optional
+        Everything after this in a line of text is ignored.  Defaults to "#".
+    chunk_size : int, optional
+        Approximate number of bytes read at once.  Defaults to 1 MiB.
+    weighted : bool, optional
+        If True, every line of text has a third field holding the weight of the edge.  Binary edge lists record
+        whether they are weighted, so this is ignored for them.  Defaults to False.
+
+    Yields
+    ------
+    tuple
+        (node1, node2), or (node1, node2, weight) for weighted edge lists.
+    """
+    if _is_path(source):
+        if _is_binary_edgelist(source):
+            yield from _read_binary_edgelist(source, chunk_size)
+        else:
+            yield from _parse_edges(_read_lines(source, chunk_size), nodetype, delimiter, comments, weighted)
+        return
+
+    for item in source:
+        if isinstance(item, str):
+            yield from _parse_edges((item,), nodetype, delimiter, comments, weighted)
+        else:
+            yield item
+
+
+def read_adjacency(source, nodetype=str, delimiter=None, comments="#", chunk_size=1 << 20):
+    """
+    Lazily read an adjacency list, in which every line is a node followed by its neighbors.
+    Runtime O(V + E)
+
+    Parameters
+    ----------
+    source : str, path-like, or iterable
+        The path of a text file, or an iterable of lines.
+    nodetype, delimiter, comments, chunk_size
+        As in `read_edgelist`.
+
+    Yields
+    ------
+    list
+        [node, neighbor1, neighbor2, ...] for every line.
+    """
+    lines = _read_lines(source, chunk_size) if _is_path(source) else source
+    for fields in _parse(lines, delimiter, comments):
+        yield [nodetype(field) for field in fields]
+
+
+def _read_binary_edgelist(path, chunk_size):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        magic, version, flags, count = _EDGELIST_HEADER.unpack_from(mm)
+        if version != EDGELIST_VERSION:
+            raise ValueError("unsupported edge list format version {0}".format(version))
+
+        # copy out one chunk of edges at a time, converting straight from the mapped bytes
+        edges = max(1, chunk_size // 16)
+        start = _EDGELIST_HEADER.size
+        weights_start = start + 16 * count
+        for first in range(0, count, edges):
+            last = min(first + edges, count)
+            pairs = _read_array(mm, "q", start + 16 * first, start + 16 * last)
+            if flags & EDGELIST_WEIGHTED:
+                weights = _read_array(mm, "d", weights_start + 8 * first, weights_start + 8 * last)
+                yield from zip(pairs[0::2], pairs[1::2], weights)
+            else:
+                yield from zip(pairs[0::2], pairs[1::2])
+
+
+def _read_array(mm, typecode, start, end):
+    values = array(typecode)
+    values.frombytes(mm[start:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_binary_edgelist(edges, path, weighted=False):
+    """
+    Write `edges` in the binary edge list format, which `read_edgelist` loads without parsing.  Nodes must be
+    integers that fit in 64 bits.
+    Runtime O(E)
+
+    Parameters
+    ----------
+    edges : iterable
+        (node1, node2) pairs, or (node1, node2, weight) triples.
+    path : str or path-like
+        Where to write the edge list.
+    weighted : bool, optional
+        If True, write the weight of every edge.  Otherwise, any weights in `edges` are ignored.  Defaults to False.
+    """
+    count = 0
+    flags = EDGELIST_WEIGHTED if weighted else 0
+    # weights go after every pair, so hold on to them until the pairs are written
+    weights = array("d")
+    with open(path, "wb") as f:
+        f.write(_EDGELIST_HEADER.pack(EDGELIST_MAGIC, EDGELIST_VERSION, flags, 0))
+
+        pairs = array("q")
+        for edge in edges:
+            pairs.append(edge[0])
+            pairs.append(edge[1])
+            if weighted:
+                weights.append(edge[2])
+            count += 1
+            if len(pairs) >= 1 << 16:
+                _write_array(f, pairs)
+                pairs = array("q")
+        _write_array(f, pairs)
+        _write_array(f, weights)
+
+        # now that we know how many edges there are, fill in the header
+        f.seek(0)
+        f.write(_EDGELIST_HEADER.pack(EDGELIST_MAGIC, EDGELIST_VERSION, flags, count))
+
+
+def _write_array(f, values):
+    if sys.byteorder == "big":
+        values.byteswap()
+    values.tofile(f)
+
+
+# saved graphs are a header (magic, version, flags, node count, entry count, label table size), the pickled list of
+# node labels, padded to a multiple of 8 bytes, and then the CSR arrays: node count + 1 offsets and one neighbor id
+# per entry as little-endian 64-bit integers, followed by one little-endian double per entry if weighted.
+GRAPH_MAGIC = b"DSGRAPH\x00"
+GRAPH_VERSION = 1
+GRAPH_WEIGHTED = 1
+GRAPH_DIRECTED = 2
+_GRAPH_HEADER = struct.Struct("<8sIIQQQ")
+
+
+def write_graph(frozen, path):
+    """
+    Write the CSR arrays of a FrozenGraph in the saved graph format.
+    Runtime O(V + E)
+    """
+    labels = pickle.dumps(list(frozen._labels), protocol=pickle.HIGHEST_PROTOCOL)
+    flags = (GRAPH_WEIGHTED if frozen.weighted else 0) | (GRAPH_DIRECTED if frozen.directed else 0)
+    with open(path, "wb") as f:
+        f.write(_GRAPH_HEADER.pack(GRAPH_MAGIC, GRAPH_VERSION, flags, len(frozen._labels), len(frozen._indices),
+                                   len(labels)))
+        f.write(labels)
+        f.write(bytes(-len(labels) % 8))
+        _write_array(f, array("q", frozen._indptr))
+        _write_array(f, array("q", frozen._indices))
+        if frozen.weighted:
+            _write_array(f, array("d", frozen._weights))
+
+
+def read_graph(path, use_mmap=True):
+    """
+    Read a graph written by `write_graph`.
+    Runtime O(V) with `use_mmap`, for unpickling the labels, otherwise O(V + E)
+
+    Parameters
+    ----------
+    path : str or path-like
+    use_mmap : bool, optional
+        If True, the CSR arrays are memoryviews of a read only memory map of the file, so nothing is copied and every
+        process that maps the same file shares its pages.  Otherwise they are read into arrays.  Defaults to True.
+
+    Returns
+    -------
+    tuple
+        (labels, indptr, indices, weights, directed), with weights None if the graph is unweighted.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_GRAPH_HEADER.size)
+        if len(header) < _GRAPH_HEADER.size or header[:len(GRAPH_MAGIC)] != GRAPH_MAGIC:
+            raise ValueError("{0} is not a saved graph".format(repr(path)))
+        magic, version, flags, n, nnz, labels_size = _GRAPH_HEADER.unpack(header)
+        if version != GRAPH_VERSION:
+            raise ValueError("unsupported graph format version {0}".format(version))
+        labels = pickle.loads(f.read(labels_size))
+
+        start = _GRAPH_HEADER.size + labels_size + -labels_size % 8
+        offsets = [start, start + 8 * (n + 1), start + 8 * (n + 1 + nnz), start + 8 * (n + 1 + 2 * nnz)]
+        if use_mmap and sys.byteorder == "little":
+            # the memoryviews keep the map open for as long as they are in use
+            mm = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            indptr = mm[offsets[0]:offsets[1]].cast("q")
+            indices = mm[offsets[1]:offsets[2]].cast("q")
+            weights = mm[offsets[2]:offsets[3]].cast("d") if flags & GRAPH_WEIGHTED else None
+        else:
+            f.seek(0)
+            data = f.read()
+            indptr = _read_array(data, "q", offsets[0], offsets[1])
+            indices = _read_array(data, "q", offsets[1], offsets[2])
+            weights = _read_array(data, "d", offsets[2], offsets[3]) if flags & GRAPH_WEIGHTED else None
+
+    return labels, indptr, indices, weights, bool(flags & GRAPH_DIRECTED)
@@ -0,0 +1,119 @@
+import unittest
+from math import inf
+
+from DataStructures import DiGraph, FrozenGraph
+from DataStructures.Graph import breadth_first_search, is_cyclic, reconstruct_path, topological_sort, \
+    weighted_shortest_paths
+
+
+class DiGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        # a small dependency graph: every edge points from a module to something it imports
+        self.graphdata = {"app": ["cli", "core"],
+                          "cli": ["core", "util"],
+                          "core": ["util"],
+                          "util": [],
+                          "docs": [],
+                          }
+        self.graph = DiGraph(self.graphdata)
+
+    def test_adjacency(self):
+        self.assertCountEqual(self.graph.vertices, self.graphdata, "unexpected vertices")
+        self.assertEqual(len(self.graph.edges), 5, "unexpected number of edges")
+        self.assertTrue(self.graph.is_adj("app", "cli"), "edge (app, cli) unexpectedly missing")
+        self.assertFalse(self.graph.is_adj("cli", "app"), "edge (cli, app) unexpectedly present")
+        self.assertCountEqual(self.graph.predecessors("util"), ["cli", "core"], "unexpected predecessors")
+        self.assertEqual(list(self.graph.successors("core")), ["util"], "unexpected successors")
+
+    def test_degree(self):
+        self.assertEqual(self.graph.out_degree("app"), 2, "unexpected out degree")
+        self.assertEqual(self.graph.in_degree("app"), 0, "unexpected in degree")
+        self.assertEqual(self.graph.in_degree("core"), 2, "unexpected in degree")
+        self.assertEqual(self.graph.degree("core"), 3, "unexpected degree")
+        self.assertEqual(self.graph.degree("docs"), 0, "unexpected degree")
+
+    def test_remove(self):
+        self.graph.add_edge("util", "util")
+        self.graph.remove_node("util")
+        self.assertNotIn("util", self.graph, "removed node still present")
+        self.assertEqual(self.graph.out_degree("core"), 0, "edge to removed node still present")
+        self.graph.remove_edge("app", "core")
+        self.assertEqual(self.graph.in_degree("core"), 1, "removed edge still has a predecessor")
+        with self.assertRaises(KeyError):
+            self.graph.remove_edge("core", "app")
+
+    def test_reverse(self):
+        reverse = self.graph.reverse()
+        self.assertCountEqual(reverse.adj("util"), ["cli", "core"], "reverse did not swap edge directions")
+        self.assertEqual(reverse.in_degree("app"), 2, "unexpected reversed in degree")
+        self.assertIs(reverse.reverse(), self.graph, "reverse of reverse is not the original graph")
+
+        # the view shares the graph's dicts, so it sees later edges
+        self.graph.add_edge("docs", "util")
+        self.assertIn("docs", reverse.adj("util"), "view did not reflect a new edge")
+        with self.assertRaises(TypeError):
+            reverse.add_edge("util", "app")
+
+        # everything that depends on util, directly or not
+        level = breadth_first_search(reverse, "util").level
+        self.assertCountEqual([node for node in level if level[node] < inf], ["util", "core", "cli", "app", "docs"],
+                              "unexpected reverse reachability")
+
+    def test_algorithms(self):
+        order = topological_sort(self.graph)
+        for node1, node2 in self.graph.edges:
+            with self.subTest(edge=(node1, node2)):
+                self.assertLess(order.index(node1), order.index(node2), "topological order violated")
+        self.assertFalse(is_cyclic(self.graph), "acyclic graph found to be cyclic")
+        self.graph.add_edge("util", "app")
+        self.assertTrue(is_cyclic(self.graph), "cycle not found")
+
+        # docs can't be reached, so every eccentricity is infinite until it's gone
+        self.assertEqual(self.graph.eccentricity()["app"], inf, "unexpected eccentricity")
+        self.graph.remove_node("docs")
+        self.assertEqual(self.graph.eccentricity(), {"app": 2, "cli": 2, "core": 3, "util": 2},
+                         "unexpected eccentricity")
+
+    def test_track_components(self):
+        self.graph.track_components()
+        self.assertEqual(self.graph.num_components, 2, "unexpected number of components")
+        self.graph.add_edge("docs", "app")
+        self.assertTrue(self.graph.connected("util", "docs"), "edge direction should not matter")
+        self.graph.remove_node("docs")
+        self.assertEqual(self.graph.num_components, 1, "unexpected number of components")
+
+    def test_contract_edge(self):
+        self.graph.contract_edge("cli", "core")
+        self.assertNotIn("core", self.graph, "contracted node still present")
+        self.assertCountEqual(self.graph.successors("cli"), ["util"], "unexpected successors")
+        self.assertCountEqual(self.graph.predecessors("cli"), ["app"], "unexpected predecessors")
+        # app -> cli and app -> core, and cli -> util and core -> util, were merged
+        self.assertEqual(self.graph.weight("app", "cli"), 2, "unexpected merged weight")
+        self.assertEqual(dict(self.graph.pred_weights("util")), {"cli": 2}, "unexpected merged weight")
+
+        coarse = self.graph.coarsen(levels=1, seed=36)[0].graph
+        self.assertIsInstance(coarse, DiGraph, "coarsened digraph is undirected")
+
+    def test_weighted(self):
+        graph = DiGraph({"a": {"b": 1, "c": 5}, "b": {"c": 1}, "c": {"a": 1}})
+        self.assertTrue(graph.weighted, "graph with weights not marked weighted")
+        self.assertEqual(graph.weight("a", "c"), 5, "unexpected weight")
+        self.assertEqual(dict(graph.pred_weights("c")), {"a": 5, "b": 1}, "unexpected predecessor weights")
+
+        paths = weighted_shortest_paths(graph, "a")
+        self.assertEqual(paths.length, {"a": 0, "b": 1, "c": 2}, "unexpected distances")
+        self.assertEqual(reconstruct_path("c", paths.parent), ["a", "b", "c"], "unexpected path")
+        self.assertEqual(weighted_shortest_paths(graph.reverse(), "a").length["c"], 1, "unexpected reverse distance")
+
+    def test_freeze(self):
+        frozen = self.graph.freeze()
+        self.assertIsInstance(frozen, FrozenGraph, "freeze did not return a FrozenGraph")
+        self.assertTrue(frozen.directed, "frozen digraph is undirected")
+        self.assertCountEqual(frozen.edges, self.graph.edges, "unexpected edges")
+        self.assertEqual(breadth_first_search(frozen, "app").level, breadth_first_search(self.graph, "app").level,
+                         "unexpected levels")
+        self.assertEqual(frozen.eccentricity(), self.graph.eccentricity(), "unexpected eccentricity")
+
+
+if __name__ == "__main__":
+    unittest.main()
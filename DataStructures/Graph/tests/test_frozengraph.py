@@ -0,0 +1,82 @@
+import unittest
+
+from DataStructures import Graph, FrozenGraph
+from DataStructures.Graph import breadth_first_search, depth_first_search, weighted_shortest_paths
+
+
+class FrozenGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.graphdata = {"a": ["b", "e"],
+                          "b": ["a", "f"],
+                          "c": ["d", "f", "g"],
+                          "d": ["c", "g", "h"],
+                          "e": ["a"],
+                          "f": ["b", "c", "g"],
+                          "g": ["c", "d", "f", "h"],
+                          "h": ["d", "g"],
+                          }
+
+        self.graph = Graph(self.graphdata)
+        self.frozen = self.graph.freeze()
+
+    def test_views(self):
+        self.assertIsInstance(self.frozen, FrozenGraph, "freeze did not return a FrozenGraph")
+        self.assertCountEqual(self.frozen.vertices, self.graph.vertices, "unexpected vertices")
+        self.assertCountEqual(self.frozen.edges, self.graph.edges, "unexpected edges")
+        self.assertEqual(len(self.frozen), len(self.graph), "unexpected order")
+        for node in self.graphdata:
+            with self.subTest(node=node):
+                self.assertCountEqual(self.frozen.adj(node), self.graphdata[node], "unexpected adj")
+                self.assertEqual(self.frozen.degree(node), len(self.graphdata[node]), "unexpected degree")
+                self.assertEqual(self.frozen.label(self.frozen.index(node)), node, "interning not reversible")
+
+    def test_is_adj(self):
+        self.assertTrue(self.frozen.is_adj("c", "g"), "edge (c, g) unexpectedly missing")
+        self.assertFalse(self.frozen.is_adj("a", "h"), "edge (a, h) unexpectedly present")
+        self.assertFalse(self.frozen.is_adj("a", "z"), "edge to missing node unexpectedly present")
+        self.assertEqual(self.frozen.weight("c", "g"), 1, "unexpected unweighted edge weight")
+        with self.assertRaises(KeyError):
+            self.frozen.weight("a", "h")
+
+    def test_algorithms(self):
+        for node in self.graphdata:
+            with self.subTest(node=node):
+                self.assertEqual(breadth_first_search(self.frozen, node).level,
+                                 breadth_first_search(self.graph, node).level, "unexpected BFS levels")
+                self.assertEqual(weighted_shortest_paths(self.frozen, node).length,
+                                 breadth_first_search(self.graph, node).level, "unexpected Dijkstra lengths")
+
+        bfs = breadth_first_search(self.frozen, "a", "g")
+        self.assertEqual(bfs.level["g"], 3, "unexpected BFS level with destination")
+        self.assertCountEqual(depth_first_search(self.frozen).keys(), self.graphdata.keys(), "unexpected DFS")
+        self.assertEqual(self.frozen.eccentricity(), self.graph.eccentricity(), "unexpected eccentricity")
+        self.assertEqual(self.frozen.diameter, self.graph.diameter, "unexpected diameter")
+
+    def test_weighted(self):
+        weights = {("a", "b"): 1.5, ("b", "a"): 1.5, ("a", "c"): 4.0, ("c", "a"): 4.0,
+                   ("b", "c"): 2.0, ("c", "b"): 2.0}
+        labels = ["a", "b", "c"]
+        index = {label: i for i, label in enumerate(labels)}
+        indptr, indices, values = [0], [], []
+        for label in labels:
+            for u, v in sorted((edge for edge in weights if edge[0] == label), key=lambda edge: index[edge[1]]):
+                indices.append(index[v])
+                values.append(weights[(u, v)])
+            indptr.append(len(indices))
+
+        frozen = FrozenGraph(labels, indptr, indices, values)
+        self.assertTrue(frozen.weighted, "graph with weights not weighted")
+        self.assertEqual(frozen.weight("a", "c"), 4.0, "unexpected edge weight")
+        paths = weighted_shortest_paths(frozen, "a")
+        self.assertEqual(paths.length, {"a": 0, "b": 1.5, "c": 3.5}, "unexpected Dijkstra lengths")
+        self.assertEqual(paths.parent["c"], "b", "unexpected Dijkstra parent")
+
+    def test_immutable(self):
+        with self.assertRaises(TypeError):
+            self.frozen.add_edge("a", "h")
+        with self.assertRaises(TypeError):
+            self.frozen.add_node("z")
+
+
+if __name__ == '__main__':
+    unittest.main()
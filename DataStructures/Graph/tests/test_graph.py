@@ -1,6 +1,10 @@
+import random
 import unittest
 
-from DataStructures import Graph
+from DataStructures import DiGraph, Graph
+from DataStructures.Graph import ImplicitGraph, a_star, bidirectional_breadth_first_search, bidirectional_dijkstra, \
+    breadth_first_search, multi_source_breadth_first_search, multi_source_eccentricity, reconstruct_path, \
+    shortest_path, shortest_path_length, weighted_shortest_paths
 
 
 class GraphTestCase(unittest.TestCase):
@@ -61,7 +65,467 @@ class GraphTestCase(unittest.TestCase):
     def test_adj(self):
         for node in self.graphdata:
             with self.subTest(node=node):
-                self.assertEqual(self.graph.adj(node), self.graphdata[node],
+                self.assertEqual(list(self.graph.adj(node)), self.graphdata[node],
                                  "node {0} graph adj incorrect".format(repr(node)))
 
+    def test_is_adj(self):
+        for node1, node2 in self.graph.edges:
+            with self.subTest(edge=(node1, node2)):
+                self.assertTrue(self.graph.is_adj(node1, node2), "edge {0} not adjacent".format((node1, node2)))
+        self.assertFalse(self.graph.is_adj("a", "h"), "edge ('a', 'h') unexpectedly adjacent")
 
+    def test_add_edge(self):
+        edges = len(self.graph.edges)
+        self.graph.add_edge("a", "b")
+        self.assertEqual(len(self.graph.edges), edges, "duplicate edge added")
+
+        self.graph.add_edge("a", "z")
+        self.assertIn("z", self.graph, "node not added with edge")
+        self.assertTrue(self.graph.is_adj("z", "a"), "edge not added in both directions")
+        self.assertEqual(list(self.graph.adj("a")), ["b", "e", "z"], "insertion order not kept")
+
+    def test_remove_edge(self):
+        self.graph.remove_edge("c", "g")
+        self.assertFalse(self.graph.is_adj("c", "g"), "removed edge still present")
+        self.assertFalse(self.graph.is_adj("g", "c"), "removed edge still present in reverse")
+        self.assertEqual(len(self.graph.edges), 18, "unexpected number of edges after remove")
+        with self.assertRaises(KeyError):
+            self.graph.remove_edge("c", "g")
+
+    def test_remove_node(self):
+        self.graph.remove_nodes(["g", "a"])
+        self.assertCountEqual(self.graph.vertices, ["b", "c", "d", "e", "f", "h"], "unexpected nodes after remove")
+        for node in self.graph:
+            with self.subTest(node=node):
+                self.assertNotIn("g", self.graph.adj(node), "removed node still adjacent to {0}".format(node))
+        with self.assertRaises(KeyError):
+            self.graph.remove_node("g")
+
+    def test_eccentricity_invalidation(self):
+        # adding and removing edges changes eccentricity, so cached values must be discarded
+        self.assertEqual(self.graph.diameter, 5, "unexpected diameter")
+        self.graph.add_edge("e", "h")
+        self.assertEqual(self.graph.diameter, 3, "diameter not updated after add_edge")
+        self.graph.remove_edge("e", "h")
+        self.assertEqual(self.graph.diameter, 5, "diameter not updated after remove_edge")
+
+    def test_cache(self):
+        version = self.graph.version
+        self.assertCountEqual(self.graph.center, ["b", "f"], "unexpected center")
+        self.assertIs(self.graph.center, self.graph.center, "center not cached")
+        self.assertIs(self.graph.bfs("a"), self.graph.bfs("a"), "breadth first search not cached")
+        self.assertEqual(self.graph.bfs("a").level["h"], 4, "unexpected level")
+        self.assertEqual(tuple(self.graph.degree_statistics()), (1, 4, 20 / 8), "unexpected degree statistics")
+        self.assertEqual(self.graph.version, version, "reads changed the version")
+
+        # every kind of change drops the cache
+        for change in (lambda: self.graph.add_edge("a", "h"), lambda: self.graph.remove_edge("a", "h"),
+                       lambda: self.graph.add_node("x"), lambda: self.graph.remove_node("x"),
+                       lambda: self.graph.contract_edge("a", "e")):
+            with self.subTest(version=self.graph.version):
+                center, tree = self.graph.center, self.graph.bfs("a")
+                change()
+                self.assertGreater(self.graph.version, version, "change did not bump the version")
+                version = self.graph.version
+                self.assertIsNot(self.graph.center, center, "stale center")
+                self.assertIsNot(self.graph.bfs("a"), tree, "stale breadth first search")
+        self.assertEqual(self.graph.bfs("a").level["h"], 4, "unexpected level")
+        self.assertEqual(self.graph.degree_statistics().max, 4, "unexpected degree statistics")
+
+    def test_node_index(self):
+        labels, index = self.graph.node_index()
+        self.assertEqual(labels, self.graph.vertices, "unexpected labels")
+        for node in self.graph:
+            self.assertEqual(self.graph.label(self.graph.index(node)), node, "ids don't round trip")
+        self.assertIs(self.graph.node_index(), self.graph.node_index(), "node index not cached")
+
+        # results are read only maps over the search buffers, and outlive changes to the graph
+        bfs = breadth_first_search(self.graph, "a")
+        self.assertEqual(bfs.level, {"a": 0, "b": 1, "e": 1, "f": 2, "c": 3, "g": 3, "d": 4, "h": 4},
+                         "unexpected levels")
+        self.assertEqual(bfs.parent["a"], None, "unexpected source parent")
+        self.assertEqual(bfs.parent["f"], "b", "unexpected parent")
+        self.graph.remove_node("e")
+        self.assertNotIn("e", self.graph.node_index().index, "removed node still interned")
+        self.assertEqual(bfs.level["e"], 1, "result changed with the graph")
+        with self.assertRaises(TypeError):
+            bfs.level["a"] = 1
+        with self.assertRaises(KeyError):
+            breadth_first_search(self.graph, "e")
+
+    def test_degree_index(self):
+        self.assertEqual(self.graph.max_degree_node(), "g", "unexpected max degree node")
+        self.assertEqual(self.graph.degree_histogram(), [0, 1, 3, 3, 1], "unexpected histogram")
+        self.assertEqual(list(self.graph.nodes_by_degree())[0], "e", "unexpected lowest degree node")
+        self.assertIsNone(self.empty.max_degree_node(), "empty graph has a max degree node")
+
+        # the index follows every kind of edit
+        self.graph.add_edge("a", "x")
+        self.graph.add_edge("x", "h")
+        self.graph.add_edge("x", "c")
+        self.graph.add_edge("x", "d")
+        self.graph.add_edge("x", "e")
+        self.assertEqual(self.graph.max_degree_node(), "x", "index did not follow add_edge")
+        self.graph.remove_node("x")
+        self.assertEqual(self.graph.max_degree_node(), "g", "index did not follow remove_node")
+        self.graph.remove_edge("g", "h")
+        self.graph.add_node("y")
+        self.graph.add_edges([("c", "y"), ("y", "b")])
+        self.assertEqual(self.graph.max_degree_node(), "c", "index did not follow add_edges")
+        degrees = [self.graph.degree(node) for node in self.graph.nodes_by_degree(reverse=True)]
+        self.assertEqual(degrees, sorted(degrees, reverse=True), "nodes not in degree order")
+        self.assertEqual(sum(self.graph.degree_histogram()), self.graph.order, "histogram lost nodes")
+
+    def test_k_core(self):
+        rng = random.Random(47)
+        for graph in self.graph, Graph({u: [v for v in range(80) if rng.random() < 0.08] for u in range(80)}), \
+                DiGraph({u: [v for v in range(40) if rng.random() < 0.1] for u in range(40)}):
+            cores = graph.core_numbers()
+            neighbors = {node: [neighbor for neighbor in graph.adj(node) if neighbor != node] for node in graph}
+            if graph.directed:
+                for node in graph:
+                    neighbors[node] += [neighbor for neighbor in graph.predecessors(node) if neighbor != node]
+
+            # compare with peeling every node of degree < k, for every k
+            for k in range(max(cores.values()) + 2):
+                with self.subTest(graph=type(graph).__name__, k=k):
+                    remaining = set(graph)
+                    removed = True
+                    while removed:
+                        removed = {node for node in remaining
+                                   if sum(1 for neighbor in neighbors[node] if neighbor in remaining) < k}
+                        remaining -= removed
+                    self.assertEqual({node for node in graph if cores[node] >= k}, remaining, "unexpected core")
+            # directed frozen graphs have no predecessors, but the same cores
+            frozen = graph.freeze()
+            self.assertEqual(frozen.core_numbers(), cores, "unexpected cores of the frozen graph")
+            self.assertCountEqual(frozen.k_core().vertices, graph.k_core().vertices, "unexpected frozen max core")
+        self.assertCountEqual(self.graph.k_core().vertices, ["c", "d", "f", "g", "h"], "unexpected max core")
+        self.assertEqual(self.graph.k_core(1).order, 8, "unexpected 1-core")
+
+    def test_parallel_eccentricity(self):
+        serial = self.graph.eccentricity()
+        self.graph.processes = 2
+        # a self loop doesn't change any distance, but does drop the cached eccentricities
+        self.graph.add_edge("a", "a")
+        self.assertEqual(self.graph.eccentricity(), serial, "parallel eccentricity differs from serial")
+        self.assertEqual(self.graph.diameter, 5, "unexpected diameter")
+        self.assertCountEqual(self.graph.periphery, ["d", "e", "h"], "unexpected periphery")
+        with self.assertRaises(ValueError):
+            self.graph.processes = 0
+
+    def test_parallel_eccentricity_random(self):
+        rng = random.Random(38)
+        for directed in False, True:
+            for p in 0.02, 0.1:
+                with self.subTest(directed=directed, p=p):
+                    graph = DiGraph() if directed else Graph()
+                    graph.add_nodes(range(60))
+                    graph.add_edges((u, v) for u in range(60) for v in range(60) if u != v and rng.random() < p)
+                    serial = graph.eccentricity()
+                    # drop the cached result
+                    graph._cache.clear()
+                    self.assertEqual(graph.eccentricity(processes=3), serial,
+                                     "parallel eccentricity differs from serial")
+
+    def test_multi_source_breadth_first_search(self):
+        rng = random.Random(39)
+        for graph in self.graph, self.graph.freeze(), DiGraph({u: [v for v in range(40) if rng.random() < 0.05]
+                                                                for u in range(40)}):
+            # a narrow width splits the sources across several batches
+            levels = multi_source_breadth_first_search(graph, graph.vertices, width=3)
+            ecc = multi_source_eccentricity(graph, width=3)
+            for node in graph.vertices:
+                with self.subTest(graph=type(graph).__name__, node=node):
+                    expected = breadth_first_search(graph, node).level
+                    self.assertEqual(levels[node], expected, "unexpected levels")
+                    self.assertEqual(ecc[node], max(expected.values()), "unexpected eccentricity")
+
+        self.assertEqual(multi_source_eccentricity(self.graph, ["a", "b"]), {"a": 4, "b": 3},
+                         "unexpected eccentricity")
+
+    def test_direction_optimizing_search(self):
+        rng = random.Random(40)
+        dense = Graph({u: [v for v in range(300) if rng.random() < 0.05] for u in range(300)})
+        directed = DiGraph({u: [v for v in range(300) if rng.random() < 0.02] for u in range(300)})
+        for graph in self.graph, dense, dense.freeze(), directed, directed.reverse(), directed.freeze():
+            source = graph.vertices[0]
+            with self.subTest(graph=type(graph).__name__):
+                expected = breadth_first_search(graph, source)
+                bfs = breadth_first_search(graph, source, direction_optimizing=True)
+                self.assertEqual(bfs.level, expected.level, "unexpected levels")
+                # parents may differ, but must be one level closer to the source
+                for node, parent in bfs.parent.items():
+                    if parent is not None:
+                        self.assertTrue(graph.is_adj(parent, node), "parent is not adjacent")
+                        self.assertEqual(bfs.level[parent] + 1, bfs.level[node], "parent at the wrong level")
+
+        bfs = breadth_first_search(self.graph, "a", "g", direction_optimizing=True)
+        self.assertEqual(reconstruct_path("g", bfs.parent), ["a", "b", "f", "g"], "unexpected path")
+
+    def test_shortest_path(self):
+        self.assertEqual(shortest_path(self.graph, "a", "g"), ["a", "b", "f", "g"], "unexpected path")
+        self.assertEqual(shortest_path(self.graph, "a", "a"), ["a"], "unexpected path to the source")
+        self.assertEqual(shortest_path_length(self.graph, "a", "h"), 4, "unexpected length")
+
+        # one source, one destination, and several of each
+        self.assertEqual(shortest_path(self.graph, "e")["c"], ["e", "a", "b", "f", "c"], "unexpected path")
+        self.assertEqual(shortest_path(self.graph, destinations="e")["c"], ["c", "f", "b", "a", "e"],
+                         "unexpected path")
+        self.assertEqual(shortest_path_length(self.graph, ["a", "h", "a"], ["e", "h"]),
+                         {"a": {"e": 1, "h": 4}, "h": {"e": 5, "h": 0}}, "unexpected lengths")
+        self.assertEqual(len(shortest_path(self.graph)), 8, "unexpected number of sources")
+        self.assertEqual(shortest_path_length(self.graph), {node: breadth_first_search(self.graph, node).level
+                                                            for node in self.graph}, "unexpected lengths")
+
+        self.graph.add_node("x")
+        self.assertIsNone(shortest_path(self.graph, "a", "x"), "path to an unreachable node")
+        self.assertEqual(shortest_path_length(self.graph, "x", ["a"]), {"a": float("inf")}, "unexpected length")
+        for destination in ["y"], "y", 3:
+            with self.assertRaises(KeyError):
+                shortest_path(self.graph, "a", destination)
+        implicit = ImplicitGraph(lambda node: [node + 1])
+        self.assertEqual(shortest_path(implicit, 0, 5), [0, 1, 2, 3, 4, 5], "unexpected path on an implicit graph")
+        self.assertEqual(shortest_path_length(implicit, 0, 5), 5, "unexpected length on an implicit graph")
+        weighted = ImplicitGraph(lambda node: [node + 1, node + 2] if node < 10 else [], lambda u, v: (v - u) ** 2)
+        self.assertEqual(shortest_path(weighted, 0, 4), [0, 1, 2, 3, 4], "unexpected path on an implicit graph")
+        self.assertEqual(shortest_path_length(weighted, 0, 4), 4, "unexpected length on an implicit graph")
+        self.assertEqual(shortest_path_length(weighted, 4, 0), float("inf"), "path to an unreachable node")
+        with self.assertRaises(TypeError):
+            shortest_path(implicit, 0, [4, 5])
+
+    def test_bidirectional_breadth_first_search(self):
+        self.assertEqual(bidirectional_breadth_first_search(self.graph, "a", "g"), ["a", "b", "f", "g"],
+                         "unexpected path")
+        self.assertEqual(bidirectional_breadth_first_search(self.graph, "h", "h"), ["h"], "unexpected path to itself")
+        self.graph.add_node("x")
+        self.assertIsNone(bidirectional_breadth_first_search(self.graph, "a", "x"), "path to an unreachable node")
+        with self.assertRaises(KeyError):
+            bidirectional_breadth_first_search(self.graph, "a", "y")
+
+        rng = random.Random(50)
+        graph = Graph({u: [rng.randrange(400) for _ in range(2)] for u in range(400)})
+        directed = DiGraph({u: [rng.randrange(400) for _ in range(3)] for u in range(400)})
+        for g in graph, graph.freeze(), directed, directed.reverse(), directed.freeze(), \
+                Graph.induced_subgraph(graph, lambda g: [u for u in g if u % 7]):
+            nodes = g.vertices
+            for source, destination in zip(rng.sample(nodes, 20), rng.sample(nodes, 20)):
+                with self.subTest(graph=type(g).__name__, source=source, destination=destination):
+                    level = breadth_first_search(g, source).level[destination]
+                    path = bidirectional_breadth_first_search(g, source, destination)
+                    if level == float("inf"):
+                        self.assertIsNone(path, "path to an unreachable node")
+                        continue
+                    self.assertEqual(len(path) - 1, level, "path is not shortest")
+                    self.assertEqual((path[0], path[-1]), (source, destination), "path has the wrong ends")
+                    self.assertTrue(all(g.is_adj(u, v) for u, v in zip(path, path[1:])), "path skips an edge")
+
+        # searching from both ends expands far fewer nodes
+        class CountingGraph(Graph):
+            expanded = 0
+
+            def adj(self, node):
+                CountingGraph.expanded += 1
+                return super().adj(node)
+
+        counting = CountingGraph({u: [rng.randrange(5000) for _ in range(2)] for u in range(5000)})
+        source, destination = max(((0, v) for v in range(5000)), key=lambda pair: counting.bfs(0).level[pair[1]]
+                                   if counting.bfs(0).level[pair[1]] < float("inf") else -1)
+        CountingGraph.expanded = 0
+        breadth_first_search(counting, source, destination)
+        one_way, CountingGraph.expanded = CountingGraph.expanded, 0
+        bidirectional_breadth_first_search(counting, source, destination)
+        self.assertLess(CountingGraph.expanded * 4, one_way, "bidirectional search expanded too many nodes")
+
+    def test_connected_components(self):
+        self.assertEqual(self.graph.connected_components(), [self.graph.vertices], "connected graph split up")
+        self.assertEqual(self.empty.largest_component(), [], "unexpected empty graph component")
+
+        self.graph.add_edges([("x", "y"), ("y", "z"), ("w", "w")])
+        self.assertEqual(len(self.graph.connected_components()), 3, "unexpected number of components")
+        self.assertCountEqual(self.graph.largest_component(), self.graphdata, "unexpected largest component")
+        self.assertCountEqual(self.graph.component_of("z"), ["x", "y", "z"], "unexpected component")
+        self.assertEqual(self.graph.component_of("w"), ["w"], "unexpected component")
+        with self.assertRaises(KeyError):
+            self.graph.component_of("v")
+
+        subgraph = Graph.induced_subgraph(self.graph)
+        self.assertCountEqual(subgraph.vertices, self.graphdata, "unexpected induced subgraph nodes")
+        self.assertCountEqual(subgraph.edges, Graph(self.graphdata).edges, "unexpected induced subgraph edges")
+
+    def test_track_components(self):
+        self.empty.track_components()
+        self.empty.add_nodes("abc")
+        self.assertEqual(self.empty.num_components, 3, "unexpected number of components")
+        self.empty.add_edge("a", "b")
+        self.empty.add_edges([("c", "d"), ("d", "e")])
+        self.empty.add_weighted_edges([("e", "f", 2)])
+        self.assertEqual(self.empty.num_components, 2, "unexpected number of components")
+        self.assertTrue(self.empty.connected("c", "f"), "nodes in the same component found disconnected")
+        self.assertFalse(self.empty.connected("a", "f"), "nodes in different components found connected")
+        self.assertEqual(self.empty.component_size("d"), 4, "unexpected component size")
+
+        # removing an edge can split a component, which is only noticed by a rebuild
+        self.empty.remove_edge("d", "e")
+        self.assertEqual(self.empty.num_components, 3, "removed edge did not split its component")
+        self.assertEqual(self.empty.connected_components(), [["a", "b"], ["c", "d"], ["e", "f"]],
+                         "unexpected components")
+        self.empty.add_edge("b", "c")
+        self.assertTrue(self.empty.connected("a", "d"), "added edge did not merge components after a rebuild")
+
+        # the same queries work without tracking
+        self.graph.add_edge("x", "y")
+        self.assertEqual(self.graph.num_components, 2, "unexpected number of components")
+        self.assertEqual(self.graph.component_size("a"), 8, "unexpected component size")
+
+    def test_contract_edge(self):
+        self.graph.contract_edge("c", "g")
+        self.assertNotIn("g", self.graph, "contracted node still present")
+        self.assertCountEqual(self.graph.adj("c"), ["d", "f", "h"], "unexpected adj")
+        # c and g were both adjacent to d and f
+        self.assertEqual(self.graph.weight("c", "d"), 2, "unexpected merged weight")
+        self.assertEqual(self.graph.weight("f", "c"), 2, "unexpected merged weight")
+        self.assertEqual(self.graph.weight("c", "h"), 1, "unexpected moved weight")
+        self.assertTrue(self.graph.weighted, "merged weights did not make the graph weighted")
+        with self.assertRaises(KeyError):
+            self.graph.contract_edge("a", "c")
+
+    def test_coarsen(self):
+        rng = random.Random(45)
+        graph = Graph()
+        graph.add_nodes(range(500))
+        graph.add_edges((u, (u + 1) % 500) for u in range(500))
+        graph.add_edges((rng.randrange(500), rng.randrange(500)) for _ in range(500))
+        total = sum(weight for node in graph for _, weight in graph.adj_weights(node))
+
+        hierarchy = graph.coarsen(min_order=20, seed=45)
+        self.assertLessEqual(hierarchy[-1].graph.order, 20, "coarsening stopped early")
+        previous = graph
+        for level in hierarchy:
+            with self.subTest(order=level.graph.order):
+                self.assertLess(level.graph.order, previous.order, "level did not shrink")
+                self.assertGreaterEqual(level.graph.order, previous.order / 2, "level shrank more than a matching")
+                self.assertEqual(sum(level.sizes.values()), 500, "supernode sizes lost nodes")
+                # edge weight is only lost inside supernodes
+                coarse = sum(weight for node in level.graph for _, weight in level.graph.adj_weights(node))
+                self.assertLessEqual(coarse, total, "coarse graph gained edge weight")
+            previous = level.graph
+
+        # every node of the coarsest graph gets a part, and every original node gets the part of its supernode
+        parts = {node: i for i, node in enumerate(hierarchy[-1].graph)}
+        projected = Graph.project(parts, hierarchy)
+        self.assertCountEqual(projected, graph.vertices, "projection missed nodes")
+        counts = {}
+        for part in projected.values():
+            counts[part] = counts.get(part, 0) + 1
+        self.assertEqual(sorted(counts.values()), sorted(hierarchy[-1].sizes.values()),
+                         "projected parts don't match supernode sizes")
+
+        self.assertEqual(Graph().coarsen(), [], "empty graph coarsened")
+        self.assertEqual(len(graph.coarsen(levels=2)), 2, "unexpected number of levels")
+
+
+class WeightedGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.graphdata = {"a": {"b": 7, "c": 9, "f": 14},
+                          "b": {"a": 7, "c": 10, "d": 15},
+                          "c": {"a": 9, "b": 10, "d": 11, "f": 2},
+                          "d": {"b": 15, "c": 11, "e": 6},
+                          "e": {"d": 6, "f": 9},
+                          "f": {"a": 14, "c": 2, "e": 9},
+                          }
+
+        self.graph = Graph(self.graphdata)
+
+    def test_weight(self):
+        self.assertTrue(self.graph.weighted, "graph with weights not weighted")
+        self.assertFalse(Graph({"a": ["b"]}).weighted, "graph without weights weighted")
+        self.assertEqual(Graph({"a": ["b"]}).weight("a", "b"), 1, "unexpected unweighted edge weight")
+
+        for node, neighbors in self.graphdata.items():
+            for neighbor, weight in neighbors.items():
+                with self.subTest(edge=(node, neighbor)):
+                    self.assertEqual(self.graph.weight(node, neighbor), weight, "unexpected edge weight")
+            self.assertEqual(dict(self.graph.adj_weights(node)), neighbors, "unexpected adj weights")
+
+        with self.assertRaises(KeyError):
+            self.graph.weight("a", "e")
+
+    def test_add_edge(self):
+        self.graph.add_edge("a", "e", weight=3)
+        self.assertEqual(self.graph.weight("e", "a"), 3, "weight not added in both directions")
+        self.graph.add_edge("a", "e")
+        self.assertEqual(self.graph.weight("a", "e"), 3, "re-adding an edge without a weight changed its weight")
+        self.graph.add_edge("a", "e", weight=4)
+        self.assertEqual(self.graph.weight("a", "e"), 4, "re-adding an edge with a weight did not update it")
+
+        graph = Graph()
+        graph.add_weighted_edges([("x", "y", 0.5), ("y", "z", 1.5)])
+        self.assertTrue(graph.weighted, "graph from weighted edges not weighted")
+        self.assertEqual(graph.weight("z", "y"), 1.5, "unexpected bulk loaded edge weight")
+
+    def test_shortest_paths(self):
+        paths = weighted_shortest_paths(self.graph, "a")
+        self.assertEqual(paths.length, {"a": 0, "b": 7, "c": 9, "d": 20, "e": 20, "f": 11},
+                         "unexpected Dijkstra lengths")
+        self.assertEqual(reconstruct_path("e", paths.parent), ["a", "c", "f", "e"], "unexpected Dijkstra path")
+        self.assertEqual(weighted_shortest_paths(self.graph.freeze(), "a"), paths,
+                         "unexpected Dijkstra result on frozen graph")
+
+        self.assertEqual(a_star(self.graph, "a", "e"), ["a", "c", "f", "e"], "unexpected A* path")
+        self.assertEqual(shortest_path(self.graph, "a", "e"), ["a", "c", "f", "e"], "unexpected path")
+        self.assertEqual(shortest_path_length(self.graph, "a"), paths.length, "unexpected lengths")
+        self.assertIsNone(a_star(Graph({"a": ["b"], "c": []}), "a", "c"), "A* found a path to an unreachable node")
+
+    def test_batched_shortest_paths(self):
+        rng = random.Random(49)
+        graph = Graph()
+        graph.add_weighted_edges((rng.randrange(60), rng.randrange(60), rng.randint(1, 9)) for _ in range(150))
+        directed = DiGraph()
+        directed.add_weighted_edges((rng.randrange(60), rng.randrange(60), rng.randint(1, 9)) for _ in range(150))
+        for g in graph, graph.freeze(), directed, directed.freeze():
+            sources, destinations = rng.sample(g.vertices, 8), rng.sample(g.vertices, 5)
+            paths = shortest_path(g, sources, destinations)
+            lengths = shortest_path_length(g, sources, destinations)
+            for source in sources:
+                expected = weighted_shortest_paths(g, source).length
+                for destination in destinations:
+                    with self.subTest(graph=type(g).__name__, source=source, destination=destination):
+                        path, length = paths[source][destination], lengths[source][destination]
+                        self.assertEqual(length, expected[destination], "unexpected length")
+                        if path is None:
+                            self.assertEqual(length, float("inf"), "no path to a reachable node")
+                            continue
+                        self.assertEqual((path[0], path[-1]), (source, destination), "path has the wrong ends")
+                        self.assertEqual(sum(g.weight(u, v) for u, v in zip(path, path[1:])), length,
+                                         "path is not as long as its length")
+
+    def test_bidirectional_dijkstra(self):
+        self.assertEqual(bidirectional_dijkstra(self.graph, "a", "e"), ["a", "c", "f", "e"], "unexpected path")
+        self.assertEqual(bidirectional_dijkstra(self.graph, "e", "a"), ["e", "f", "c", "a"], "unexpected reverse path")
+        self.assertEqual(shortest_path_length(self.graph, "a", "e"), 20, "unexpected length")
+        self.graph.add_node("x")
+        self.assertIsNone(bidirectional_dijkstra(self.graph, "x", "a"), "path from an unreachable node")
+
+        # b is the first node both searches settle, but it isn't on the shortest path
+        graph = Graph({"s": {"a": 2, "t": 5}, "a": {"b": 2}, "b": {"t": 2}})
+        self.assertEqual(bidirectional_dijkstra(graph, "s", "t"), ["s", "t"], "stopped too early")
+
+        rng = random.Random(50)
+        graph = Graph()
+        graph.add_weighted_edges((rng.randrange(300), rng.randrange(300), rng.random()) for _ in range(700))
+        directed = DiGraph()
+        directed.add_weighted_edges((rng.randrange(300), rng.randrange(300), rng.randint(1, 5)) for _ in range(900))
+        implicit = ImplicitGraph(directed.adj, directed.weight)
+        for g in graph, graph.freeze(), directed, directed.reverse(), directed.freeze(), implicit:
+            nodes = directed.vertices if g is implicit else g.vertices
+            for source, destination in zip(rng.sample(nodes, 20), rng.sample(nodes, 20)):
+                with self.subTest(graph=type(g).__name__, source=source, destination=destination):
+                    expected = weighted_shortest_paths(directed if g is implicit else g, source).length[destination]
+                    path = bidirectional_dijkstra(g, source, destination)
+                    if expected == float("inf"):
+                        self.assertIsNone(path, "path to an unreachable node")
+                        continue
+                    self.assertEqual((path[0], path[-1]), (source, destination), "path has the wrong ends")
+                    self.assertAlmostEqual(sum(g.weight(u, v) for u, v in zip(path, path[1:])), expected,
+                                           msg="path is not shortest")
@@ -0,0 +1,112 @@
+import unittest
+
+from DataStructures import DiGraph, Graph, GraphView
+from DataStructures.Graph import ImplicitGraph, breadth_first_search, shortest_path, shortest_path_length, \
+    topological_sort, weighted_shortest_paths
+
+
+class GraphViewTestCase(unittest.TestCase):
+    def setUp(self):
+        self.graphdata = {"a": ["b", "e"],
+                          "b": ["a", "f"],
+                          "c": ["d", "f", "g"],
+                          "d": ["c", "g", "h"],
+                          "e": ["a"],
+                          "f": ["b", "c", "g"],
+                          "g": ["c", "d", "f", "h"],
+                          "h": ["d", "g"],
+                          }
+        self.graph = Graph(self.graphdata)
+        # drop h, and the edge (c, d)
+        self.view = Graph.subgraph(self.graph, lambda node: node != "h",
+                                   lambda node1, node2: {node1, node2} != {"c", "d"})
+
+    def test_read_api(self):
+        self.assertIsInstance(self.view, GraphView, "subgraph is not a view")
+        self.assertCountEqual(self.view.vertices, ["a", "b", "c", "d", "e", "f", "g"], "unexpected vertices")
+        self.assertNotIn("h", self.view, "filtered node present")
+        self.assertEqual(self.view.adj("c"), ["f", "g"], "unexpected adj")
+        self.assertEqual(self.view.degree("d"), 1, "unexpected degree")
+        self.assertFalse(self.view.is_adj("c", "d"), "filtered edge present")
+        self.assertFalse(self.view.is_adj("d", "h"), "edge to filtered node present")
+        self.assertEqual(len(self.view.edges), 14, "unexpected number of edges")
+        with self.assertRaises(KeyError):
+            self.view.adj("h")
+        with self.assertRaises(KeyError):
+            self.view.weight("c", "d")
+        with self.assertRaises(TypeError):
+            self.view.add_edge("a", "c")
+
+    def test_zero_copy(self):
+        # changes to the parent show through
+        self.graph.add_edge("a", "g")
+        self.assertIn("g", self.view.adj("a"), "view did not reflect a new edge")
+        self.assertEqual(breadth_first_search(self.view, "a").level["c"], 2, "unexpected level")
+
+    def test_algorithms(self):
+        self.assertEqual(breadth_first_search(self.view, "a").level["d"], 4, "unexpected level")
+        self.assertEqual(self.view.diameter, 5, "unexpected diameter")
+        self.assertEqual(len(self.view.connected_components()), 1, "unexpected components")
+        self.assertEqual(self.view.freeze().vertices, self.view.vertices, "unexpected frozen vertices")
+
+        # views of views
+        smaller = Graph.subgraph(self.view, lambda node: node != "a")
+        self.assertCountEqual(map(sorted, smaller.connected_components()), [["b", "c", "d", "f", "g"], ["e"]],
+                              "unexpected components")
+
+    def test_implicit(self):
+        # views of an implicit graph can't number nodes that haven't been seen yet, so they're searched as it is
+        implicit = ImplicitGraph(lambda node: [node + 1, node + 2] if node < 10 else [])
+        # views only have the nodes their parent has seen, so the source has to be seen first
+        implicit.adj(0)
+        view = Graph.subgraph(implicit, lambda node: node % 3 != 1)
+        self.assertEqual(breadth_first_search(view, 0).level[9], 6, "unexpected level")
+        self.assertEqual(shortest_path(view, 0, 9), [0, 2, 3, 5, 6, 8, 9], "unexpected path")
+        self.assertEqual(shortest_path_length(view, 0, 11), 7, "unexpected length")
+
+    def test_cache(self):
+        # eccentricity is computed once, and shared by radius, diameter, center and periphery
+        calls = []
+        compute = self.view._compute_eccentricity
+        self.view._compute_eccentricity = lambda processes: calls.append(1) or compute(processes)
+        self.assertCountEqual(self.view.center, ["b", "f"], "unexpected center")
+        self.assertEqual(self.view.diameter, 5, "unexpected diameter")
+        self.assertEqual(len(self.view.periphery), 2, "unexpected periphery")
+        self.assertEqual(len(calls), 1, "eccentricity computed more than once")
+        self.assertIs(self.view.node_index(), self.view.node_index(), "node index not cached")
+
+        # until the parent changes
+        self.graph.add_edge("e", "g")
+        self.assertEqual(self.view.diameter, 3, "stale diameter")
+        self.assertEqual(len(calls), 2, "eccentricity not recomputed")
+
+    def test_induced_subgraph(self):
+        self.graph.add_edges([("x", "y"), ("y", "z")])
+        induced = Graph.induced_subgraph(self.graph)
+        self.assertCountEqual(induced.vertices, self.graphdata, "unexpected induced subgraph")
+        induced = Graph.induced_subgraph(self.graph, lambda graph: ["a", "b", "x", "y"])
+        self.assertCountEqual(induced.edges, [("a", "b"), ("b", "a"), ("x", "y"), ("y", "x")], "unexpected edges")
+
+    def test_materialize(self):
+        copy = self.view.materialize()
+        self.assertIsInstance(copy, Graph, "materialize did not return a Graph")
+        self.assertNotIsInstance(copy, GraphView, "materialize returned a view")
+        self.assertCountEqual(copy.edges, self.view.edges, "unexpected materialized edges")
+        copy.add_edge("c", "d")
+        self.assertFalse(self.view.is_adj("c", "d"), "materialized copy shares state with the view")
+
+    def test_directed(self):
+        graph = DiGraph({"a": {"b": 1, "c": 4}, "b": {"c": 1, "d": 5}, "c": {"d": 1}, "d": {}})
+        view = Graph.subgraph(graph, filter_edges=lambda node1, node2: (node1, node2) != ("c", "d"))
+        self.assertTrue(view.directed, "view of a directed graph is undirected")
+        self.assertEqual(view.predecessors("d"), ["b"], "unexpected predecessors")
+        self.assertEqual(view.in_degree("c"), 2, "unexpected in degree")
+        self.assertEqual(weighted_shortest_paths(view, "a").length["d"], 6, "unexpected distance")
+        self.assertEqual(topological_sort(view)[0], "a", "unexpected topological order")
+        self.assertIsInstance(view.materialize(), DiGraph, "materialize did not return a DiGraph")
+        self.assertEqual(breadth_first_search(view, "a", direction_optimizing=True).level,
+                         breadth_first_search(view, "a").level, "unexpected levels")
+
+
+if __name__ == "__main__":
+    unittest.main()
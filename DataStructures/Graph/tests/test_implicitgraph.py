@@ -0,0 +1,96 @@
+import unittest
+
+from DataStructures import ImplicitGraph
+from DataStructures.Graph import a_star, breadth_first_search, weighted_shortest_paths
+
+
+def grid(node):
+    # the infinite integer grid, with a wall along x == 3 for -10 <= y < 10
+    x, y = node
+    for neighbor in (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1):
+        if not (neighbor[0] == 3 and -10 <= neighbor[1] < 10):
+            yield neighbor
+
+
+def manhattan(node, destination):
+    return abs(node[0] - destination[0]) + abs(node[1] - destination[1])
+
+
+class ImplicitGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+
+        def neighbors(node):
+            self.calls += 1
+            return grid(node)
+
+        self.graph = ImplicitGraph(neighbors)
+
+    def test_lazy(self):
+        self.assertEqual(len(self.graph), 0, "nodes seen before any expansion")
+        self.assertCountEqual(self.graph.adj((0, 0)), [(1, 0), (-1, 0), (0, 1), (0, -1)], "unexpected adj")
+        self.assertEqual(self.graph.order, 5, "unexpected number of seen nodes")
+        self.assertTrue(self.graph.is_adj((0, 0), (0, 1)), "edge unexpectedly missing")
+        self.assertFalse(self.graph.is_adj((2, 0), (3, 0)), "edge through a wall unexpectedly present")
+        self.assertEqual(self.graph.weight((0, 0), (1, 0)), 1, "unexpected unweighted edge weight")
+        self.assertEqual(self.calls, 2, "cached neighborhood was recomputed")
+
+    def test_a_star(self):
+        path = a_star(self.graph, (0, 0), (6, 0), manhattan)
+        self.assertEqual(path[0], (0, 0), "path does not start at the source")
+        self.assertEqual(path[-1], (6, 0), "path does not end at the destination")
+        # around the wall and back
+        self.assertEqual(len(path) - 1, 6 + 2 * 10, "path is not a shortest path")
+        for node1, node2 in zip(path, path[1:]):
+            self.assertTrue(self.graph.is_adj(node1, node2), "path uses a missing edge")
+        self.assertLess(self.graph.order, 1000, "search explored too much of the grid")
+
+    def test_breadth_first_search(self):
+        bfs = breadth_first_search(self.graph, (0, 0), (2, 2))
+        self.assertEqual(bfs.level[(2, 2)], 4, "unexpected level")
+
+    def test_weighted(self):
+        # moving up costs 2, everything else costs 1
+        graph = ImplicitGraph(grid, weight=lambda node1, node2: 2 if node2[1] > node1[1] else 1)
+        self.assertTrue(graph.weighted, "graph with a weight function not marked weighted")
+        self.assertEqual(graph.weight((0, 0), (0, 1)), 2, "unexpected weight")
+
+        path = a_star(graph, (0, 0), (1, 2), manhattan)
+        self.assertEqual(sum(graph.weight(node1, node2) for node1, node2 in zip(path, path[1:])), 5,
+                         "path is not a shortest path")
+
+        # a finite state space: counting down from 5
+        countdown = ImplicitGraph(lambda n: [n - 1, n - 2] if n > 1 else [], weight=lambda n, m: n - m)
+        self.assertEqual(weighted_shortest_paths(countdown, 5).length[0], 5, "unexpected distance")
+
+    def test_cache(self):
+        graph = ImplicitGraph(grid, cache_size=8)
+        graph.adj((0, 0))
+        graph.adj((10, 10))
+        graph.adj((0, 0))
+        self.assertEqual(tuple(graph.cache_info()), (1, 2, 2, 8), "unexpected cache statistics")
+
+        # (10, 10) is the least recently used, so it goes first
+        graph.adj((20, 20))
+        self.assertEqual(graph.cache_info().entries, 8, "cache grew past its cap")
+        graph.adj((0, 0))
+        graph.adj((10, 10))
+        self.assertEqual(graph.cache_info().misses, 4, "unexpected eviction order")
+
+        # a neighborhood bigger than the cache isn't cached, and doesn't evict anything
+        wide = ImplicitGraph(lambda n: range(n), cache_size=8)
+        wide.adj(3)
+        wide.adj(4)
+        wide.adj(20)
+        self.assertEqual(tuple(wide.cache_info()), (0, 3, 2, 7), "oversized neighborhood changed the cache")
+        wide.adj(20)
+        self.assertEqual(wide.cache_info().misses, 4, "oversized neighborhood was cached")
+
+        graph.clear_cache()
+        self.assertEqual(graph.cache_info().entries, 0, "cache not cleared")
+        with self.assertRaises(ValueError):
+            ImplicitGraph(grid, cache_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+
+from DataStructures import DiGraph, FrozenGraph, Graph
+from DataStructures.Graph import breadth_first_search
+
+
+class ReadWriteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.graphdata = {1: [2, 5],
+                          2: [1, 6],
+                          3: [4, 6, 7],
+                          4: [3, 7, 8],
+                          5: [1],
+                          6: [2, 3, 7],
+                          7: [3, 4, 6, 8],
+                          8: [4, 7],
+                          }
+        self.graph = Graph(self.graphdata)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def assertSameGraph(self, graph, expected, message):
+        self.assertCountEqual(graph.vertices, expected.vertices, message)
+        self.assertCountEqual(graph.edges, expected.edges, message)
+
+    def test_edgelist_iterable(self):
+        # duplicate edges in either direction are dropped
+        edges = [(1, 2), (2, 1), (1, 5), (2, 6), (3, 4), (3, 6), (3, 7), (4, 7), (4, 8), (6, 7), (7, 8), (8, 7)]
+        self.assertSameGraph(Graph.from_edgelist(edges), self.graph, "unexpected graph from edge pairs")
+
+        lines = ["# comment", "1 2", "", "1 5  # trailing comment", "2 6", "3 4", "3 6", "3 7", "4 7", "4 8", "6 7",
+                 "7 8"]
+        self.assertSameGraph(Graph.from_edgelist(lines, nodetype=int), self.graph, "unexpected graph from lines")
+
+    def test_edgelist_text(self):
+        path = self.path("edges.txt")
+        self.graph.write_edgelist(path, delimiter=",")
+        with open(path) as f:
+            self.assertEqual(len(f.readlines()), len(self.graph.edges) // 2, "edges not written once each")
+
+        self.assertSameGraph(Graph.from_edgelist(path, nodetype=int, delimiter=","), self.graph,
+                             "unexpected graph from text edge list")
+
+        # string nodes don't keep the newline, and blank lines are skipped
+        with open(path, "w") as f:
+            f.write("a,b\nb,c\n\n")
+        graph = Graph.from_edgelist(path, delimiter=",")
+        self.assertCountEqual(graph.vertices, ["a", "b", "c"], "unexpected nodes from delimited edge list")
+        with open(path, "w") as f:
+            f.write("a\tb\tc\n\nd\n")
+        graph = Graph.from_adjacency_file(path, delimiter="\t")
+        self.assertCountEqual(graph.vertices, ["a", "b", "c", "d"], "unexpected nodes from delimited adjacency file")
+
+    def test_edgelist_read_only(self):
+        # frozen graphs and views are written through their read API
+        directed = DiGraph({1: [2, 3], 2: [3], 3: [1]})
+        for graph in (self.graph.freeze(), Graph.subgraph(self.graph, lambda node: node != 5), directed.freeze(),
+                      directed.reverse()):
+            with self.subTest(graph=type(graph).__name__, directed=graph.directed):
+                path = self.path("edges.txt")
+                graph.write_edgelist(path)
+                loaded = (DiGraph if graph.directed else Graph).from_edgelist(path, nodetype=int)
+                self.assertCountEqual(loaded.edges, graph.edges, "unexpected edges")
+
+    def test_edgelist_binary(self):
+        path = self.path("edges.bin")
+        self.graph.write_edgelist(path, binary=True)
+        self.assertEqual(os.path.getsize(path), 24 + 16 * len(self.graph.edges) // 2,
+                         "unexpected binary edge list size")
+        self.assertSameGraph(Graph.from_edgelist(path), self.graph, "unexpected graph from binary edge list")
+
+        # empty edge lists
+        Graph().write_edgelist(path, binary=True)
+        self.assertEqual(Graph.from_edgelist(path).order, 0, "unexpected graph from empty binary edge list")
+
+    def test_adjacency_file(self):
+        path = self.path("adjacency.txt")
+        with open(path, "w") as f:
+            for node, neighbors in self.graphdata.items():
+                f.write(" ".join(str(n) for n in [node] + neighbors) + "\n")
+            f.write("9\n")
+
+        graph = Graph.from_adjacency_file(path, nodetype=int)
+        self.graph.add_node(9)
+        self.assertSameGraph(graph, self.graph, "unexpected graph from adjacency file")
+        self.assertEqual(graph.degree(9), 0, "isolated node unexpectedly has neighbors")
+
+    def test_weighted(self):
+        graph = Graph({1: {2: 0.5, 3: 2.0}, 2: {3: 1.25}})
+        for binary in False, True:
+            with self.subTest(binary=binary):
+                path = self.path("weighted.bin" if binary else "weighted.txt")
+                graph.write_edgelist(path, binary=binary)
+                if binary:
+                    loaded = Graph.from_edgelist(path)
+                else:
+                    loaded = Graph.from_edgelist(path, nodetype=int, weighted=True)
+                self.assertTrue(loaded.weighted, "loaded graph not weighted")
+                self.assertSameGraph(loaded, graph, "unexpected weighted graph")
+                for node in graph:
+                    self.assertEqual(dict(loaded.adj_weights(node)), dict(graph.adj_weights(node)),
+                                     "unexpected weights for {0}".format(node))
+
+    def test_save(self):
+        weighted = Graph({"a": {"b": 1.5, "c": 2}, "b": {"c": 0.25}, "d": {}})
+        directed = DiGraph({(0, 1): [(1, 1)], (1, 1): [(0, 1), (2, 2)]})
+        for i, graph in enumerate((self.graph, weighted, directed)):
+            path = self.path("graph{0}.bin".format(i))
+            graph.save(path)
+            for mmap in True, False:
+                with self.subTest(graph=repr(graph), mmap=mmap):
+                    loaded = Graph.load(path, mmap=mmap)
+                    self.assertIsInstance(loaded, FrozenGraph, "load did not return a FrozenGraph")
+                    self.assertEqual(loaded.directed, graph.directed, "unexpected direction")
+                    self.assertEqual(loaded.weighted, graph.weighted, "unexpected weightedness")
+                    self.assertSameGraph(loaded, graph, "unexpected loaded graph")
+                    source = graph.vertices[0]
+                    self.assertEqual(breadth_first_search(loaded, source).level,
+                                     breadth_first_search(graph, source).level, "unexpected levels")
+
+                    thawed = loaded.thaw()
+                    self.assertIsInstance(thawed, type(graph), "unexpected thawed type")
+                    self.assertSameGraph(thawed, graph, "unexpected thawed graph")
+                    for node in graph:
+                        self.assertEqual(dict(thawed.adj_weights(node)), dict(graph.adj_weights(node)),
+                                         "unexpected weights for {0}".format(node))
+                    thawed.add_edge("new", source)
+
+        with open(self.path("bad.bin"), "wb") as f:
+            f.write(b"not a graph")
+        with self.assertRaises(ValueError):
+            Graph.load(self.path("bad.bin"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,2 +1,9 @@
+from DataStructures.Tree.arraybinarysearchtree import ArrayBinarySearchTree
 from DataStructures.Tree.binarysearchtree import BinarySearchTree
+from DataStructures.Tree.bplustree import BPlusTree
 from DataStructures.Tree.heap import Heap, PriorityQueue
+from DataStructures.Tree.intervaltree import IntervalTree
+from DataStructures.Tree.persistenttree import PersistentBinarySearchTree
+from DataStructures.Tree.skiplist import SkipList
+from DataStructures.Tree.splaytree import SplayTree
+from DataStructures.Tree.treap import Treap
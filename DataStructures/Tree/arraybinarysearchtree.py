@@ -0,0 +1,200 @@
+import sys
+from array import array
+
+
+class ArrayBinarySearchTree(object):
+    """
+    Binary search tree with the same API as BinarySearchTree, stored as a struct of arrays instead of node objects.
+
+    Node i is described by keys[i], values[i], left[i] and right[i], where the child arrays hold indices into the
+    other arrays and -1 stands for no child.  Slots freed by `remove()` are kept on a free list and reused by later
+    inserts.  With a `typecode`, keys are stored unboxed in a typed `array`, so trees of integer or float keys use a
+    fraction of the memory of BinarySearchTree, and hold no objects for the cyclic garbage collector to track.
+    """
+
+    def __init__(self, typecode=None):
+        """
+        Parameters
+        ----------
+        typecode : str, optional
+            `array` typecode for the keys, i.e. "q" for 64-bit integers or "d" for floats.  Defaults to None, which
+            stores keys in a list and allows any comparable keys.
+        """
+        self._typecode = typecode
+        self.make_empty()
+
+    def make_empty(self):
+        self._keys = [] if self._typecode is None else array(self._typecode)
+        self._values = []
+        self._left = array("l")
+        self._right = array("l")
+        self._free = array("l")
+        self._root = -1
+        self._count = 0
+        self._removed = None
+        self._order = "pre"
+
+    def _allocate(self, k, v):
+        if self._free:
+            i = self._free.pop()
+            self._keys[i] = k
+            self._values[i] = v
+            self._left[i] = self._right[i] = -1
+        else:
+            i = len(self._values)
+            self._keys.append(k)
+            self._values.append(v)
+            self._left.append(-1)
+            self._right.append(-1)
+        return i
+
+    def _release(self, i):
+        # drop the reference to the value so it can be collected, and remember the slot for reuse
+        self._values[i] = None
+        if self._typecode is None:
+            self._keys[i] = None
+        self._free.append(i)
+
+    def insert(self, key, value):
+        new = self._allocate(key, value)
+        self._count += 1
+
+        if self._root < 0:
+            self._root = new
+            return
+
+        keys, left, right = self._keys, self._left, self._right
+        r = self._root
+        while True:
+            if key < keys[r]:
+                if left[r] < 0:
+                    left[r] = new
+                    return
+                r = left[r]
+            else:  # key >= keys[r]
+                if right[r] < 0:
+                    right[r] = new
+                    return
+                r = right[r]
+
+    def _find(self, key):
+        # returns (parent, index) of `key`, with index -1 if it is not present
+        keys, left, right = self._keys, self._left, self._right
+        parent, r = -1, self._root
+        while r >= 0:
+            # found it
+            if key == keys[r]:
+                return parent, r
+            parent, r = r, left[r] if key < keys[r] else right[r]
+        return parent, -1
+
+    def lookup(self, key):
+        _, i = self._find(key)
+        return None if i < 0 else self._values[i]
+
+    def _replace_child(self, parent, old, new):
+        if parent < 0:
+            self._root = new
+        elif self._left[parent] == old:
+            self._left[parent] = new
+        else:
+            self._right[parent] = new
+
+    def remove(self, key):
+        self._removed = None
+        parent, r = self._find(key)
+        if r < 0:
+            return None
+
+        self._removed = self._values[r]
+        self._count -= 1
+        left, right = self._left, self._right
+
+        # 0 or 1 children: splice the node out
+        if left[r] < 0 or right[r] < 0:
+            self._replace_child(parent, r, left[r] if right[r] < 0 else right[r])
+            self._release(r)
+            return self._removed
+
+        # 2 children: move the minimum of the right subtree into this slot, then splice the minimum out
+        mn_parent, mn = r, right[r]
+        while left[mn] >= 0:
+            mn_parent, mn = mn, left[mn]
+        self._keys[r] = self._keys[mn]
+        self._values[r] = self._values[mn]
+        self._replace_child(mn_parent, mn, right[mn])
+        self._release(mn)
+        return self._removed
+
+    def preorder(self):
+        self._order = "pre"
+        return self
+
+    def inorder(self):
+        self._order = "in"
+        return self
+
+    def postorder(self):
+        self._order = "post"
+        return self
+
+    def __iter__(self):
+        return self._traverse(self._root)
+
+    def _traverse(self, r):
+        # iterative, since an unbalanced tree may be as deep as it is long
+        left, right, values = self._left, self._right, self._values
+        order = self._order
+        stack = [(r, False)] if r >= 0 else []
+        while stack:
+            r, expanded = stack.pop()
+            if expanded:
+                yield values[r]
+                continue
+
+            # push in reverse of the order we want to visit
+            if order == "post":
+                stack.append((r, True))
+            if right[r] >= 0:
+                stack.append((right[r], False))
+            if order == "in":
+                stack.append((r, True))
+            if left[r] >= 0:
+                stack.append((left[r], False))
+            if order == "pre":
+                stack.append((r, True))
+
+    def memory_usage(self):
+        """
+        Estimate the memory used by the tree structure, in bytes.  Values are shared with the caller, so only the
+        references to them are counted.  Boxed keys (no `typecode`) are counted, since the tree keeps them alive.
+
+        Returns
+        -------
+        int
+        """
+        size = sys.getsizeof(self._keys) + sys.getsizeof(self._values) + sys.getsizeof(self._left) \
+            + sys.getsizeof(self._right) + sys.getsizeof(self._free)
+        if self._typecode is None:
+            size += sum(sys.getsizeof(key) for key in self._keys if key is not None)
+        return size
+
+    def __contains__(self, key):
+        return self._find(key)[1] >= 0
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __getitem__(self, key):
+        _, i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i]
+
+    def __delitem__(self, key):
+        if self._find(key)[1] < 0:
+            raise KeyError(key)
+        self.remove(key)
+
+    def __len__(self):
+        return self._count
@@ -1,3 +1,6 @@
+import sys
+
+
 class BinarySearchTree(object):
     class node(object):
 
@@ -114,6 +117,17 @@ class BinarySearchTree(object):
         if self._order == "post":
             yield r._value
 
+    def memory_usage(self):
+        # estimate the memory used by the tree structure in bytes: every node, its attribute dict, and its key.
+        # values are shared with the caller, so they aren't counted.
+        size = 0
+        stack = [self._root] if self._root else []
+        while stack:
+            r = stack.pop()
+            size += sys.getsizeof(r) + sys.getsizeof(r.__dict__) + sys.getsizeof(r._key)
+            stack.extend(child for child in (r._left, r._right) if child)
+        return size
+
     def __contains__(self, key):
         return True if self._lookup(self._root, key) else False
 
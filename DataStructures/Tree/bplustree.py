@@ -0,0 +1,605 @@
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+
+class BPlusTree(object):
+    """
+    Disk-backed B+tree, stored in a single file of fixed-size pages which are read through `mmap`.
+    Keys must be totally ordered and picklable, values must be picklable.
+
+    Updates are copy-on-write: modified pages are never written over, instead new copies are appended to the end of
+    the file by `commit()`, and only then is the root pointer in the meta page switched over.  A crash at any point
+    leaves the file at the last successful commit.
+
+    File layout
+    -----------
+    Page 0 holds two meta records (at offsets 0 and 512), written alternately on every commit.  The record with the
+    highest transaction id and a valid checksum is the current one.  Every other page holds exactly one node: a
+    1-byte node type, a 4-byte payload length, and the pickled node payload.
+    """
+
+    MAGIC = b"DSBPTREE"
+    VERSION = 1
+
+    # magic, version, page size, transaction id, root page, page count, key count, then crc32 of all of that
+    _META = struct.Struct("<8sIIQQQQ")
+    _CRC = struct.Struct("<I")
+    _META_OFFSETS = (0, 512)
+
+    _PAGE_HEADER = struct.Struct("<BI")
+    _LEAF = 1
+    _INTERNAL = 2
+    # the largest page number the meta record can hold, so that size checks don't depend on how many pages exist
+    _MAX_PAGE = 2 ** 64 - 1
+
+    class node(object):
+        __slots__ = ("leaf", "keys", "values")
+
+        def __init__(self, leaf, keys, values):
+            # for internal nodes `values` holds the child page ids, and len(values) == len(keys) + 1
+            self.leaf = leaf
+            self.keys = keys
+            self.values = values
+
+        def copy(self):
+            return BPlusTree.node(self.leaf, list(self.keys), list(self.values))
+
+    def __init__(self, path, page_size=4096, cache_size=1024):
+        """
+        Open the B+tree stored at `path`, creating it if it does not exist.  Opening only reads the meta page, so it
+        takes constant time regardless of the size of the tree.
+
+        Parameters
+        ----------
+        path : str
+            Location of the index file.
+        page_size : int, optional
+            Size in bytes of each page.  Only used when creating a new file, existing files keep their page size.
+            Must be a multiple of 512, and at least 1024.  Defaults to 4096.
+        cache_size : int, optional
+            Maximum number of decoded pages kept in the LRU page cache.  Defaults to 1024.
+        """
+        if page_size < 1024 or page_size % 512:
+            raise ValueError("page_size must be a multiple of 512 and at least 1024")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+
+        self._path = path
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._dirty = {}
+        self._mm = None
+
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "w+b" if new else "r+b")
+
+        if new:
+            self._page_size = page_size
+            self._txn = 0
+            self._committed = (0, 1, 0)
+            self._file.write(bytes(page_size))
+            self._write_meta()
+        else:
+            self._read_meta()
+
+        self._root, self._next_page, self._count = self._committed
+        self._remap()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.rollback()
+            self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (value for _, value in self.range())
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __getitem__(self, key):
+        found = self._find(key)
+        if found is None:
+            raise KeyError(key)
+        return found[1]
+
+    def __delitem__(self, key):
+        if self._find(key) is None:
+            raise KeyError(key)
+        self.remove(key)
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @property
+    def dirty(self):
+        # True iff there are uncommitted changes
+        return (self._root, self._next_page, self._count) != self._committed
+
+    # meta page
+
+    def _write_meta(self):
+        root, page_count, count = self._committed
+        record = self._META.pack(self.MAGIC, self.VERSION, self._page_size, self._txn, root, page_count, count)
+        record += self._CRC.pack(zlib.crc32(record))
+        self._file.seek(self._META_OFFSETS[self._txn % 2])
+        self._file.write(record)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _read_meta(self):
+        best = None
+        for offset in self._META_OFFSETS:
+            self._file.seek(offset)
+            record = self._file.read(self._META.size + self._CRC.size)
+            if len(record) < self._META.size + self._CRC.size:
+                continue
+            body, crc = record[:self._META.size], self._CRC.unpack(record[self._META.size:])[0]
+            if zlib.crc32(body) != crc:
+                continue
+            magic, version, page_size, txn, root, page_count, count = self._META.unpack(body)
+            if magic != self.MAGIC:
+                continue
+            if version != self.VERSION:
+                raise ValueError("unsupported B+tree format version {0}".format(version))
+            if best is None or txn > best[0]:
+                best = (txn, page_size, (root, page_count, count))
+
+        if best is None:
+            raise ValueError("{0} is not a valid B+tree file".format(repr(self._path)))
+
+        self._txn, self._page_size, self._committed = best
+
+    def _remap(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = mmap.mmap(self._file.fileno(), self._committed[1] * self._page_size, access=mmap.ACCESS_READ)
+
+    # page access
+
+    def _encode(self, node):
+        payload = pickle.dumps((node.keys, node.values), protocol=pickle.HIGHEST_PROTOCOL)
+        kind = self._LEAF if node.leaf else self._INTERNAL
+        return self._PAGE_HEADER.pack(kind, len(payload)) + payload
+
+    def _fits(self, node):
+        return len(self._encode(node)) <= self._page_size
+
+    def _store(self, page, node):
+        data = self._encode(node)
+        # checked before writing anything, so an oversized node can't leave a page half written
+        if len(data) > self._page_size:
+            raise ValueError("node of {0} bytes is too large for page size {1}".format(len(data), self._page_size))
+        self._file.seek(page * self._page_size)
+        self._file.write(data + bytes(self._page_size - len(data)))
+
+    def _read(self, page):
+        # uncommitted pages are pinned in memory until the next commit
+        if page in self._dirty:
+            return self._dirty[page]
+
+        node = self._cache.get(page)
+        if node is not None:
+            self._cache.move_to_end(page)
+            return node
+
+        offset = page * self._page_size
+        kind, length = self._PAGE_HEADER.unpack_from(self._mm, offset)
+        start = offset + self._PAGE_HEADER.size
+        keys, values = pickle.loads(self._mm[start:start + length])
+        node = BPlusTree.node(kind == self._LEAF, keys, values)
+
+        self._cache[page] = node
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return node
+
+    def _allocate(self, node):
+        page = self._next_page
+        self._next_page += 1
+        self._dirty[page] = node
+        return page
+
+    def _writable(self, page):
+        # committed pages are immutable, so copy them before changing anything.  pages already copied in this
+        # transaction can be modified in place.
+        if page in self._dirty:
+            return page, self._dirty[page]
+        node = self._read(page).copy()
+        return self._allocate(node), node
+
+    # lookup
+
+    def _find(self, key):
+        # return (key, value) for `key`, or None if it is not present
+        page = self._root
+        if not page:
+            return None
+
+        node = self._read(page)
+        while not node.leaf:
+            node = self._read(node.values[bisect_right(node.keys, key)])
+
+        i = bisect_left(node.keys, key)
+        if i < len(node.keys) and node.keys[i] == key:
+            return node.keys[i], node.values[i]
+        return None
+
+    def lookup(self, key):
+        """
+        Get the value stored under `key`.
+        Runtime O(log n) page reads.
+
+        Returns
+        -------
+        object
+            The value stored under `key`, or None if `key` is not present.
+        """
+        found = self._find(key)
+        return None if found is None else found[1]
+
+    def range(self, lo=None, hi=None):
+        """
+        Lazily iterate over the entries with `lo` <= key < `hi`, in key order.
+        Runtime O(log n + k) page reads for k results.
+
+        Parameters
+        ----------
+        lo : comparable, optional
+            Inclusive lower bound.  Defaults to None, meaning unbounded.
+        hi : comparable, optional
+            Exclusive upper bound.  Defaults to None, meaning unbounded.
+
+        Yields
+        ------
+        tuple
+            (key, value) pairs.
+        """
+        if self._root:
+            yield from self._range(self._root, lo, hi)
+
+    def _range(self, page, lo, hi):
+        node = self._read(page)
+        if node.leaf:
+            start = 0 if lo is None else bisect_left(node.keys, lo)
+            for i in range(start, len(node.keys)):
+                if hi is not None and not node.keys[i] < hi:
+                    return
+                yield node.keys[i], node.values[i]
+            return
+
+        start = 0 if lo is None else bisect_right(node.keys, lo)
+        for i in range(start, len(node.values)):
+            # every key in children[i] is >= keys[i - 1]
+            if hi is not None and i > 0 and not node.keys[i - 1] < hi:
+                return
+            yield from self._range(node.values[i], lo, hi)
+
+    def keys(self):
+        return (key for key, _ in self.range())
+
+    def items(self):
+        return self.range()
+
+    def inorder(self):
+        # entries are always iterated in key order, provided for compatibility with BinarySearchTree
+        return self
+
+    # modification
+
+    def _split(self, node):
+        # split `node` into as many pieces as needed for every piece to fit in a page.
+        # returns a list of (separator, node), where the first separator is None.
+        if self._fits(node):
+            return [(None, node)]
+
+        if node.leaf:
+            if len(node.keys) < 2:
+                raise ValueError("entry is too large for page size {0}".format(self._page_size))
+            mid = len(node.keys) // 2
+            left = BPlusTree.node(True, node.keys[:mid], node.values[:mid])
+            right = BPlusTree.node(True, node.keys[mid:], node.values[mid:])
+            separator = right.keys[0]
+        else:
+            if len(node.keys) < 2:
+                raise ValueError("key is too large for page size {0}".format(self._page_size))
+            mid = len(node.keys) // 2
+            left = BPlusTree.node(False, node.keys[:mid], node.values[:mid + 1])
+            right = BPlusTree.node(False, node.keys[mid + 1:], node.values[mid + 1:])
+            separator = node.keys[mid]
+
+        pieces = self._split(left)
+        rest = self._split(right)
+        pieces.append((separator, rest[0][1]))
+        pieces.extend(rest[1:])
+        return pieces
+
+    def _check_entry(self, key, value):
+        # raise before anything is changed if a split couldn't make room for the entry.  every piece of a split
+        # holds at least one entry, or one separator between two children.
+        if not self._fits(BPlusTree.node(True, [key], [value])):
+            raise ValueError("entry is too large for page size {0}".format(self._page_size))
+        if not self._fits(BPlusTree.node(False, [key], [self._MAX_PAGE, self._MAX_PAGE])):
+            raise ValueError("key is too large for page size {0}".format(self._page_size))
+
+    def _insert(self, page, key, value):
+        # returns the list of (separator, page) which replace `page` in its parent
+        page, node = self._writable(page)
+
+        if node.leaf:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                # a larger value may no longer fit, so it still goes through _split below
+                node.values[i] = value
+            else:
+                node.keys.insert(i, key)
+                node.values.insert(i, value)
+                self._count += 1
+        else:
+            i = bisect_right(node.keys, key)
+            pieces = self._insert(node.values[i], key, value)
+            node.values[i] = pieces[0][1]
+            for offset, (separator, child) in enumerate(pieces[1:]):
+                node.keys.insert(i + offset, separator)
+                node.values.insert(i + offset + 1, child)
+
+        pieces = self._split(node)
+        if len(pieces) == 1:
+            return [(None, page)]
+
+        # the first piece keeps the page we already own
+        self._dirty[page] = pieces[0][1]
+        return [(None, page)] + [(separator, self._allocate(piece)) for separator, piece in pieces[1:]]
+
+    def insert(self, key, value):
+        """
+        Store `value` under `key`, replacing any value already stored under `key`.  The change is not durable until
+        `commit()` is called.
+        Runtime O(log n) page reads.
+        """
+        self._check_entry(key, value)
+        if not self._root:
+            self._root = self._allocate(BPlusTree.node(True, [key], [value]))
+            self._count += 1
+            return
+
+        pieces = self._insert(self._root, key, value)
+        while len(pieces) > 1:
+            # the root split, so grow the tree by one level
+            root = BPlusTree.node(False, [separator for separator, _ in pieces[1:]], [page for _, page in pieces])
+            pieces = [(separator, self._allocate(piece)) for separator, piece in self._split(root)]
+        self._root = pieces[0][1]
+
+    def _remove(self, page, key):
+        # returns the page which replaces `page` in its parent, or None if the subtree is now empty
+        page, node = self._writable(page)
+
+        if node.leaf:
+            i = bisect_left(node.keys, key)
+            del node.keys[i]
+            del node.values[i]
+            self._count -= 1
+            return page if node.keys else None
+
+        i = bisect_right(node.keys, key)
+        child = self._remove(node.values[i], key)
+        if child is not None:
+            node.values[i] = child
+            return page
+
+        # the child is empty, so drop it along with one of its separators
+        del node.values[i]
+        if node.keys:
+            del node.keys[i - 1 if i > 0 else 0]
+        return page if node.values else None
+
+    def remove(self, key):
+        """
+        Remove `key` from the tree.  Underfull pages are not merged, use `compact()` to reclaim the space.  The
+        change is not durable until `commit()` is called.
+        Runtime O(log n) page reads.
+
+        Returns
+        -------
+        object
+            The value that was stored under `key`, or None if `key` was not present.
+        """
+        found = self._find(key)
+        if found is None:
+            return None
+
+        root = self._remove(self._root, key)
+        # collapse internal roots with a single child
+        while root is not None:
+            node = self._read(root)
+            if node.leaf or len(node.values) > 1:
+                break
+            root = node.values[0]
+        self._root = root or 0
+
+        return found[1]
+
+    def make_empty(self):
+        self._root = 0
+        self._count = 0
+
+    def bulk_load(self, items, fill=1.0):
+        """
+        Build the tree from `items`, which must be sorted by strictly increasing key.  Pages are written straight to
+        the file as they are filled, so `items` may be much larger than memory.  The tree must be empty.
+        Runtime O(n).
+
+        Parameters
+        ----------
+        items : iterable
+            (key, value) pairs, sorted by key.
+        fill : float, optional
+            Fraction of each page to fill, in (0, 1].  Leaving free space makes later inserts split less often.
+            Defaults to 1.0.
+
+        Raises
+        ------
+        ValueError
+            If the tree is not empty, or if `items` is not sorted.
+        """
+        if self._root or self._count:
+            raise ValueError("bulk_load requires an empty tree")
+        if not 0 < fill <= 1:
+            raise ValueError("fill must be in (0, 1]")
+
+        self._flush_dirty()
+        budget = int(self._page_size * fill)
+        count = 0
+
+        # (first key, page) of every node on the level currently being built
+        level = []
+        keys, values, size = [], [], 0
+        last = None
+        for key, value in items:
+            if count and not last < key:
+                raise ValueError("bulk_load requires keys in strictly increasing order")
+            last = key
+            count += 1
+
+            keys.append(key)
+            values.append(value)
+            size += self._entry_size(key) + self._entry_size(value)
+            if size > budget:
+                keys, values = self._write_full(level, True, keys, values, budget)
+                size = sum(self._entry_size(k) + self._entry_size(v) for k, v in zip(keys, values))
+
+        while keys:
+            keys, values = self._write_full(level, True, keys, values, budget)
+
+        # build the internal levels on top of the leaves.  internal nodes are stored as the first key of every child,
+        # and the first of those is dropped when writing the page.
+        while len(level) > 1:
+            parents = []
+            keys, children, size = [], [], 0
+            for key, page in level:
+                keys.append(key)
+                children.append(page)
+                size += self._entry_size(key) + 9
+                if size > budget and len(children) > 3:
+                    keys, children = self._write_full(parents, False, keys, children, budget)
+                    size = sum(self._entry_size(k) + 9 for k in keys)
+            while children:
+                keys, children = self._write_full(parents, False, keys, children, budget)
+            level = parents
+
+        self._root = level[0][1] if level else 0
+        self._count = count
+        self.commit()
+
+    def _entry_size(self, item):
+        # approximate number of bytes `item` adds to an encoded page
+        return len(pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)) - 3
+
+    @staticmethod
+    def _make(leaf, keys, values, end):
+        if leaf:
+            return BPlusTree.node(True, keys[:end], values[:end])
+        return BPlusTree.node(False, keys[1:end], values[:end])
+
+    def _write_full(self, level, leaf, keys, values, budget):
+        # write as many of the leading entries as fit in `budget` to a new page and record it in `level`.
+        # returns the entries that did not fit.
+        end = len(keys)
+        node = self._make(leaf, keys, values, end)
+        while end > (1 if leaf else 2) and len(self._encode(node)) > budget:
+            end -= 1
+            node = self._make(leaf, keys, values, end)
+
+        if not self._fits(node):
+            raise ValueError("entry is too large for page size {0}".format(self._page_size))
+
+        page = self._next_page
+        self._next_page += 1
+        self._store(page, node)
+        level.append((keys[0], page))
+        return keys[end:], values[end:]
+
+    # transactions
+
+    def _flush_dirty(self):
+        # write every uncommitted page, in page order, to the end of the file
+        for page in sorted(self._dirty):
+            self._store(page, self._dirty[page])
+        self._dirty.clear()
+
+    def commit(self):
+        """
+        Make every change since the last commit durable.  New pages are written and synced before the meta page is
+        switched over to the new root, so a crash at any point leaves the tree at either the old or the new state.
+        """
+        if not self.dirty and not self._dirty:
+            return
+
+        self._flush_dirty()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self._txn += 1
+        self._committed = (self._root, self._next_page, self._count)
+        self._write_meta()
+        self._remap()
+
+    def rollback(self):
+        """
+        Discard every change since the last commit.
+        """
+        self._dirty.clear()
+        self._root, self._next_page, self._count = self._committed
+
+    def compact(self):
+        """
+        Rewrite the tree into a new, densely packed file, dropping pages left behind by copy-on-write updates, then
+        atomically replace the old file with it.  Pending changes are committed first.
+        Runtime O(n).
+        """
+        self.commit()
+        temp = self._path + ".compact"
+        if os.path.exists(temp):
+            os.remove(temp)
+
+        compacted = BPlusTree(temp, page_size=self._page_size, cache_size=self._cache_size)
+        compacted.bulk_load(self.range())
+        compacted.close()
+
+        self._mm.close()
+        self._mm = None
+        self._file.close()
+        os.replace(temp, self._path)
+
+        self._file = open(self._path, "r+b")
+        self._cache.clear()
+        self._read_meta()
+        self._root, self._next_page, self._count = self._committed
+        self._remap()
+
+    def close(self):
+        """
+        Commit any pending changes and close the file.
+        """
+        if self._file.closed:
+            return
+        self.commit()
+        self._mm.close()
+        self._file.close()
@@ -517,7 +517,8 @@ class PriorityQueue(Heap):
         Parameters
         ----------
         from_list : iterable, optional
-            Initialize the list containing these arguments.  Defaults to None, representing an empty heap.
+            Initialize the Priority Queue with these (priority, item) tuples.  Defaults to None, representing an
+            empty heap.
         max_heap : bool, optional
             If true, initialize heap as a max heap, otherwise initialize a min heap. Defaults to False.
 
@@ -543,7 +544,7 @@ class PriorityQueue(Heap):
         """
         self._h = []
         self._index = {}
-        self._last = 0
+        self._last = -1
         self._max_heap = max_heap
 
         if self._max_heap:
@@ -553,10 +554,11 @@ class PriorityQueue(Heap):
             self._comp = lambda x, y: x[0] < y[0]
             self._prioritized = -inf
 
-        # todo: rewrite this so it actually works
+        # from_list holds (priority, item) tuples
         if from_list:
             self._h += from_list
-            self._last = len(from_list)
+            self._last = len(from_list) - 1
+            self._index = {item: i for i, (_, item) in enumerate(self._h)}
             self._heapify()
 
     def __contains__(self, item):
@@ -689,21 +691,20 @@ class PriorityQueue(Heap):
         if self.is_empty():
             raise IndexError("Cannot extract from empty Priority Queue")
 
-        item = self._h[1][1]
+        item = self._h[0][1]
 
-        # todo: make sure this works
-        if self._last > 1:
+        if self._last > 0:
             # remove extracted item from dict
             del self._index[item]
             # pull up last data to root
-            self._h[1] = self._h[self._last]
+            self._h[0] = self._h[self._last]
             self._last -= 1
             # update index of new root
-            self._index[self._h[1][1]] = 1
+            self._index[self._h[0][1]] = 0
             # remove old last data
             self._h.pop()
             # repair heap
-            self._bubbledown(1)
+            self._bubbledown(0)
         else:
             # the priority queue is now empty
             del self._index[item]
@@ -730,8 +731,7 @@ class PriorityQueue(Heap):
         if self.is_empty():
             raise IndexError("Cannot peek from empty Priority Queue")
 
-        # todo: make sure this doesn't return the priority, just the item
-        return self._h[1]
+        return self._h[0][1]
 
     def get_priority(self, item):
         """
@@ -0,0 +1,222 @@
+from DataStructures.Tree.binarysearchtree import BinarySearchTree
+
+
+class IntervalTree(BinarySearchTree):
+    """
+    Balanced interval tree, for finding every stored interval that overlaps a point or a range.
+
+    Intervals are closed, and are stored in an AVL tree keyed by (start, end).  Every node is augmented with the
+    largest end point in its subtree, which lets `overlapping()` skip every subtree that cannot contain a match, so
+    queries take O(log n + k) for k results.  The BinarySearchTree API is also available, with (start, end) tuples as
+    keys.
+    """
+
+    class node(BinarySearchTree.node):
+
+        def __init__(self, key, value):
+            super().__init__(key, value)
+            self._height = 1
+            self._max = key[1]
+
+    @classmethod
+    def from_intervals(cls, intervals):
+        """
+        Build a tree from a collection of intervals.
+        Runtime O(n log n) to sort the intervals, then O(n) to build a perfectly balanced tree.
+
+        Parameters
+        ----------
+        intervals : iterable
+            (start, end) or (start, end, value) tuples.  A missing value is stored as None.
+
+        Returns
+        -------
+        IntervalTree
+        """
+        entries = []
+        for interval in intervals:
+            start, end = interval[0], interval[1]
+            cls._check(start, end)
+            entries.append(((start, end), interval[2] if len(interval) > 2 else None))
+        entries.sort(key=lambda entry: entry[0])
+
+        def build(lo, hi):
+            # build a balanced subtree from entries[lo:hi]
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            r = cls.node(*entries[mid])
+            r._left = build(lo, mid)
+            r._right = build(mid + 1, hi)
+            return cls._update(r)
+
+        tree = cls()
+        tree._root = build(0, len(entries))
+        tree._count = len(entries)
+        return tree
+
+    @staticmethod
+    def _check(start, end):
+        if end < start:
+            raise ValueError("Interval end {0} is before its start {1}".format(repr(end), repr(start)))
+
+    @staticmethod
+    def _height(r):
+        return r._height if r else 0
+
+    @staticmethod
+    def _update(r):
+        # recompute the height and max end point of `r` from its children
+        r._height = 1 + max(IntervalTree._height(r._left), IntervalTree._height(r._right))
+        r._max = r._key[1]
+        for child in r._left, r._right:
+            if child and r._max < child._max:
+                r._max = child._max
+        return r
+
+    @staticmethod
+    def _rotate_right(r):
+        child = r._left
+        r._left = child._right
+        child._right = IntervalTree._update(r)
+        return IntervalTree._update(child)
+
+    @staticmethod
+    def _rotate_left(r):
+        child = r._right
+        r._right = child._left
+        child._left = IntervalTree._update(r)
+        return IntervalTree._update(child)
+
+    def _balance(self, r):
+        self._update(r)
+        if self._height(r._left) > self._height(r._right) + 1:
+            if self._height(r._left._left) < self._height(r._left._right):
+                r._left = self._rotate_left(r._left)
+            return self._rotate_right(r)
+        if self._height(r._right) > self._height(r._left) + 1:
+            if self._height(r._right._right) < self._height(r._right._left):
+                r._right = self._rotate_right(r._right)
+            return self._rotate_left(r)
+        return r
+
+    def _insert(self, r, k, v):
+        # found where new value goes, so insert it
+        if not r:
+            return type(self).node(k, v)
+        if k < r._key:
+            r._left = self._insert(r._left, k, v)
+        else:  # k >= r._key
+            r._right = self._insert(r._right, k, v)
+        return self._balance(r)
+
+    def _remove_minimum(self, r):
+        # returns (subtree without its minimum, minimum)
+        if not r._left:
+            return r._right, r
+        r._left, mn = self._remove_minimum(r._left)
+        return self._balance(r), mn
+
+    def _remove(self, r, k):
+        if not r:
+            return None
+        # found it
+        if k == r._key:
+            self._removed = r._value
+            self._count -= 1
+            if not r._left:
+                return r._right
+            if not r._right:
+                return r._left
+            # 2 children: the minimum of the right subtree takes this node's place
+            right, mn = self._remove_minimum(r._right)
+            mn._left, mn._right = r._left, right
+            return self._balance(mn)
+        if k < r._key:
+            r._left = self._remove(r._left, k)
+        else:
+            r._right = self._remove(r._right, k)
+        return self._balance(r)
+
+    def _find(self, key):
+        # the node stored under `key`, or None.  values default to None, so presence can't be judged by the value.
+        key = tuple(key)
+        r = self._root
+        while r and r._key != key:
+            r = r._left if key < r._key else r._right
+        return r
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __getitem__(self, key):
+        r = self._find(key)
+        if r is None:
+            raise KeyError(key)
+        return r._value
+
+    def __delitem__(self, key):
+        if self._find(key) is None:
+            raise KeyError(key)
+        self.remove(tuple(key))
+
+    def insert(self, key, value):
+        self._check(*key)
+        super().insert(tuple(key), value)
+
+    def insert_interval(self, start, end, value=None):
+        """
+        Store the closed interval [`start`, `end`] with an associated `value`.
+        Runtime O(log n)
+        """
+        self.insert((start, end), value)
+
+    def remove_interval(self, start, end):
+        """
+        Remove one instance of the interval [`start`, `end`].
+        Runtime O(log n)
+
+        Returns
+        -------
+        object
+            The value stored with the removed interval, or None if it was not present.
+        """
+        return self.remove((start, end))
+
+    def overlapping(self, start, end=None):
+        """
+        Lazily find every stored interval that overlaps the point `start`, or the closed range [`start`, `end`].
+        Intervals are produced in order of (start, end).
+        Runtime O(log n + k) for k results.
+
+        Yields
+        ------
+        tuple
+            (start, end, value) of every overlapping interval.
+        """
+        if end is None:
+            end = start
+        self._check(start, end)
+
+        stack = []
+        r = self._root
+        while stack or r:
+            # go as far left as might still overlap
+            while r and not r._max < start:
+                stack.append(r)
+                r = r._left
+            if not stack:
+                return
+            r = stack.pop()
+
+            # everything further right starts after r, so once r starts past the range, nothing else can overlap
+            if end < r._key[0]:
+                return
+            if not r._key[1] < start:
+                yield r._key[0], r._key[1], r._value
+            r = r._right
+
+    def __iter__(self):
+        if not self._root:
+            return iter(())
+        return self._traverse(self._root)
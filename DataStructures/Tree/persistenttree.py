@@ -0,0 +1,237 @@
+from threading import Lock
+
+
+class PersistentBinarySearchTree(object):
+    """
+    Persistent (immutable) balanced binary search tree, with the same API as BinarySearchTree.
+
+    Nodes are never modified after they are created.  Every update copies only the O(log n) nodes on the path from
+    the root to the changed node, and publishes the new root with a single assignment.  Readers take a `snapshot()`,
+    which is never blocked by, and never sees part of, a concurrent update.  Updates from multiple threads are
+    serialized with a lock.
+
+    The tree is kept AVL balanced, so every operation is O(log n).  As with BinarySearchTree, duplicate keys are
+    allowed and are stored to the right of existing equal keys.
+    """
+
+    class node(object):
+        __slots__ = ("_key", "_value", "_left", "_right", "_height")
+
+        def __init__(self, key, value, left, right):
+            self._key = key
+            self._value = value
+            self._left = left
+            self._right = right
+            self._height = 1 + max(left._height if left else 0, right._height if right else 0)
+
+    def __init__(self):
+        self._lock = Lock()
+        self.make_empty()
+
+    def make_empty(self):
+        # the root and the count are published together, so a reader can never see one without the other
+        self._version = Snapshot(None, 0, "pre")
+
+    @staticmethod
+    def _height(r):
+        return r._height if r else 0
+
+    @staticmethod
+    def _balance(key, value, left, right):
+        # build a new node from the given parts, rotating to restore the AVL property if necessary.
+        # only new nodes are created, so existing versions are never touched.
+        new = PersistentBinarySearchTree.node
+        height = PersistentBinarySearchTree._height
+
+        if height(left) > height(right) + 1:
+            if height(left._left) >= height(left._right):
+                # single right rotation
+                return new(left._key, left._value, left._left, new(key, value, left._right, right))
+            # double rotation
+            pivot = left._right
+            return new(pivot._key, pivot._value,
+                       new(left._key, left._value, left._left, pivot._left),
+                       new(key, value, pivot._right, right))
+
+        if height(right) > height(left) + 1:
+            if height(right._right) >= height(right._left):
+                # single left rotation
+                return new(right._key, right._value, new(key, value, left, right._left), right._right)
+            # double rotation
+            pivot = right._left
+            return new(pivot._key, pivot._value,
+                       new(key, value, left, pivot._left),
+                       new(right._key, right._value, pivot._right, right._right))
+
+        return new(key, value, left, right)
+
+    def _insert(self, r, k, v):
+        # found where new value goes, so insert it
+        if not r:
+            return PersistentBinarySearchTree.node(k, v, None, None)
+        if k < r._key:
+            return self._balance(r._key, r._value, self._insert(r._left, k, v), r._right)
+        else:  # k >= r._key
+            return self._balance(r._key, r._value, r._left, self._insert(r._right, k, v))
+
+    def insert(self, key, value):
+        """
+        Add `value` under `key`.  Copies O(log n) nodes, and does not affect existing snapshots.
+        Runtime O(log n)
+        """
+        with self._lock:
+            version = self._version
+            self._version = Snapshot(self._insert(version._root, key, value), version._count + 1, "pre")
+
+    def _remove_minimum(self, r):
+        # returns the subtree `r` without its minimum node
+        if not r._left:
+            return r._right
+        return self._balance(r._key, r._value, self._remove_minimum(r._left), r._right)
+
+    def _remove(self, r, k, removed):
+        # `removed` collects the removed value, so that the caller can tell whether anything was removed
+        if not r:
+            return None
+        # found it
+        if k == r._key:
+            removed.append(r._value)
+            if not r._left:
+                return r._right
+            if not r._right:
+                return r._left
+            # 2 children: replace with the minimum of the right subtree
+            mn = r._right
+            while mn._left:
+                mn = mn._left
+            return self._balance(mn._key, mn._value, r._left, self._remove_minimum(r._right))
+        if k < r._key:
+            left = self._remove(r._left, k, removed)
+            return self._balance(r._key, r._value, left, r._right) if removed else r
+        else:
+            right = self._remove(r._right, k, removed)
+            return self._balance(r._key, r._value, r._left, right) if removed else r
+
+    def remove(self, key):
+        """
+        Remove one instance of `key`.  Copies O(log n) nodes, and does not affect existing snapshots.
+        Runtime O(log n)
+
+        Returns
+        -------
+        object
+            The value removed, or None if `key` was not present.
+        """
+        with self._lock:
+            version = self._version
+            removed = []
+            root = self._remove(version._root, key, removed)
+            if not removed:
+                return None
+            self._version = Snapshot(root, version._count - 1, "pre")
+            return removed[0]
+
+    def snapshot(self):
+        """
+        Get a read-only view of the current version of the tree.  Taking a snapshot is O(1), and later updates to the
+        tree are never visible through it.
+
+        Returns
+        -------
+        Snapshot
+        """
+        return self._version
+
+    def lookup(self, key):
+        return self._version.lookup(key)
+
+    # traversals return a snapshot in the requested order instead of changing shared state, so concurrent readers
+    # can iterate in different orders
+    def preorder(self):
+        return self._version.preorder()
+
+    def inorder(self):
+        return self._version.inorder()
+
+    def postorder(self):
+        return self._version.postorder()
+
+    def __iter__(self):
+        return iter(self._version)
+
+    def __contains__(self, key):
+        return key in self._version
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __getitem__(self, key):
+        return self._version[key]
+
+    def __delitem__(self, key):
+        temp = self.remove(key)
+        if not temp:
+            raise KeyError(key)
+
+    def __len__(self):
+        return len(self._version)
+
+
+class Snapshot(object):
+    """
+    Read-only version of a PersistentBinarySearchTree.  Snapshots are immutable, so they may be shared freely between
+    threads without locking.
+    """
+
+    __slots__ = ("_root", "_count", "_order")
+
+    def __init__(self, root, count, order):
+        self._root = root
+        self._count = count
+        self._order = order
+
+    def lookup(self, key):
+        r = self._root
+        while r:
+            # found it, so return it
+            if key == r._key:
+                return r._value
+            r = r._left if key < r._key else r._right
+        return None
+
+    def preorder(self):
+        return Snapshot(self._root, self._count, "pre")
+
+    def inorder(self):
+        return Snapshot(self._root, self._count, "in")
+
+    def postorder(self):
+        return Snapshot(self._root, self._count, "post")
+
+    def __iter__(self):
+        return self._traverse(self._root)
+
+    def _traverse(self, r):
+        if not r:
+            return
+        if self._order == "pre":
+            yield r._value
+        yield from self._traverse(r._left)
+        if self._order == "in":
+            yield r._value
+        yield from self._traverse(r._right)
+        if self._order == "post":
+            yield r._value
+
+    def __contains__(self, key):
+        return True if self.lookup(key) else False
+
+    def __getitem__(self, key):
+        temp = self.lookup(key)
+        if not temp:
+            raise KeyError(key)
+        else:
+            return temp
+
+    def __len__(self):
+        return self._count
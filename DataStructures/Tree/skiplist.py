@@ -0,0 +1,249 @@
+from random import random
+
+
+class SkipList(object):
+    """
+    Randomized ordered map, with the BinarySearchTree API plus `split`, `join` and `remove_range`.
+
+    Every link also stores its width (how many positions it skips), so the pieces produced by `split` know their
+    lengths without a traversal.  As with BinarySearchTree, duplicate keys are allowed and are stored after existing
+    equal keys.  Entries are always iterated in key order.
+    """
+
+    MAX_LEVEL = 32
+
+    class node(object):
+        __slots__ = ("_key", "_value", "_forward", "_width")
+
+        def __init__(self, key, value, level):
+            self._key = key
+            self._value = value
+            self._forward = [None] * level
+            # _width[i] is the number of positions between this node and _forward[i].  a missing node is treated as
+            # sitting one past the last position.
+            self._width = [0] * level
+
+    def __init__(self):
+        self.make_empty()
+
+    def make_empty(self):
+        self._head = SkipList.node(None, None, SkipList.MAX_LEVEL)
+        self._head._width = [1] * SkipList.MAX_LEVEL
+        self._level = 1
+        self._count = 0
+        self._removed = None
+
+    @staticmethod
+    def _random_level():
+        level = 1
+        while random() < 0.5 and level < SkipList.MAX_LEVEL:
+            level += 1
+        return level
+
+    def _predecessors(self, key, inclusive=False):
+        # for every level, the last node with key < `key` (or <= `key` if `inclusive`), and its position
+        update = [None] * self._level
+        rank = [0] * self._level
+        x = self._head
+        position = 0
+        for i in range(self._level - 1, -1, -1):
+            while x._forward[i] is not None and (x._forward[i]._key < key
+                                                 or inclusive and not key < x._forward[i]._key):
+                position += x._width[i]
+                x = x._forward[i]
+            update[i] = x
+            rank[i] = position
+        return update, rank
+
+    def _trim(self):
+        while self._level > 1 and self._head._forward[self._level - 1] is None:
+            self._level -= 1
+
+    def insert(self, key, value):
+        """
+        Add `value` under `key`.
+        Expected runtime O(log n)
+        """
+        level = self._random_level()
+        if level > self._level:
+            for i in range(self._level, level):
+                self._head._forward[i] = None
+                self._head._width[i] = self._count + 1
+            self._level = level
+
+        update, rank = self._predecessors(key, inclusive=True)
+        new = SkipList.node(key, value, level)
+        for i in range(level):
+            new._forward[i] = update[i]._forward[i]
+            new._width[i] = update[i]._width[i] - (rank[0] - rank[i])
+            update[i]._forward[i] = new
+            update[i]._width[i] = rank[0] - rank[i] + 1
+        # links passing over the new node are one position wider
+        for i in range(level, self._level):
+            update[i]._width[i] += 1
+
+        self._count += 1
+
+    def _find(self, key):
+        x = self._head
+        for i in range(self._level - 1, -1, -1):
+            while x._forward[i] is not None and x._forward[i]._key < key:
+                x = x._forward[i]
+        x = x._forward[0]
+        if x is not None and x._key == key:
+            return x
+        return None
+
+    def lookup(self, key):
+        found = self._find(key)
+        return None if found is None else found._value
+
+    def remove(self, key):
+        """
+        Remove one instance of `key`.
+        Expected runtime O(log n)
+
+        Returns
+        -------
+        object
+            The value removed, or None if `key` was not present.
+        """
+        self._removed = None
+        update, _ = self._predecessors(key)
+        target = update[0]._forward[0]
+        if target is None or target._key != key:
+            return None
+
+        for i in range(self._level):
+            if update[i]._forward[i] is target:
+                update[i]._width[i] += target._width[i] - 1
+                update[i]._forward[i] = target._forward[i]
+            else:
+                update[i]._width[i] -= 1
+
+        self._count -= 1
+        self._trim()
+        self._removed = target._value
+        return self._removed
+
+    def split(self, key):
+        """
+        Move every entry with key >= `key` into a new SkipList.  This list keeps the entries with key < `key`.
+        Expected runtime O(log n)
+
+        Returns
+        -------
+        SkipList
+            A new list containing the entries with key >= `key`.
+        """
+        update, rank = self._predecessors(key)
+        kept = rank[0]
+
+        other = type(self)()
+        other._level = self._level
+        other._count = self._count - kept
+        for i in range(self._level):
+            other._head._forward[i] = update[i]._forward[i]
+            other._head._width[i] = rank[i] + update[i]._width[i] - kept
+            update[i]._forward[i] = None
+            update[i]._width[i] = kept + 1 - rank[i]
+
+        self._count = kept
+        self._trim()
+        other._trim()
+        return other
+
+    def join(self, other):
+        """
+        Move every entry of `other` into this list, leaving `other` empty.  Every key in `other` must be >= every key
+        in this list.
+        Expected runtime O(log n)
+
+        Raises
+        ------
+        ValueError
+            If the key ranges of the two lists overlap.
+        """
+        level = max(self._level, other._level)
+        for i in range(self._level, level):
+            self._head._forward[i] = None
+            self._head._width[i] = self._count + 1
+
+        # the last node on every level, and its position
+        tail = [None] * level
+        rank = [0] * level
+        x = self._head
+        position = 0
+        for i in range(level - 1, -1, -1):
+            while x._forward[i] is not None:
+                position += x._width[i]
+                x = x._forward[i]
+            tail[i] = x
+            rank[i] = position
+
+        first = other._head._forward[0]
+        if first is not None and tail[0] is not self._head and first._key < tail[0]._key:
+            raise ValueError("Cannot join lists with overlapping key ranges")
+
+        for i in range(level):
+            if i < other._level:
+                width = other._head._width[i]
+            else:
+                width = other._count + 1
+            tail[i]._forward[i] = other._head._forward[i]
+            tail[i]._width[i] = self._count - rank[i] + width
+
+        self._level = level
+        self._count += other._count
+        other.make_empty()
+
+    def remove_range(self, lo, hi):
+        """
+        Remove every entry with `lo` <= key < `hi`.
+        Expected runtime O(log n)
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        middle = self.split(lo)
+        right = middle.split(hi)
+        self.join(right)
+        return len(middle)
+
+    def inorder(self):
+        # entries are always iterated in key order, provided for compatibility with BinarySearchTree
+        return self
+
+    def __iter__(self):
+        x = self._head._forward[0]
+        while x is not None:
+            yield x._value
+            x = x._forward[0]
+
+    def keys(self):
+        x = self._head._forward[0]
+        while x is not None:
+            yield x._key
+            x = x._forward[0]
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __getitem__(self, key):
+        found = self._find(key)
+        if found is None:
+            raise KeyError(key)
+        return found._value
+
+    def __delitem__(self, key):
+        if self._find(key) is None:
+            raise KeyError(key)
+        self.remove(key)
+
+    def __len__(self):
+        return self._count
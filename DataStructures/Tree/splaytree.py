@@ -0,0 +1,153 @@
+from DataStructures.Tree.binarysearchtree import BinarySearchTree
+
+
+class SplayTree(BinarySearchTree):
+    """
+    Self-adjusting binary search tree, with the same API as BinarySearchTree.
+
+    Every insert, lookup and remove splays the accessed key to the root, so recently and frequently accessed keys
+    stay near the top of the tree.  Operations are amortized O(log n), and repeated access to a small set of hot
+    keys is close to O(1).  Splaying is done top-down and iteratively, so deep trees never hit the recursion limit.
+    """
+
+    def _splay(self, r, k):
+        # top-down splay: bring the node with key `k` (or the last node on its search path) to the root
+        if not r:
+            return None
+
+        # `header` collects the left and right trees while walking down
+        header = BinarySearchTree.node(None, None)
+        left = right = header
+
+        while True:
+            if k < r._key:
+                if not r._left:
+                    break
+                if k < r._left._key:
+                    # rotate right
+                    child = r._left
+                    r._left = child._right
+                    child._right = r
+                    r = child
+                    if not r._left:
+                        break
+                # link right
+                right._left = r
+                right = r
+                r = r._left
+            elif r._key < k:
+                if not r._right:
+                    break
+                if r._right._key < k:
+                    # rotate left
+                    child = r._right
+                    r._right = child._left
+                    child._left = r
+                    r = child
+                    if not r._right:
+                        break
+                # link left
+                left._right = r
+                left = r
+                r = r._right
+            else:
+                break
+
+        # reassemble
+        left._right = r._left
+        right._left = r._right
+        r._left = header._right
+        r._right = header._left
+        return r
+
+    def _splay_max(self, r):
+        # top-down splay of the maximum of `r` to its root, which leaves the root without a right child.  splaying
+        # for a key would stop at an equal key instead, which isn't the maximum when keys are duplicated.
+        header = BinarySearchTree.node(None, None)
+        left = header
+
+        while r._right:
+            # rotate left
+            child = r._right
+            r._right = child._left
+            child._left = r
+            r = child
+            if not r._right:
+                break
+            # link left
+            left._right = r
+            left = r
+            r = r._right
+
+        # reassemble
+        left._right = r._left
+        r._left = header._right
+        return r
+
+    def insert(self, key, value):
+        new = BinarySearchTree.node(key, value)
+        r = self._splay(self._root, key)
+
+        if r:
+            if key < r._key:
+                new._left = r._left
+                new._right = r
+                r._left = None
+            else:  # key >= r._key
+                new._right = r._right
+                new._left = r
+                r._right = None
+
+        self._root = new
+        self._count += 1
+
+    def lookup(self, key):
+        self._root = self._splay(self._root, key)
+        if self._root and self._root._key == key:
+            return self._root._value
+        return None
+
+    def remove(self, key):
+        self._removed = None
+        r = self._splay(self._root, key)
+        if not r or r._key != key:
+            self._root = r
+            return None
+
+        self._removed = r._value
+        self._count -= 1
+
+        if not r._left:
+            self._root = r._right
+        else:
+            self._root = self._splay_max(r._left)
+            self._root._right = r._right
+
+        return self._removed
+
+    def __contains__(self, key):
+        return True if self.lookup(key) else False
+
+    def __iter__(self):
+        return self._traverse(self._root)
+
+    def _traverse(self, r):
+        # iterative traversal, since splay trees may temporarily be as deep as they are long
+        stack = [(r, False)] if r else []
+        while stack:
+            r, expanded = stack.pop()
+            if expanded:
+                yield r._value
+                continue
+
+            # push in reverse of the order we want to visit
+            if self._order == "post":
+                stack.append((r, True))
+            if r._right:
+                stack.append((r._right, False))
+            if self._order == "in":
+                stack.append((r, True))
+            if r._left:
+                stack.append((r._left, False))
+            if self._order == "pre":
+                stack.append((r, True))
@@ -0,0 +1,79 @@
+import random
+
+
+class SplittableMapTests(object):
+    """
+    Tests shared by the ordered maps with `split`, `join` and `remove_range`.  Mix into a unittest.TestCase, and set
+    `map_class` to the map under test.
+    """
+
+    map_class = None
+
+    def setUp(self):
+        self.tree = self.map_class()
+
+        random.seed(29)
+        self.keys = random.sample(range(1, 5000), 1000)
+        for key in self.keys:
+            self.tree.insert(key, key * 10)
+
+    def check(self, tree, keys, name):
+        # contents, order and length must all agree
+        self.assertEqual(list(tree.inorder()), [key * 10 for key in sorted(keys)], "unexpected {0} values".format(name))
+        self.assertEqual(len(tree), len(keys), "unexpected {0} length".format(name))
+        for key in keys[:50]:
+            self.assertEqual(tree.lookup(key), key * 10, "unexpected {0} value for {1}".format(name, key))
+
+    def test_lookup(self):
+        self.check(self.tree, self.keys, "tree")
+        self.assertIsNone(self.tree.lookup(-1), "missing key unexpectedly found")
+        with self.assertRaises(KeyError):
+            self.tree[-1]
+
+    def test_remove(self):
+        for key in self.keys[:500]:
+            self.assertEqual(self.tree.remove(key), key * 10, "unexpected removed value for {0}".format(key))
+        self.assertIsNone(self.tree.remove(self.keys[0]), "removing a missing key returned a value")
+        self.check(self.tree, self.keys[500:], "tree after remove")
+
+    def test_duplicates(self):
+        self.tree.insert(self.keys[0], -1)
+        self.assertEqual(len(self.tree), len(self.keys) + 1, "duplicate key not inserted")
+        self.tree.remove(self.keys[0])
+        self.assertIn(self.keys[0], self.tree, "both duplicates removed")
+
+    def test_split(self):
+        right = self.tree.split(2500)
+        self.check(self.tree, [key for key in self.keys if key < 2500], "left split")
+        self.check(right, [key for key in self.keys if key >= 2500], "right split")
+
+        # both halves are still fully usable
+        right.insert(2500, 25000)
+        self.tree.insert(-1, -10)
+        self.check(right, [key for key in self.keys if key >= 2500] + [2500], "right split after insert")
+        self.check(self.tree, [key for key in self.keys if key < 2500] + [-1], "left split after insert")
+
+    def test_join(self):
+        right = self.tree.split(2500)
+        self.tree.join(right)
+        self.check(self.tree, self.keys, "joined")
+        self.assertEqual(len(right), 0, "joined tree not emptied")
+
+        other = self.map_class()
+        other.insert(0, 0)
+        with self.assertRaises(ValueError):
+            self.tree.join(other)
+
+        other = self.map_class()
+        for key in range(6000, 6100):
+            other.insert(key, key * 10)
+        self.tree.join(other)
+        self.check(self.tree, self.keys + list(range(6000, 6100)), "joined with new keys")
+
+    def test_remove_range(self):
+        removed = self.tree.remove_range(1000, 3000)
+        remaining = [key for key in self.keys if not 1000 <= key < 3000]
+        self.assertEqual(removed, len(self.keys) - len(remaining), "unexpected number of entries removed")
+        self.check(self.tree, remaining, "tree after remove_range")
+        self.assertEqual(self.tree.remove_range(1000, 3000), 0, "removed entries from an empty range")
+
@@ -0,0 +1,64 @@
+import gc
+import random
+import unittest
+
+from DataStructures import ArrayBinarySearchTree, BinarySearchTree
+
+
+class ArrayBinarySearchTreeTestCase(unittest.TestCase):
+    def setUp(self):
+        random.seed(30)
+        self.keys = random.sample(range(1, 5000), 1000)
+
+        self.trees = [(ArrayBinarySearchTree(), "object keys"),
+                      (ArrayBinarySearchTree(typecode="q"), "integer keys"),
+                      (ArrayBinarySearchTree(typecode="d"), "float keys")]
+        self.reference = BinarySearchTree()
+        for key in self.keys:
+            self.reference.insert(key, key * 10)
+            for tree, _ in self.trees:
+                tree.insert(key, key * 10)
+
+    def test_lookup(self):
+        for tree, name in self.trees:
+            with self.subTest(name=name):
+                for key in self.keys:
+                    self.assertEqual(tree.lookup(key), key * 10, "unexpected value for key {0}".format(key))
+                self.assertIsNone(tree.lookup(-1), "missing key unexpectedly found")
+                self.assertEqual(len(tree), len(self.keys), "unexpected length")
+
+    def test_traversals(self):
+        # same insertion order, so the same shape as BinarySearchTree
+        for tree, name in self.trees:
+            with self.subTest(name=name):
+                self.assertEqual(list(tree.preorder()), list(self.reference.preorder()), "preorder differs")
+                self.assertEqual(list(tree.inorder()), list(self.reference.inorder()), "inorder differs")
+                self.assertEqual(list(tree.postorder()), list(self.reference.postorder()), "postorder differs")
+
+    def test_remove(self):
+        for tree, name in self.trees:
+            with self.subTest(name=name):
+                for key in self.keys[:500]:
+                    self.assertEqual(tree.remove(key), key * 10, "unexpected removed value for {0}".format(key))
+                self.assertIsNone(tree.remove(self.keys[0]), "removing a missing key returned a value")
+                self.assertEqual(list(tree.inorder()), [key * 10 for key in sorted(self.keys[500:])],
+                                 "unexpected values after remove")
+
+                # freed slots are reused
+                slots = len(tree._values)
+                for key in self.keys[:500]:
+                    tree.insert(key, key * 10)
+                self.assertEqual(len(tree._values), slots, "freed slots not reused")
+                self.assertEqual(list(tree.inorder()), [key * 10 for key in sorted(self.keys)],
+                                 "unexpected values after reinsert")
+
+    def test_memory_usage(self):
+        typed = self.trees[1][0]
+        self.assertLess(typed.memory_usage() * 3, self.reference.memory_usage(),
+                        "typed array tree not much smaller than BinarySearchTree")
+        # typed keys are stored unboxed, so there are no key objects for the garbage collector to visit
+        self.assertEqual(gc.get_referents(typed._keys), [type(typed._keys)], "typed keys unexpectedly stored as objects")
+
+
+if __name__ == '__main__':
+    unittest.main()
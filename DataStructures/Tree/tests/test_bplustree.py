@@ -0,0 +1,158 @@
+import os
+import random
+import tempfile
+import unittest
+
+from DataStructures import BPlusTree
+
+
+class BPlusTreeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "index.db")
+
+        # small pages so that the tree is several levels deep
+        self.tree = BPlusTree(self.path, page_size=1024, cache_size=8)
+
+        random.seed(26)
+        self.keys = random.sample(range(10000), 2000)
+        for key in self.keys:
+            self.tree.insert(key, str(key))
+
+    def tearDown(self):
+        self.tree.close()
+        self.directory.cleanup()
+
+    def reopen(self):
+        self.tree.close()
+        self.tree = BPlusTree(self.path, cache_size=8)
+
+    def test_lookup(self):
+        for key in self.keys[:100]:
+            with self.subTest(key=key):
+                self.assertEqual(self.tree.lookup(key), str(key), "unexpected value for key {0}".format(key))
+        self.assertIsNone(self.tree.lookup(-1), "missing key unexpectedly found")
+        self.assertEqual(len(self.tree), len(self.keys), "unexpected tree length")
+
+    def test_iteration(self):
+        self.assertEqual(list(self.tree.keys()), sorted(self.keys), "keys not iterated in order")
+        self.assertEqual(list(self.tree), [str(key) for key in sorted(self.keys)], "values not iterated in order")
+
+    def test_range(self):
+        expected = [(key, str(key)) for key in sorted(self.keys) if 2500 <= key < 5000]
+        self.assertEqual(list(self.tree.range(2500, 5000)), expected, "unexpected range")
+        self.assertEqual(list(self.tree.range(20000)), [], "range above every key not empty")
+
+    def test_replace(self):
+        self.tree.insert(self.keys[0], "replaced")
+        self.assertEqual(self.tree[self.keys[0]], "replaced", "value not replaced")
+        self.assertEqual(len(self.tree), len(self.keys), "replacing a value changed the length")
+
+    def test_replace_larger(self):
+        # a larger value can overflow the leaf, which must split rather than fail to commit
+        tree = BPlusTree(os.path.join(self.directory.name, "small.db"), page_size=1024)
+        for key in range(5):
+            tree.insert(key, "x" * 150)
+        tree.commit()
+        tree.insert(3, "y" * 900)
+        tree.commit()
+        self.assertEqual(tree[3], "y" * 900, "value not replaced")
+        self.assertEqual(list(tree.keys()), list(range(5)), "unexpected keys after replace")
+        self.assertEqual(len(tree), 5, "replacing a value changed the length")
+        tree.close()
+
+    def test_entry_too_large(self):
+        tree = BPlusTree(os.path.join(self.directory.name, "small.db"), page_size=1024)
+        with self.assertRaises(ValueError):
+            tree.insert(1, "x" * 2000)
+        self.assertEqual(len(tree), 0, "oversized entry was added")
+        tree.commit()
+
+        # the entry is rejected before the transaction is touched, whether the root was copied in it or not
+        for commit in False, True:
+            tree.insert(1, "a")
+            if commit:
+                tree.commit()
+            with self.subTest(committed=commit):
+                with self.assertRaises(ValueError):
+                    tree.insert(2, "x" * 5000)
+                with self.assertRaises(ValueError):
+                    tree.insert("y" * 5000, "b")
+                self.assertEqual(len(tree), 1, "oversized entry was counted")
+                self.assertEqual(list(tree.items()), [(1, "a")], "unexpected entries")
+                tree.commit()
+                self.assertEqual(list(tree.items()), [(1, "a")], "unexpected entries after commit")
+            tree.remove(1)
+            tree.commit()
+        tree.close()
+
+    def test_long_keys(self):
+        # separators more than half a page long still leave internal nodes splittable
+        tree = BPlusTree(os.path.join(self.directory.name, "small.db"), page_size=1024)
+        keys = ["{0:0>600}".format(i) for i in range(60)]
+        for key in keys:
+            tree.insert(key, 1)
+        tree.commit()
+        self.assertEqual(list(tree.keys()), keys, "unexpected keys")
+        self.assertEqual(len(tree), 60, "unexpected tree length")
+        tree.close()
+
+    def test_remove(self):
+        for key in self.keys[:1500]:
+            self.assertEqual(self.tree.remove(key), str(key), "unexpected removed value for {0}".format(key))
+        self.assertIsNone(self.tree.remove(self.keys[0]), "removing a missing key returned a value")
+        self.assertEqual(list(self.tree.keys()), sorted(self.keys[1500:]), "unexpected keys after remove")
+        with self.assertRaises(KeyError):
+            del self.tree[self.keys[0]]
+
+    def test_persistence(self):
+        self.reopen()
+        self.assertEqual(list(self.tree.keys()), sorted(self.keys), "keys not persisted")
+
+    def test_rollback(self):
+        self.tree.commit()
+        self.tree.insert(-5, "uncommitted")
+        self.tree.remove(self.keys[0])
+        self.tree.rollback()
+        self.assertNotIn(-5, self.tree, "rolled back insert still present")
+        self.assertIn(self.keys[0], self.tree, "rolled back remove still applied")
+
+        # uncommitted changes are lost if the process dies before commit
+        self.tree.insert(-5, "uncommitted")
+        self.tree._file.flush()
+        crashed = BPlusTree(self.path)
+        self.assertNotIn(-5, crashed, "uncommitted insert visible after reopening")
+        crashed.rollback()
+        crashed._mm.close()
+        crashed._file.close()
+
+    def test_bulk_load(self):
+        path = os.path.join(self.directory.name, "bulk.db")
+        with BPlusTree(path, page_size=1024) as tree:
+            tree.bulk_load(((key, key * 2) for key in range(5000)), fill=0.7)
+            self.assertEqual(len(tree), 5000, "unexpected length after bulk load")
+            tree.insert(2500.5, "new")
+
+        with BPlusTree(path) as tree:
+            self.assertEqual(tree.lookup(4321), 8642, "unexpected value after bulk load")
+            self.assertEqual(tree.lookup(2500.5), "new", "insert after bulk load not persisted")
+            self.assertEqual(len(list(tree.range())), 5001, "unexpected number of entries after bulk load")
+            with self.assertRaises(ValueError):
+                tree.bulk_load([(1, 1)])
+
+        with self.assertRaises(ValueError):
+            BPlusTree(os.path.join(self.directory.name, "unsorted.db")).bulk_load([(2, 2), (1, 1)])
+
+    def test_compact(self):
+        # every commit leaves the replaced pages behind
+        for key in self.keys[:1000]:
+            self.tree.remove(key)
+            self.tree.commit()
+        size = os.path.getsize(self.path)
+        self.tree.compact()
+        self.assertLess(os.path.getsize(self.path), size, "compact did not shrink the file")
+        self.assertEqual(list(self.tree.keys()), sorted(self.keys[1000:]), "unexpected keys after compact")
+
+
+if __name__ == '__main__':
+    unittest.main()
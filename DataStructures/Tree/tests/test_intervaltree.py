@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from DataStructures import IntervalTree
+
+
+class IntervalTreeTestCase(unittest.TestCase):
+    def setUp(self):
+        random.seed(31)
+        self.intervals = []
+        for i in range(500):
+            start = random.randint(0, 10000)
+            self.intervals.append((start, start + random.randint(0, 300), i))
+
+        self.tree = IntervalTree()
+        for start, end, value in self.intervals:
+            self.tree.insert_interval(start, end, value)
+        self.bulk = IntervalTree.from_intervals(self.intervals)
+
+    def expected(self, intervals, start, end):
+        return sorted((a, b, value) for a, b, value in intervals if a <= end and start <= b)
+
+    def check(self, r):
+        # verify the balance and max end point augmentation, returning (height, max end point)
+        if not r:
+            return 0, None
+        left, left_max = self.check(r._left)
+        right, right_max = self.check(r._right)
+        self.assertLessEqual(abs(left - right), 1, "tree unexpectedly not balanced")
+        self.assertEqual(r._max, max(m for m in (r._key[1], left_max, right_max) if m is not None),
+                         "unexpected max end point")
+        return 1 + max(left, right), r._max
+
+    def test_structure(self):
+        for tree, name in (self.tree, "tree"), (self.bulk, "bulk loaded tree"):
+            with self.subTest(name=name):
+                self.check(tree._root)
+                self.assertEqual(len(tree), len(self.intervals), "unexpected length")
+
+    def test_overlapping_point(self):
+        for point in [-5, 0, 150, 5000, 10150, 20000]:
+            for tree, name in (self.tree, "tree"), (self.bulk, "bulk loaded tree"):
+                with self.subTest(point=point, name=name):
+                    self.assertEqual(sorted(tree.overlapping(point)), self.expected(self.intervals, point, point),
+                                     "unexpected intervals overlapping {0}".format(point))
+
+    def test_overlapping_range(self):
+        for start, end in [(0, 10), (500, 1500), (9990, 10400), (-10, -1), (0, 20000)]:
+            for tree, name in (self.tree, "tree"), (self.bulk, "bulk loaded tree"):
+                with self.subTest(start=start, end=end, name=name):
+                    self.assertEqual(sorted(tree.overlapping(start, end)), self.expected(self.intervals, start, end),
+                                     "unexpected intervals overlapping [{0}, {1}]".format(start, end))
+
+        with self.assertRaises(ValueError):
+            list(self.tree.overlapping(5, 1))
+
+    def test_remove(self):
+        for start, end, value in self.intervals[:250]:
+            self.assertEqual(self.tree.remove_interval(start, end), value,
+                             "unexpected value removed for [{0}, {1}]".format(start, end))
+        self.assertIsNone(self.tree.remove_interval(-5, -1), "removing a missing interval returned a value")
+        self.check(self.tree._root)
+        self.assertEqual(sorted(self.tree.overlapping(0, 20000)), sorted(self.intervals[250:]),
+                         "unexpected intervals after remove")
+
+    def test_falsy_values(self):
+        tree = IntervalTree()
+        tree.insert_interval(1, 5)
+        tree.insert_interval(2, 6, 0)
+        for interval, value in ((1, 5), None), ((2, 6), 0):
+            with self.subTest(interval=interval):
+                self.assertIn(interval, tree, "interval with a falsy value not found")
+                self.assertEqual(tree[interval], value, "unexpected value")
+                del tree[interval]
+                self.assertNotIn(interval, tree, "deleted interval still present")
+                with self.assertRaises(KeyError):
+                    del tree[interval]
+        self.assertEqual(len(tree), 0, "unexpected length after deleting")
+        self.assertNotIn((7, 8), tree, "missing interval found")
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.tree.insert_interval(5, 1)
+        with self.assertRaises(ValueError):
+            IntervalTree.from_intervals([(5, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import threading
+import unittest
+
+from DataStructures import PersistentBinarySearchTree
+
+
+class PersistentBinarySearchTreeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tree = PersistentBinarySearchTree()
+
+        random.seed(27)
+        self.keys = random.sample(range(1, 5000), 1000)
+        for key in self.keys:
+            self.tree.insert(key, key * 10)
+
+    @staticmethod
+    def is_balanced(r):
+        if not r:
+            return True
+        left = r._left._height if r._left else 0
+        right = r._right._height if r._right else 0
+        return abs(left - right) <= 1 and PersistentBinarySearchTreeTestCase.is_balanced(r._left) \
+            and PersistentBinarySearchTreeTestCase.is_balanced(r._right)
+
+    def test_lookup(self):
+        for key in self.keys:
+            with self.subTest(key=key):
+                self.assertEqual(self.tree.lookup(key), key * 10, "unexpected value for key {0}".format(key))
+        self.assertIsNone(self.tree.lookup(-1), "missing key unexpectedly found")
+        with self.assertRaises(KeyError):
+            self.tree[-1]
+
+    def test_inorder(self):
+        self.assertEqual(list(self.tree.inorder()), [key * 10 for key in sorted(self.keys)],
+                         "inorder traversal not sorted")
+        self.assertEqual(len(list(self.tree.preorder())), len(self.keys), "preorder traversal missing values")
+        self.assertTrue(self.is_balanced(self.tree.snapshot()._root), "tree unexpectedly not balanced")
+
+    def test_remove(self):
+        for key in self.keys[:500]:
+            self.assertEqual(self.tree.remove(key), key * 10, "unexpected removed value for {0}".format(key))
+        self.assertIsNone(self.tree.remove(self.keys[0]), "removing a missing key returned a value")
+        self.assertEqual(list(self.tree.inorder()), [key * 10 for key in sorted(self.keys[500:])],
+                         "unexpected values after remove")
+        self.assertEqual(len(self.tree), 500, "unexpected length after remove")
+        self.assertTrue(self.is_balanced(self.tree.snapshot()._root), "tree unexpectedly not balanced after remove")
+
+    def test_snapshot(self):
+        snapshot = self.tree.snapshot()
+        for key in self.keys[:100]:
+            self.tree.remove(key)
+        self.tree.insert(-5, -50)
+
+        self.assertEqual(len(snapshot), 1000, "snapshot length changed after update")
+        self.assertEqual(list(snapshot.inorder()), [key * 10 for key in sorted(self.keys)],
+                         "snapshot contents changed after update")
+        self.assertNotIn(-5, snapshot, "update visible through old snapshot")
+        self.assertIn(-5, self.tree, "update not visible through tree")
+
+    def test_concurrent_readers(self):
+        errors = []
+
+        def read():
+            for _ in range(50):
+                snapshot = self.tree.inorder()
+                values = list(snapshot)
+                if len(values) != len(snapshot) or values != sorted(values):
+                    errors.append(values)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for key in range(5000, 6000):
+            self.tree.insert(key, key * 10)
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(errors, [], "reader saw a partial update")
+
+
+if __name__ == '__main__':
+    unittest.main()
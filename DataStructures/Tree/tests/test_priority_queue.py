@@ -3,4 +3,60 @@ from DataStructures import PriorityQueue
 
 
 class PriorityQueueTestCase(unittest.TestCase):
-    pass
+    def setUp(self):
+        self.priorities = {"a": 5, "b": 3, "c": 8, "d": 1, "e": 4, "f": 9, "g": 2}
+
+        self.minpq = PriorityQueue()
+        self.maxpq = PriorityQueue(max_heap=True)
+        for item, priority in self.priorities.items():
+            self.minpq.insert(item, priority)
+            self.maxpq.insert(item, priority)
+
+        self.listpq = PriorityQueue(from_list=[(priority, item) for item, priority in self.priorities.items()])
+        self.emptypq = PriorityQueue()
+
+    def drain(self, pq):
+        items = []
+        while pq:
+            items.append(pq.extract())
+        return items
+
+    def test_extract(self):
+        ordered = sorted(self.priorities, key=self.priorities.get)
+        self.assertEqual(self.drain(self.minpq), ordered, "min priority queue extracted out of order")
+        self.assertEqual(self.drain(self.maxpq), ordered[::-1], "max priority queue extracted out of order")
+        self.assertEqual(self.drain(self.listpq), ordered, "priority queue from list extracted out of order")
+
+        with self.assertRaises(IndexError):
+            self.emptypq.extract()
+
+    def test_peek(self):
+        self.assertEqual(self.minpq.peek(), "d", "unexpected min priority queue peek")
+        self.assertEqual(self.maxpq.peek(), "f", "unexpected max priority queue peek")
+        self.assertEqual(len(self.minpq), len(self.priorities), "peek changed the length")
+
+        with self.assertRaises(IndexError):
+            self.emptypq.peek()
+
+    def test_update_priority(self):
+        self.minpq.update_priority("f", 0)
+        self.minpq["d"] = 10
+        self.assertEqual(self.minpq["f"], 0, "priority not updated")
+        self.assertEqual(self.drain(self.minpq), ["f", "g", "b", "e", "a", "c", "d"],
+                         "extracted out of order after update")
+
+        with self.assertRaises(KeyError):
+            self.emptypq.update_priority("a", 1)
+
+    def test_remove(self):
+        self.minpq.remove("d")
+        del self.minpq["c"]
+        self.assertNotIn("d", self.minpq, "removed item still present")
+        self.assertEqual(self.drain(self.minpq), ["g", "b", "e", "a", "f"], "extracted out of order after remove")
+
+        with self.assertRaises(KeyError):
+            self.emptypq.remove("a")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from DataStructures import SkipList
+from DataStructures.Tree.tests.splittablemap import SplittableMapTests
+
+
+class SkipListTestCase(SplittableMapTests, unittest.TestCase):
+    map_class = SkipList
+
+    def check_widths(self, skiplist):
+        # every link's width is the distance between the positions of its ends, with a missing end one past the last
+        position = {id(skiplist._head): 0}
+        x = skiplist._head._forward[0]
+        while x is not None:
+            position[id(x)] = len(position)
+            x = x._forward[0]
+        self.assertEqual(len(position) - 1, len(skiplist), "unexpected number of nodes")
+
+        for level in range(skiplist._level):
+            x = skiplist._head
+            while x is not None:
+                after = x._forward[level]
+                end = len(position) if after is None else position[id(after)]
+                self.assertEqual(x._width[level], end - position[id(x)], "unexpected width at level {0}".format(level))
+                x = after
+
+    def test_widths(self):
+        self.check_widths(self.tree)
+        right = self.tree.split(2500)
+        self.check_widths(self.tree)
+        self.check_widths(right)
+        self.tree.join(right)
+        self.tree.remove_range(1000, 3000)
+        self.check_widths(self.tree)
+
+
+if __name__ == '__main__':
+    unittest.main()
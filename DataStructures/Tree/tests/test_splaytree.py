@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from DataStructures import BinarySearchTree, SplayTree
+
+
+class SplayTreeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tree = SplayTree()
+        self.reference = BinarySearchTree()
+
+        random.seed(28)
+        self.keys = random.sample(range(1, 5000), 1000)
+        for key in self.keys:
+            self.tree.insert(key, key * 10)
+            self.reference.insert(key, key * 10)
+
+    def test_lookup(self):
+        for key in self.keys:
+            with self.subTest(key=key):
+                self.assertEqual(self.tree.lookup(key), key * 10, "unexpected value for key {0}".format(key))
+                self.assertIs(self.tree._root._key, key, "looked up key {0} not splayed to root".format(key))
+        self.assertIsNone(self.tree.lookup(-1), "missing key unexpectedly found")
+        self.assertEqual(len(self.tree), len(self.keys), "unexpected length")
+
+    def test_traversals(self):
+        # splaying changes the shape of the tree, but never the order of its keys
+        for key in self.keys[:100]:
+            self.tree.lookup(key)
+        self.assertEqual(list(self.tree.inorder()), list(self.reference.inorder()), "inorder traversal differs")
+        self.assertCountEqual(list(self.tree.preorder()), list(self.reference.preorder()),
+                              "preorder traversal missing values")
+        self.assertCountEqual(list(self.tree.postorder()), list(self.reference.postorder()),
+                              "postorder traversal missing values")
+
+    def test_remove(self):
+        for key in self.keys[:500]:
+            self.assertEqual(self.tree.remove(key), key * 10, "unexpected removed value for {0}".format(key))
+        self.assertIsNone(self.tree.remove(self.keys[0]), "removing a missing key returned a value")
+        self.assertEqual(list(self.tree.inorder()), [key * 10 for key in sorted(self.keys[500:])],
+                         "unexpected values after remove")
+        self.assertEqual(len(self.tree), 500, "unexpected length after remove")
+        with self.assertRaises(KeyError):
+            del self.tree[self.keys[0]]
+
+    def test_duplicates(self):
+        tree = SplayTree()
+        for key in 5, 3, 5, 5, 7, 5:
+            tree.insert(key, key)
+        tree.lookup(3)
+        self.assertEqual(tree.remove(5), 5, "unexpected removed value")
+        self.assertEqual(list(tree.inorder()), [3, 5, 5, 5, 7], "duplicates lost on remove")
+        self.assertEqual(len(tree), 5, "unexpected length after remove")
+
+        rng = random.Random(28)
+        for trial in range(300):
+            tree, model = SplayTree(), []
+            for _ in range(40):
+                key = rng.randrange(8)
+                if rng.random() < 0.6:
+                    tree.insert(key, key)
+                    model.append(key)
+                elif rng.random() < 0.5:
+                    tree.lookup(key)
+                else:
+                    tree.remove(key)
+                    if key in model:
+                        model.remove(key)
+            with self.subTest(trial=trial):
+                self.assertEqual(list(tree.inorder()), sorted(model), "tree differs from a list")
+                self.assertEqual(len(tree), len(model), "unexpected length")
+
+    def test_sequential(self):
+        # sequential inserts build a path, which must not overflow the stack
+        tree = SplayTree()
+        for key in range(1, 20001):
+            tree[key] = key
+        self.assertEqual(list(tree.inorder()), list(range(1, 20001)), "unexpected values after sequential insert")
+        self.assertEqual(tree[1], 1, "unexpected value for deepest key")
+
+
+if __name__ == '__main__':
+    unittest.main()
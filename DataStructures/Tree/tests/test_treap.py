@@ -0,0 +1,32 @@
+import unittest
+
+from DataStructures import Treap
+from DataStructures.Tree.tests.splittablemap import SplittableMapTests
+
+
+class TreapTestCase(SplittableMapTests, unittest.TestCase):
+    map_class = Treap
+
+    def check_heap(self, r):
+        # every node's priority is at least its children's, and its size counts its subtree
+        if not r:
+            return 0
+        for child in r._left, r._right:
+            if child:
+                self.assertGreaterEqual(r._priority, child._priority, "heap order violated")
+        size = 1 + self.check_heap(r._left) + self.check_heap(r._right)
+        self.assertEqual(r._size, size, "unexpected subtree size")
+        return size
+
+    def test_heap_order(self):
+        self.check_heap(self.tree._root)
+        right = self.tree.split(2500)
+        self.check_heap(self.tree._root)
+        self.check_heap(right._root)
+        self.tree.join(right)
+        self.tree.remove_range(1000, 3000)
+        self.check_heap(self.tree._root)
+
+
+if __name__ == '__main__':
+    unittest.main()
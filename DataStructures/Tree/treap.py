@@ -0,0 +1,160 @@
+from random import random
+
+from DataStructures.Tree.binarysearchtree import BinarySearchTree
+
+
+class Treap(BinarySearchTree):
+    """
+    Randomized balanced binary search tree, with the BinarySearchTree API plus `split`, `join` and `remove_range`.
+
+    Every node gets a random priority, and the tree is kept heap-ordered by priority, which keeps its expected depth
+    at O(log n).  Every node also stores the size of its subtree, so the pieces produced by `split` know their
+    lengths without a traversal.
+    """
+
+    class node(BinarySearchTree.node):
+
+        def __init__(self, key, value):
+            super().__init__(key, value)
+            self._priority = random()
+            self._size = 1
+
+    @staticmethod
+    def _size(r):
+        return r._size if r else 0
+
+    @staticmethod
+    def _update(r):
+        r._size = 1 + Treap._size(r._left) + Treap._size(r._right)
+        return r
+
+    @staticmethod
+    def _rotate_right(r):
+        child = r._left
+        r._left = child._right
+        child._right = Treap._update(r)
+        return Treap._update(child)
+
+    @staticmethod
+    def _rotate_left(r):
+        child = r._right
+        r._right = child._left
+        child._left = Treap._update(r)
+        return Treap._update(child)
+
+    @staticmethod
+    def _split(r, k):
+        # split `r` into (keys < k, keys >= k)
+        if not r:
+            return None, None
+        if r._key < k:
+            r._right, right = Treap._split(r._right, k)
+            return Treap._update(r), right
+        left, r._left = Treap._split(r._left, k)
+        return left, Treap._update(r)
+
+    @staticmethod
+    def _merge(a, b):
+        # merge `a` and `b`, where every key in `a` is <= every key in `b`
+        if not a:
+            return b
+        if not b:
+            return a
+        if a._priority > b._priority:
+            a._right = Treap._merge(a._right, b)
+            return Treap._update(a)
+        b._left = Treap._merge(a, b._left)
+        return Treap._update(b)
+
+    def _insert(self, r, k, v):
+        # found where new value goes, so insert it
+        if not r:
+            return Treap.node(k, v)
+        if k < r._key:
+            r._left = self._insert(r._left, k, v)
+            if r._left._priority > r._priority:
+                return self._rotate_right(r)
+        else:  # k >= r._key
+            r._right = self._insert(r._right, k, v)
+            if r._right._priority > r._priority:
+                return self._rotate_left(r)
+        return self._update(r)
+
+    def _remove(self, r, k):
+        if not r:
+            return None
+        # found it
+        if k == r._key:
+            self._removed = r._value
+            self._count -= 1
+            return self._merge(r._left, r._right)
+        if k < r._key:
+            r._left = self._remove(r._left, k)
+        else:
+            r._right = self._remove(r._right, k)
+        return self._update(r)
+
+    def _minimum(self, r):
+        while r._left:
+            r = r._left
+        return r
+
+    def _maximum(self, r):
+        while r._right:
+            r = r._right
+        return r
+
+    def split(self, key):
+        """
+        Move every entry with key >= `key` into a new Treap.  This tree keeps the entries with key < `key`.
+        Expected runtime O(log n)
+
+        Returns
+        -------
+        Treap
+            A new tree containing the entries with key >= `key`.
+        """
+        other = type(self)()
+        self._root, other._root = self._split(self._root, key)
+        self._count = self._size(self._root)
+        other._count = self._size(other._root)
+        return other
+
+    def join(self, other):
+        """
+        Move every entry of `other` into this tree, leaving `other` empty.  Every key in `other` must be >= every key
+        in this tree.
+        Expected runtime O(log n)
+
+        Raises
+        ------
+        ValueError
+            If the key ranges of the two trees overlap.
+        """
+        if self._root and other._root and other._minimum(other._root)._key < self._maximum(self._root)._key:
+            raise ValueError("Cannot join trees with overlapping key ranges")
+
+        self._root = self._merge(self._root, other._root)
+        self._count = self._size(self._root)
+        other.make_empty()
+
+    def remove_range(self, lo, hi):
+        """
+        Remove every entry with `lo` <= key < `hi`.
+        Expected runtime O(log n)
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        left, rest = self._split(self._root, lo)
+        middle, right = self._split(rest, hi)
+        self._root = self._merge(left, right)
+        self._count = self._size(self._root)
+        return self._size(middle)
+
+    def __iter__(self):
+        if not self._root:
+            return iter(())
+        return self._traverse(self._root)
@@ -0,0 +1 @@
+from DataStructures.UnionFind.unionfind import UnionFind
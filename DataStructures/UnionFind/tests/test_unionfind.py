@@ -0,0 +1,42 @@
+import unittest
+
+from DataStructures import UnionFind
+
+
+class UnionFindTestCase(unittest.TestCase):
+    def setUp(self):
+        self.uf = UnionFind(range(10))
+        for item1, item2 in (0, 1), (1, 2), (3, 4), (5, 6), (6, 7), (7, 5):
+            self.uf.union(item1, item2)
+
+    def test_count(self):
+        self.assertEqual(len(self.uf), 10, "unexpected number of items")
+        self.assertEqual(self.uf.count, 5, "unexpected number of sets")
+        self.uf.union(2, 3)
+        self.assertEqual(self.uf.count, 4, "union did not merge two sets")
+        self.uf.union("a", "b")
+        self.assertEqual(len(self.uf), 12, "union did not add missing items")
+        self.assertEqual(self.uf.count, 5, "unexpected number of sets")
+
+    def test_find(self):
+        self.assertTrue(self.uf.connected(0, 2), "items in the same set found disconnected")
+        self.assertFalse(self.uf.connected(2, 3), "items in different sets found connected")
+        self.assertEqual(self.uf.find(8), 8, "singleton is not its own representative")
+        self.assertEqual(self.uf.size(7), 3, "unexpected set size")
+        with self.assertRaises(KeyError):
+            self.uf.find(10)
+
+    def test_groups(self):
+        self.assertEqual(self.uf.groups(), [[0, 1, 2], [3, 4], [5, 6, 7], [8], [9]], "unexpected groups")
+
+    def test_deep(self):
+        # a long chain of unions stays shallow
+        uf = UnionFind()
+        for item in range(100000):
+            uf.union(item, item + 1)
+        self.assertEqual(uf.size(0), 100001, "unexpected set size")
+        self.assertTrue(uf.connected(0, 100000), "chain not connected")
+
+
+if __name__ == "__main__":
+    unittest.main()
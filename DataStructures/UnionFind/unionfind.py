@@ -0,0 +1,107 @@
+class UnionFind(object):
+    """
+    Disjoint set forest, with path compression and union by size.
+
+    Items are added on first use, so `union(a, b)` works without adding a and b first.  Any sequence of m operations
+    on n items takes O(m α(n)) time, where α is the inverse Ackermann function, which is at most 4 in practice.
+    """
+
+    def __init__(self, items=None):
+        # every item maps to its parent, and roots map to themselves.  only roots have an entry in _size.
+        self._parent = {}
+        self._size = {}
+        self._count = 0
+
+        if items is not None:
+            for item in items:
+                self.add(item)
+
+    def __contains__(self, item):
+        return item in self._parent
+
+    def __iter__(self):
+        return iter(self._parent)
+
+    def __len__(self):
+        return len(self._parent)
+
+    def __repr__(self):
+        return "UnionFind({0})".format(self.groups())
+
+    @property
+    def count(self):
+        # number of disjoint sets
+        return self._count
+
+    def add(self, item):
+        # add `item` as a set of its own, if not already present
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
+            self._count += 1
+
+    # amortized runtime O(α(n))
+    def find(self, item):
+        """
+        Find the representative of the set containing `item`.
+
+        Raises
+        ------
+        KeyError
+            If `item` is not present.
+        """
+        parent = self._parent
+        if item not in parent:
+            raise KeyError("Item {0} not present in UnionFind".format(repr(item)))
+
+        # path halving: point every other node on the way up at its grandparent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    # amortized runtime O(α(n))
+    def union(self, item1, item2):
+        """
+        Merge the sets containing `item1` and `item2`, adding either of them if needed.
+
+        Returns
+        -------
+        object
+            The representative of the merged set.
+        """
+        self.add(item1)
+        self.add(item2)
+        root1, root2 = self.find(item1), self.find(item2)
+        if root1 == root2:
+            return root1
+
+        # the smaller tree goes under the larger, so no tree is deeper than log n
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size.pop(root2)
+        self._count -= 1
+        return root1
+
+    def connected(self, item1, item2):
+        return self.find(item1) == self.find(item2)
+
+    def size(self, item):
+        # number of items in the set containing `item`
+        return self._size[self.find(item)]
+
+    def groups(self):
+        """
+        Every set, in the order their first items were added.
+        Runtime O(n α(n))
+
+        Returns
+        -------
+        list
+            A list of the items of every set.
+        """
+        groups = {}
+        for item in self._parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return list(groups.values())
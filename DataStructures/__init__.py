@@ -1,4 +1,6 @@
-from DataStructures.Tree import BinarySearchTree, Heap, PriorityQueue
-from DataStructures.Graph import Graph
+from DataStructures.Tree import ArrayBinarySearchTree, BinarySearchTree, BPlusTree, Heap, IntervalTree, \
+    PriorityQueue, PersistentBinarySearchTree, SkipList, SplayTree, Treap
+from DataStructures.Graph import Graph, DiGraph, FrozenGraph, GraphView, ImplicitGraph
 from DataStructures.Stack import Stack
 from DataStructures.Queue import Queue, DoubleEndedQueue
+from DataStructures.UnionFind import UnionFind
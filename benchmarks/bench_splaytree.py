@@ -0,0 +1,60 @@
+"""
+Compare lookup times for SplayTree, BinarySearchTree (unbalanced) and PersistentBinarySearchTree (AVL balanced)
+under Zipf-distributed lookups.
+
+Run from the repository root with ``python benchmarks/bench_splaytree.py``.
+"""
+import random
+import sys
+import time
+from itertools import accumulate
+
+sys.path.insert(0, ".")
+
+from DataStructures import BinarySearchTree, PersistentBinarySearchTree, SplayTree  # noqa: E402
+
+SIZE = 20000
+LOOKUPS = 200000
+EXPONENTS = [0.0, 0.8, 1.0, 1.2, 1.5]
+
+
+def zipf_keys(keys, exponent, count):
+    # the i-th most popular key is looked up with probability proportional to 1 / i ** exponent
+    weights = list(accumulate(1 / (rank ** exponent) for rank in range(1, len(keys) + 1)))
+    return random.choices(keys, cum_weights=weights, k=count)
+
+
+def timed_lookups(tree, lookups):
+    lookup = tree.lookup
+    start = time.perf_counter()
+    for key in lookups:
+        lookup(key)
+    return time.perf_counter() - start
+
+
+def main():
+    random.seed(28)
+    keys = list(range(SIZE))
+    random.shuffle(keys)
+
+    trees = {"BinarySearchTree": BinarySearchTree(),
+             "PersistentBinarySearchTree": PersistentBinarySearchTree(),
+             "SplayTree": SplayTree()}
+    for tree in trees.values():
+        for key in keys:
+            tree.insert(key, key)
+
+    # popularity is independent of insertion order
+    popularity = list(keys)
+    random.shuffle(popularity)
+
+    print("{0} keys, {1} lookups per run".format(SIZE, LOOKUPS))
+    print("{0:>8}  {1}".format("exponent", "  ".join("{0:>26}".format(name) for name in trees)))
+    for exponent in EXPONENTS:
+        lookups = zipf_keys(popularity, exponent, LOOKUPS)
+        times = [timed_lookups(tree, lookups) for tree in trees.values()]
+        print("{0:>8}  {1}".format(exponent, "  ".join("{0:>25.3f}s".format(t) for t in times)))
+
+
+if __name__ == "__main__":
+    main()